@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from .models import User, Branch
+from core.pagination import EstimatedCountPaginator
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
@@ -12,6 +13,10 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ['username', 'email', 'branch__name']
     ordering = ['-created_date']
     list_per_page = 10  # Pagination set to 10
+    list_select_related = ['branch']
+    autocomplete_fields = ['branch']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     fieldsets = (
         (None, {'fields': ('username', 'password')}),
@@ -60,6 +65,10 @@ class BranchAdmin(admin.ModelAdmin):
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
     list_per_page = 10  # Pagination set to 10
+    list_select_related = ['created_by']
+    autocomplete_fields = ['created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -0,0 +1,151 @@
+import hashlib
+import math
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over bytes keys"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(int(capacity), 1)
+        self.capacity = capacity
+        self.num_bits = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key):
+        if key in self:
+            return
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+
+
+class RevocationFilter:
+    """In-process "is this refresh token revoked?" check
+
+    Revoked JTIs live in the revoked_tokens table. Each process keeps a Bloom
+    filter of them that is topped up incrementally from the table at most
+    every SYNC_INTERVAL seconds, so a token that was never revoked is
+    answered from memory. Filter hits are confirmed with an indexed lookup.
+    The filter is rebuilt from the unexpired rows every REBUILD_INTERVAL
+    seconds or when it outgrows its capacity, which drops purged entries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = None
+        self._built_at = 0
+        self._synced_at = 0
+        self._sync_from = None
+
+    @property
+    def options(self):
+        options = {
+            'FILTER_CAPACITY': 100000,
+            'FILTER_ERROR_RATE': 0.001,
+            'SYNC_INTERVAL': 5,
+            'REBUILD_INTERVAL': 3600,
+        }
+        options.update(getattr(settings, 'TOKEN_BLACKLIST', {}))
+        return options
+
+    def is_revoked(self, jti):
+        from .models import RevokedToken
+
+        key = self._normalize(jti)
+        if key is None:
+            return False
+
+        self._sync()
+        if key.bytes not in self._filter:
+            return False
+        return RevokedToken.objects.filter(jti=key).exists()
+
+    def revoke(self, jti, expires_at):
+        from .models import RevokedToken
+
+        key = self._normalize(jti)
+        if key is None:
+            raise ValueError(f'Invalid token id: {jti!r}')
+
+        try:
+            token, _ = RevokedToken.objects.get_or_create(
+                jti=key, defaults={'expires_at': expires_at}
+            )
+        except IntegrityError:
+            # Revoked concurrently by another request
+            token = RevokedToken.objects.get(jti=key)
+
+        self._sync()
+        with self._lock:
+            self._filter.add(key.bytes)
+        return token
+
+    def _normalize(self, jti):
+        try:
+            return uuid.UUID(str(jti))
+        except ValueError:
+            return None
+
+    def _sync(self):
+        options = self.options
+        now = time.monotonic()
+        if self._filter is not None and now - self._synced_at < options['SYNC_INTERVAL']:
+            return
+
+        with self._lock:
+            if self._filter is not None and now - self._synced_at < options['SYNC_INTERVAL']:
+                return
+
+            if (self._filter is None
+                    or self._filter.count > self._filter.capacity
+                    or now - self._built_at >= options['REBUILD_INTERVAL']):
+                self._rebuild(options)
+            else:
+                self._load(self._filter, self._sync_from)
+            self._synced_at = now
+
+    def _rebuild(self, options):
+        from .models import RevokedToken
+
+        live = RevokedToken.objects.filter(expires_at__gt=timezone.now()).count()
+        capacity = max(options['FILTER_CAPACITY'], live * 2)
+        bloom = BloomFilter(capacity, options['FILTER_ERROR_RATE'])
+        self._load(bloom, None)
+        self._filter = bloom
+        self._built_at = time.monotonic()
+
+    def _load(self, bloom, since):
+        from .models import RevokedToken
+
+        # Rows can commit slightly out of created_date order, so every sync
+        # re-reads an overlap window; adding a key twice is harmless.
+        started = timezone.now()
+        rows = RevokedToken.objects.filter(expires_at__gt=started)
+        if since is not None:
+            rows = rows.filter(created_date__gte=since)
+        for jti in rows.values_list('jti', flat=True).iterator(chunk_size=5000):
+            bloom.add(jti.bytes)
+        self._sync_from = started - timedelta(seconds=max(self.options['SYNC_INTERVAL'], 1) * 2)
+
+
+revocation_filter = RevocationFilter()
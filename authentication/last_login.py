@@ -0,0 +1,103 @@
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, When, Value, DateTimeField
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """Write-behind buffer for User.last_login updates
+
+    Logins only record the timestamp in memory. A background thread flushes
+    pending timestamps as a single UPDATE ... CASE statement every
+    FLUSH_INTERVAL seconds, as soon as MAX_PENDING users are waiting, and
+    once more at interpreter shutdown.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @property
+    def options(self):
+        options = {'ENABLED': True, 'FLUSH_INTERVAL': 30, 'MAX_PENDING': 500}
+        options.update(getattr(settings, 'LAST_LOGIN_BUFFER', {}))
+        return options
+
+    def record(self, user, when=None):
+        """Record a login for user without touching the database"""
+        when = when or timezone.now()
+        user.last_login = when
+
+        if not self.options['ENABLED']:
+            user.save(update_fields=['last_login'])
+            return
+
+        with self._lock:
+            previous = self._pending.get(user.pk)
+            if previous is None or previous < when:
+                self._pending[user.pk] = when
+            pending_count = len(self._pending)
+
+        self._ensure_started()
+        if pending_count >= self.options['MAX_PENDING']:
+            self._wakeup.set()
+
+    def flush(self):
+        """Write all pending timestamps in one statement, returns rows written"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        # Imported lazily, this module is loaded before the app registry is ready
+        from .models import User
+
+        try:
+            return User.all_objects.filter(pk__in=pending.keys()).update(
+                last_login=Case(
+                    *[When(pk=pk, then=Value(when)) for pk, when in pending.items()],
+                    output_field=DateTimeField(),
+                )
+            )
+        except Exception:
+            # Put the timestamps back unless a newer login replaced them meanwhile
+            with self._lock:
+                for pk, when in pending.items():
+                    if pk not in self._pending or self._pending[pk] < when:
+                        self._pending[pk] = when
+            raise
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='last-login-flusher', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.options['FLUSH_INTERVAL'])
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Keep the flusher alive, the rows are retried on the next tick
+                logger.exception('Failed to flush buffered last_login updates')
+            finally:
+                connection.close()
+
+
+last_login_buffer = LastLoginBuffer()
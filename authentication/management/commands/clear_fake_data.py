@@ -3,7 +3,10 @@ from django.db import transaction
 
 from authentication.models import User, Branch
 from core.models import Vendor, Warehouse, Customer, Seller
-from inventory.models import GoldProduct, SilverProduct, GoldWarehouseStock, SilverWarehouseStock
+from inventory.models import (
+    GoldProduct, SilverProduct, GoldWarehouseStock, SilverWarehouseStock,
+    GoldStockMovement, SilverStockMovement
+)
 from invoicing.models import GoldInvoice, GoldInvoiceItem, SilverInvoice, SilverInvoiceItem
 from transactions.models import WarehouseTransaction
 
@@ -15,6 +18,8 @@ class Command(BaseCommand):
             self.stdout.write('Clearing fake data...')
             
             # Clear in reverse dependency order
+            GoldStockMovement.objects.all().delete()
+            SilverStockMovement.objects.all().delete()
             WarehouseTransaction.objects.all().delete()
             GoldInvoiceItem.objects.all().delete()
             SilverInvoiceItem.objects.all().delete()
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jti', models.UUIDField(unique=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('created_date', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'db_table': 'revoked_tokens',
+            },
+        ),
+    ]
@@ -69,4 +69,17 @@ class User(AbstractBaseUser, PermissionsMixin, SoftDeleteModel):
     
     def __str__(self):
         keeper_suffix = " (Warehouse Keeper)" if self.is_warehouse_keeper else ""
-        return f"{self.username} ({self.role}){keeper_suffix}"
\ No newline at end of file
+        return f"{self.username} ({self.role}){keeper_suffix}"
+
+class RevokedToken(models.Model):
+    """Revoked refresh token - only the JTI and its expiry are kept"""
+    
+    jti = models.UUIDField(unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    created_date = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    class Meta:
+        db_table = 'revoked_tokens'
+    
+    def __str__(self):
+        return f"{self.jti.hex} (expires {self.expires_at})"
@@ -1,12 +1,15 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from django.contrib.auth import authenticate
 from .models import User
+from .last_login import last_login_buffer
+from .tokens import RevocableRefreshToken
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Custom JWT token serializer with user role and branch info"""
     
+    token_class = RevocableRefreshToken
+    
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
@@ -24,6 +27,9 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
         
+        # UPDATE_LAST_LOGIN is disabled in settings, record through the buffer instead
+        last_login_buffer.record(self.user)
+        
         # Add user info to response
         data['user'] = {
             'id': self.user.id,
@@ -92,6 +98,11 @@ class LogoutSerializer(serializers.Serializer):
     
     def save(self, **kwargs):
         try:
-            RefreshToken(self.token).blacklist()
+            RevocableRefreshToken(self.token).blacklist()
         except Exception as e:
-            raise serializers.ValidationError('Invalid token')
\ No newline at end of file
+            raise serializers.ValidationError('Invalid token')
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh serializer that honours the revoked_tokens blacklist"""
+    
+    token_class = RevocableRefreshToken
@@ -0,0 +1,24 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .blacklist import revocation_filter
+
+
+class RevocableRefreshToken(RefreshToken):
+    """Refresh token checked against the revoked_tokens blacklist"""
+    
+    def verify(self, *args, **kwargs):
+        super().verify(*args, **kwargs)
+        
+        if revocation_filter.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+    
+    def blacklist(self):
+        """Revoke this token until it expires"""
+        return revocation_filter.revoke(
+            self.payload[api_settings.JTI_CLAIM],
+            datetime_from_epoch(self.payload['exp'])
+        )
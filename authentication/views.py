@@ -2,11 +2,11 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import login
 from .serializers import LoginSerializer, LogoutSerializer, CustomTokenObtainPairSerializer, UserSerializer
 from .models import User
-from django.utils import timezone
+from .last_login import last_login_buffer
+from .tokens import RevocableRefreshToken
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -17,12 +17,11 @@ def login_view(request):
     if serializer.is_valid():
         user = serializer.validated_data['user']
         
-        # Update last login
-        user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
+        # Update last login (buffered, flushed in the background)
+        last_login_buffer.record(user)
         
         # Generate tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = RevocableRefreshToken.for_user(user)
         
         # Add custom claims
         refresh['role'] = user.role
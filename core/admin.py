@@ -1,6 +1,34 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.http import HttpResponseRedirect
 from django.utils.html import format_html
+from .concurrency import StaleObjectError
 from .models import Vendor, Warehouse, Customer, Seller
+from .pagination import EstimatedCountPaginator
+
+class VersionedModelAdmin(admin.ModelAdmin):
+    """Admin for VersionedModel rows
+    
+    The version the form was rendered with is posted back in a hidden field,
+    so saving over someone else's change is refused instead of overwriting it.
+    """
+    
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        if db_field.name == 'version':
+            kwargs['widget'] = forms.HiddenInput()
+        return super().formfield_for_dbfield(db_field, request, **kwargs)
+    
+    def changeform_view(self, request, object_id=None, form_url='', extra_context=None):
+        try:
+            return super().changeform_view(request, object_id, form_url, extra_context)
+        except StaleObjectError:
+            self.message_user(
+                request,
+                f'This {self.opts.verbose_name} was changed by someone else while you were editing it. '
+                'Your changes were not saved; review the current values and try again.',
+                messages.ERROR,
+            )
+            return HttpResponseRedirect(request.get_full_path())
 
 @admin.register(Vendor)
 class VendorAdmin(admin.ModelAdmin):
@@ -11,6 +39,10 @@ class VendorAdmin(admin.ModelAdmin):
     search_fields = ['name', 'created_by__username']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['created_by']
+    autocomplete_fields = ['created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -23,7 +55,7 @@ class VendorAdmin(admin.ModelAdmin):
         return Vendor.all_objects.get_queryset()
 
 @admin.register(Warehouse)
-class WarehouseAdmin(admin.ModelAdmin):
+class WarehouseAdmin(VersionedModelAdmin):
     """Warehouse admin"""
     
     list_display = ['code', 'branch', 'cash', 'created_by', 'status', 'created_date']
@@ -31,6 +63,10 @@ class WarehouseAdmin(admin.ModelAdmin):
     search_fields = ['code', 'branch__name']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['branch', 'created_by']
+    autocomplete_fields = ['branch', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -51,6 +87,10 @@ class CustomerAdmin(admin.ModelAdmin):
     search_fields = ['name', 'phone']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['created_by']
+    autocomplete_fields = ['created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -71,6 +111,10 @@ class SellerAdmin(admin.ModelAdmin):
     search_fields = ['name', 'branch__name']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['branch', 'created_by']
+    autocomplete_fields = ['branch', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -0,0 +1,65 @@
+import threading
+
+from django.db import transaction
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one computation
+
+    The first caller for a key runs the function, callers arriving while it
+    is in flight wait for it and get the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class StaleObjectError(Exception):
+    """A versioned row changed since it was read (see core.managers.VersionedModel)"""
+
+
+def retry_on_conflict(fn, attempts=5):
+    """Call fn() until it saves without a version conflict
+
+    fn must re-read the rows it changes on every call. Each attempt runs in
+    its own transaction; the StaleObjectError of the last one is re-raised.
+    """
+    for attempt in range(attempts):
+        try:
+            with transaction.atomic():
+                return fn()
+        except StaleObjectError:
+            if attempt == attempts - 1:
+                raise
@@ -0,0 +1,109 @@
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.serializers import ModelSerializer
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+# Field types whose output only depends on the column value
+_SIMPLE_FIELDS = (
+    serializers.BooleanField, serializers.CharField, serializers.ChoiceField,
+    serializers.DateField, serializers.DateTimeField, serializers.DecimalField,
+    serializers.FloatField, serializers.IntegerField, serializers.JSONField,
+    serializers.ModelField, serializers.TimeField, serializers.UUIDField,
+)
+
+
+class ValuesPlan:
+    """Row-to-dict plan compiled once from a ModelSerializer class
+
+    Every readable field is mapped to a values() column: model fields to
+    their column, dotted sources such as 'branch.name' to the joined
+    'branch__name' and primary key relations to the raw foreign key id.
+    Values are converted with the serializer field's own to_representation,
+    so the output equals serializer_class(instances, many=True).data.
+    columns maps a field name to another values() column (an annotation),
+    for fields the serializer computes itself.
+    """
+
+    def __init__(self, serializer_class, columns=None):
+        columns = columns or {}
+        serializer = serializer_class()
+        model = serializer.Meta.model
+        if (serializer_class.to_representation is not ModelSerializer.to_representation
+                and not columns):
+            raise ImproperlyConfigured(
+                f'{serializer_class.__name__} overrides to_representation, pass the '
+                'columns that replace its computed fields'
+            )
+
+        self.columns = []
+        self.steps = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if name in columns:
+                column, convert, skip_none = columns[name], field.to_representation, False
+            elif isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None:
+                column, convert, skip_none = field.source, None, False
+            elif isinstance(field, _SIMPLE_FIELDS) and field.source != '*':
+                column = '__'.join(field.source_attrs)
+                convert = field.to_representation
+                skip_none = self._through_nullable_relation(model, field.source_attrs)
+            else:
+                raise ImproperlyConfigured(
+                    f'{serializer_class.__name__}.{name} ({type(field).__name__}) '
+                    'has no values() equivalent'
+                )
+
+            self.columns.append(column)
+            self.steps.append((name, column, convert, skip_none))
+
+    @staticmethod
+    def _through_nullable_relation(model, attrs):
+        # A read-only 'relation.field' source behind a NULL relation is left
+        # out of the output by DRF (SkipField), not rendered as null
+        for attr in attrs[:-1]:
+            field = model._meta.get_field(attr)
+            if field.null:
+                return True
+            model = field.related_model
+        return False
+
+    def serialize(self, queryset):
+        """List of output dicts for the rows of queryset"""
+        steps = self.steps
+        results = []
+        for row in queryset.values(*self.columns):
+            data = {}
+            for name, column, convert, skip_none in steps:
+                value = row[column]
+                if value is None:
+                    if skip_none:
+                        continue
+                    data[name] = None
+                else:
+                    data[name] = convert(value) if convert is not None else value
+            results.append(data)
+        return results
+
+
+def values_plan(serializer_class, columns=None):
+    """The cached ValuesPlan of serializer_class"""
+    key = (serializer_class, tuple(sorted((columns or {}).items())))
+    plan = _plans.get(key)
+    if plan is None:
+        with _plans_lock:
+            plan = _plans.get(key)
+            if plan is None:
+                plan = _plans[key] = ValuesPlan(serializer_class, columns)
+    return plan
+
+
+def serialize_values(queryset, serializer_class, columns=None):
+    """Read-only list output of serializer_class computed from a values() query"""
+    return values_plan(serializer_class, columns).serialize(queryset)
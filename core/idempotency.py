@@ -0,0 +1,115 @@
+import hashlib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .models import IdempotencyKey
+
+MUTATING_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+# Response headers kept with the stored body and replayed
+STORED_HEADERS = ['Content-Type', 'Location', 'Allow']
+
+_jwt = JWTAuthentication()
+
+
+def idempotency_options():
+    options = {'TTL': 86400, 'WAIT_TIMEOUT': 10, 'LOCK_TIMEOUT': 60, 'POLL_INTERVAL': 0.05}
+    options.update(getattr(settings, 'IDEMPOTENCY', {}))
+    return options
+
+
+def request_user_id(request):
+    """Id of the user whose bearer token signs the request, None without a valid one
+
+    Only the token signature and expiry are checked, the view still
+    authenticates the request as usual.
+    """
+    try:
+        header = _jwt.get_header(request)
+        raw_token = _jwt.get_raw_token(header) if header is not None else None
+        if raw_token is None:
+            return None
+        return _jwt.get_validated_token(raw_token).get(jwt_settings.USER_ID_CLAIM)
+    except (AuthenticationFailed, TokenError):
+        return None
+
+
+def request_fingerprint(request):
+    digest = hashlib.sha256()
+    for part in (request.method.encode(), request.get_full_path().encode(), request.body):
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def claim(user_id, key, fingerprint):
+    """(True, new pending row) for an unused key, else (False, the row holding it)
+
+    Expired keys, and claims whose request has been running for more than
+    LOCK_TIMEOUT seconds (its process most likely died), are free again.
+    """
+    options = idempotency_options()
+    while True:
+        now = timezone.now()
+        abandoned = Q(response_status__isnull=True, created_date__lt=now - timedelta(seconds=options['LOCK_TIMEOUT']))
+        IdempotencyKey.objects.filter(Q(expires_at__lte=now) | abandoned, user_id=user_id, key=key).delete()
+        try:
+            with transaction.atomic():
+                return True, IdempotencyKey.objects.create(
+                    user_id=user_id, key=key, fingerprint=fingerprint,
+                    expires_at=now + timedelta(seconds=options['TTL']),
+                )
+        except IntegrityError:
+            row = IdempotencyKey.objects.filter(user_id=user_id, key=key).first()
+            if row is not None:
+                return False, row
+            # Released in between, claim it again
+
+
+def wait_for(row):
+    """The row once its first request has finished, None if that request released it
+
+    Gives up after WAIT_TIMEOUT seconds and returns the still pending row.
+    """
+    options = idempotency_options()
+    deadline = time.monotonic() + options['WAIT_TIMEOUT']
+    delay = options['POLL_INTERVAL']
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        row = IdempotencyKey.objects.filter(pk=row.pk).first()
+        if row is None or row.response_status is not None:
+            return row
+        delay = min(delay * 2, 1)
+    return row
+
+
+def store(row, response):
+    """Keep the response of the request that claimed row"""
+    IdempotencyKey.objects.filter(pk=row.pk).update(
+        response_status=response.status_code,
+        response_headers={name: response[name] for name in STORED_HEADERS if response.has_header(name)},
+        response_body=response.content,
+    )
+
+
+def release(row):
+    """Free the key so a retry runs the view again, e.g. after a server error"""
+    IdempotencyKey.objects.filter(pk=row.pk).delete()
+
+
+def replay(row):
+    response = HttpResponse(bytes(row.response_body), status=row.response_status)
+    for name, value in row.response_headers.items():
+        response[name] = value
+    response['Idempotent-Replayed'] = 'true'
+    return response
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Customer, normalize_phone
+
+class Command(BaseCommand):
+    help = 'Populate Customer.phone_normalized for existing rows in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of customers updated per transaction'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        last_pk = 0
+        updated = 0
+        
+        while True:
+            # Include soft-deleted customers so a restore finds them too
+            customers = list(
+                Customer.all_objects.filter(pk__gt=last_pk)
+                .order_by('pk')
+                .only('pk', 'phone', 'phone_normalized')[:chunk_size]
+            )
+            if not customers:
+                break
+            last_pk = customers[-1].pk
+            
+            changed = []
+            for customer in customers:
+                normalized = normalize_phone(customer.phone)[:32]
+                if customer.phone_normalized != normalized:
+                    customer.phone_normalized = normalized
+                    changed.append(customer)
+            
+            if changed:
+                with transaction.atomic():
+                    Customer.all_objects.bulk_update(changed, ['phone_normalized'])
+                updated += len(changed)
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Normalized phone numbers for {updated} customers')
+        )
@@ -0,0 +1,101 @@
+import timeit
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from authentication.models import Branch, User
+from core.models import Vendor, Warehouse, Customer, Seller
+from core.renderers import ORJSONRenderer, orjson
+from core.serializers import VendorSerializer, WarehouseSerializer, CustomerSerializer, SellerSerializer
+
+def _instances(size):
+    """Unsaved rows shaped like the list endpoint querysets, no database needed"""
+    now = timezone.now()
+    branch = Branch(id=1, name='Main Branch')
+    user = User(id=1, username='manager', branch=branch)
+    stamps = lambda i: {'created_date': now - timedelta(days=i, microseconds=i), 'updated_date': now}
+    
+    warehouses = []
+    for i in range(size):
+        warehouse = Warehouse(id=i + 1, code=f'WH-{i}', branch=branch, cash=Decimal('12500.50') + i,
+                              created_by=user, **stamps(i))
+        warehouse.shard_cash = Decimal('0.25')
+        warehouses.append(warehouse)
+    
+    return {
+        'vendors': (VendorSerializer, [
+            Vendor(id=i + 1, name=f'Vendor {i}', created_by=user, **stamps(i)) for i in range(size)
+        ]),
+        'warehouses': (WarehouseSerializer, warehouses),
+        'customers': (CustomerSerializer, [
+            Customer(id=i + 1, name=f'عميل {i}', phone=f'+20 100 {i:07d}', created_by=user, **stamps(i))
+            for i in range(size)
+        ]),
+        'sellers': (SellerSerializer, [
+            Seller(id=i + 1, name=f'Seller {i}', branch=branch, created_by=user, **stamps(i)) for i in range(size)
+        ]),
+    }
+
+def _raw_totals(size):
+    # values() rows with raw Decimals, rendered as numbers by both encoders
+    return [
+        {'branch_id': i % 7, 'invoice_count': i, 'total_amount': Decimal('1234.56') * i, 'day': timezone.now()}
+        for i in range(size)
+    ]
+
+class Command(BaseCommand):
+    help = 'Compare the stdlib and orjson DRF renderers on list endpoint payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[10, 100, 1000],
+            help='Page sizes to benchmark'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Timing runs per measurement (best one is reported)'
+        )
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError('orjson is not installed, nothing to compare')
+        
+        stdlib_renderer, fast_renderer = JSONRenderer(), ORJSONRenderer()
+        repeat = options['repeat']
+        
+        self.stdout.write(f'{"payload":<12}{"size":>6}{"render std":>12}{"render orjson":>15}  identical')
+        mismatches = 0
+        for size in options['sizes']:
+            payloads = {
+                name: serializer_class(rows, many=True).data
+                for name, (serializer_class, rows) in _instances(size).items()
+            }
+            payloads['raw totals'] = _raw_totals(size)
+            
+            for name, results in payloads.items():
+                data = {'results': results, 'count': size, 'page': 1, 'page_size': size, 'total_pages': 1}
+                stdlib_bytes = stdlib_renderer.render(data)
+                fast_bytes = fast_renderer.render(data)
+                identical = stdlib_bytes == fast_bytes
+                mismatches += not identical
+                
+                best = lambda fn: min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+                timings = [
+                    best(lambda: stdlib_renderer.render(data)),
+                    best(lambda: fast_renderer.render(data)),
+                ]
+                self.stdout.write(
+                    f'{name:<12}{size:>6}{timings[0]:>10.3f}ms{timings[1]:>13.3f}ms  {"yes" if identical else "NO"}'
+                )
+        
+        if mismatches:
+            raise CommandError(f'{mismatches} payloads rendered differently')
+        self.stdout.write(self.style.SUCCESS('All payloads rendered byte-for-byte identical'))
@@ -0,0 +1,94 @@
+import timeit
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum, Value
+from django.db.models.functions import Coalesce
+
+from authentication.models import Branch, User
+from core.fast_serializers import serialize_values
+from core.models import Vendor, Warehouse, Customer, Seller
+from core.renderers import ORJSONRenderer
+from core.serializers import VendorSerializer, WarehouseSerializer, CustomerSerializer, SellerSerializer
+
+def _warehouses():
+    return Warehouse.objects.select_related('branch', 'created_by').annotate(
+        shard_cash=Coalesce(Sum('cash_shards__amount'), Value(0), output_field=DecimalField())
+    ).annotate(
+        cash_balance=ExpressionWrapper(F('cash') + F('shard_cash'), output_field=DecimalField())
+    )
+
+# name -> (queryset factory, serializer, columns for the fast path)
+ENDPOINTS = {
+    'vendors': (lambda: Vendor.objects.select_related('created_by'), VendorSerializer, None),
+    'warehouses': (_warehouses, WarehouseSerializer, {'cash': 'cash_balance'}),
+    'customers': (lambda: Customer.objects.select_related('created_by'), CustomerSerializer, None),
+    'sellers': (lambda: Seller.objects.select_related('branch', 'created_by'), SellerSerializer, None),
+}
+
+class Command(BaseCommand):
+    help = 'Compare ModelSerializer(many=True) with the values() fast path on list pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[10, 100, 1000],
+            help='Page sizes to benchmark'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=10,
+            help='Timing runs per measurement (best one is reported)'
+        )
+
+    def handle(self, *args, **options):
+        sizes = options['sizes']
+        renderer = ORJSONRenderer()
+        mismatches = 0
+        
+        # Benchmark rows are created in a transaction that is rolled back
+        with transaction.atomic():
+            self._create_rows(max(sizes))
+            
+            self.stdout.write(f'{"endpoint":<12}{"size":>6}{"serializer":>13}{"values()":>12}{"speedup":>9}  identical')
+            for size in sizes:
+                for name, (queryset, serializer_class, columns) in ENDPOINTS.items():
+                    page = lambda: queryset().order_by('id')[:size]
+                    slow = lambda: serializer_class(page(), many=True).data
+                    fast = lambda: serialize_values(page(), serializer_class, columns)
+                    
+                    identical = renderer.render(list(slow())) == renderer.render(fast())
+                    mismatches += not identical
+                    
+                    best = lambda fn: min(timeit.repeat(fn, number=1, repeat=options['repeat'])) * 1000
+                    slow_ms, fast_ms = best(slow), best(fast)
+                    self.stdout.write(
+                        f'{name:<12}{size:>6}{slow_ms:>11.2f}ms{fast_ms:>10.2f}ms'
+                        f'{slow_ms / fast_ms:>8.1f}x  {"yes" if identical else "NO"}'
+                    )
+            
+            transaction.set_rollback(True)
+        
+        if mismatches:
+            raise CommandError(f'{mismatches} pages serialized differently')
+        self.stdout.write(self.style.SUCCESS('Fast path output identical on every page'))
+
+    def _create_rows(self, count):
+        user = User.objects.filter(is_active=True).order_by('id').first()
+        if user is None:
+            raise CommandError('At least one active user is required')
+        branch = Branch.objects.create(name='Benchmark branch', created_by=user)
+        
+        Vendor.objects.bulk_create([Vendor(name=f'Vendor {i}', created_by=user) for i in range(count)])
+        Warehouse.objects.bulk_create([
+            Warehouse(code=f'BW-{i}', branch=branch, cash=Decimal('1000.25') + i, created_by=user)
+            for i in range(count)
+        ])
+        Customer.objects.bulk_create([
+            Customer(name=f'Customer {i}', phone=f'0100{i:07d}', created_by=user) for i in range(count)
+        ])
+        Seller.objects.bulk_create([Seller(name=f'Seller {i}', branch=branch, created_by=user) for i in range(count)])
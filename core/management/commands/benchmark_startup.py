@@ -0,0 +1,95 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.models import User
+
+# Runs in a fresh interpreter: set Django up, optionally warm up, then time
+# the first and second round of requests
+CHILD = '''
+import json, os, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+timings = {"setup": time.perf_counter() - start, "warmup": 0.0}
+if os.environ["BENCHMARK_WARM"] == "1":
+    from core.warmup import warm_up
+    start = time.perf_counter()
+    warm_up()
+    timings["warmup"] = time.perf_counter() - start
+from django.test import Client
+client = Client(HTTP_AUTHORIZATION="Bearer " + os.environ["BENCHMARK_TOKEN"])
+for round_name in ("first", "second"):
+    start = time.perf_counter()
+    for path in json.loads(os.environ["BENCHMARK_PATHS"]):
+        status = client.get(path).status_code
+        if status >= 500:
+            sys.exit(f"GET {path} returned {status}")
+    timings[round_name] = time.perf_counter() - start
+print(json.dumps(timings))
+'''
+
+class Command(BaseCommand):
+    help = 'Measure worker startup and first-request latency with and without warm-up'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Fresh processes started per mode (median is reported)'
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='GET path requested by each process (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or [
+            '/api/core/vendors/',
+            '/api/core/warehouses/',
+            '/api/core/customers/',
+            '/api/core/sellers/',
+            '/api/jobs/',
+        ]
+        user = User.objects.filter(is_active=True, role='Admin').order_by('id').first()
+        if user is None:
+            raise CommandError('An active Admin user is required to authenticate the requests')
+
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE,
+            BENCHMARK_TOKEN=str(AccessToken.for_user(user)),
+            BENCHMARK_PATHS=json.dumps(paths),
+        )
+
+        self.stdout.write(f'{"mode":<8}{"setup":>10}{"warm-up":>10}{"1st round":>12}{"2nd round":>12}')
+        for mode, warm in (('cold', '0'), ('warm', '1')):
+            runs = [self._run(dict(env, BENCHMARK_WARM=warm)) for _ in range(options['repeat'])]
+            median = {key: statistics.median(run[key] for run in runs) * 1000 for key in runs[0]}
+            self.stdout.write(
+                f'{mode:<8}{median["setup"]:>8.1f}ms{median["warmup"]:>8.1f}ms'
+                f'{median["first"]:>10.1f}ms{median["second"]:>10.1f}ms'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Each round requests {len(paths)} paths; warm-up runs before the server forks its workers'
+        ))
+
+    def _run(self, env):
+        result = subprocess.run(
+            [sys.executable, '-c', CHILD], env=env, cwd=settings.BASE_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip() or 'Benchmark process failed')
+        return json.loads(result.stdout.strip().splitlines()[-1])
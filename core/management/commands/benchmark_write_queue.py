@@ -0,0 +1,99 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from authentication.models import User
+from core.models import Customer
+from core.writequeue import WriteQueue
+
+# Rows written by the benchmark carry this name and are deleted afterwards
+MARKER = 'write-queue-benchmark'
+
+class Command(BaseCommand):
+    help = 'Compare per-request commits with the group-commit write queue on SQLite'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            nargs='+',
+            default=[1, 4, 16],
+            help='Concurrent writer thread counts to benchmark'
+        )
+        parser.add_argument(
+            '--writes',
+            type=int,
+            default=200,
+            help='Writes per thread'
+        )
+        parser.add_argument(
+            '--max-delay',
+            type=float,
+            default=0.002,
+            help='Seconds the writer waits for more units before committing'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias to write to'
+        )
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if connections[using].vendor != 'sqlite':
+            raise CommandError('The write queue only applies to SQLite databases')
+        user = User.objects.using(using).order_by('id').first()
+        if user is None:
+            raise CommandError('Create a user first, benchmark rows need a created_by')
+
+        writes = options['writes']
+        self.stdout.write(f'{"threads":>7}{"direct":>12}{"queued":>12}{"speedup":>9}')
+        try:
+            for threads in options['threads']:
+                unit = lambda: Customer.objects.using(using).create(name=MARKER, phone='0', created_by=user)
+
+                def direct():
+                    with transaction.atomic(using=using):
+                        unit()
+
+                queue = WriteQueue(using, max_delay=options['max_delay'])
+                queued = lambda: queue.submit(unit).result()
+                try:
+                    direct_rate = self._rate(direct, threads, writes)
+                    queued_rate = self._rate(queued, threads, writes)
+                finally:
+                    queue.close()
+
+                self.stdout.write(
+                    f'{threads:>7}{direct_rate:>8.0f}/s{queued_rate:>8.0f}/s{queued_rate / direct_rate:>8.1f}x'
+                )
+        finally:
+            deleted, _ = Customer.all_objects.using(using).filter(name=MARKER).delete()
+
+        self.stdout.write(self.style.SUCCESS(f'Writes per second over {writes} writes per thread; '
+                                             f'{deleted} benchmark rows removed'))
+
+    def _rate(self, write, threads, writes):
+        errors = []
+
+        def run():
+            try:
+                for _ in range(writes):
+                    write()
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=run) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        if errors:
+            raise CommandError(f'{len(errors)} writer threads failed: {errors[0]}')
+        return threads * writes / elapsed
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.cash import compact
+from core.models import WarehouseCashShard
+
+class Command(BaseCommand):
+    help = 'Fold warehouse cash counter shards back into Warehouse.cash'
+
+    def handle(self, *args, **options):
+        warehouse_ids = (
+            WarehouseCashShard.objects.exclude(amount=0)
+            .values_list('warehouse_id', flat=True).distinct()
+        )
+        
+        compacted = 0
+        for warehouse_id in list(warehouse_ids):
+            compact(warehouse_id)
+            compacted += 1
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Compacted cash shards for {compacted} warehouses')
+        )
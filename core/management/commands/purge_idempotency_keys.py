@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import IdempotencyKey
+
+class Command(BaseCommand):
+    help = 'Delete expired Idempotency-Key responses in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of rows deleted per transaction'
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = IdempotencyKey.objects.filter(expires_at__lt=now).order_by('pk')
+        purged = 0
+        
+        while True:
+            ids = list(expired.values_list('pk', flat=True)[:options['chunk_size']])
+            if not ids:
+                break
+            
+            with transaction.atomic():
+                IdempotencyKey.objects.filter(pk__in=ids).delete()
+            purged += len(ids)
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Purged {purged} expired idempotency keys')
+        )
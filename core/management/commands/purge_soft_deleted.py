@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.purge import average_row_bytes, purge, retention_days, soft_delete_models
+
+class Command(BaseCommand):
+    help = 'Hard delete soft-deleted rows older than their retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            help='Only purge this model, as app_label.ModelName (repeatable)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of rows deleted per transaction'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be purged without deleting anything'
+        )
+
+    def handle(self, *args, **options):
+        models = soft_delete_models()
+        if options['model']:
+            by_label = {model._meta.label.lower(): model for model in models}
+            try:
+                models = [by_label[label.lower()] for label in options['model']]
+            except KeyError as e:
+                raise CommandError(f'Not a soft delete model: {e.args[0]}')
+        
+        verb = 'Would purge' if options['dry_run'] else 'Purged'
+        total_rows = 0
+        total_bytes = 0
+        for model in models:
+            # Measured before deleting, the rows are gone afterwards
+            row_bytes = average_row_bytes(model)
+            purged = purge(model, chunk_size=options['chunk_size'], dry_run=options['dry_run'])
+            total_rows += purged
+            
+            size = 'unknown size'
+            if row_bytes is not None:
+                reclaimed = int(row_bytes * purged)
+                total_bytes += reclaimed
+                size = f'~{reclaimed} bytes'
+            self.stdout.write(
+                f'{verb} {purged} {model._meta.label} rows '
+                f'(retention {retention_days(model)} days, {size})'
+            )
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'{verb} {total_rows} rows, ~{total_bytes} bytes reclaimable')
+        )
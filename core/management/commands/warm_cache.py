@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.refcache import REFERENCE_MODELS, reference_cache, reference_caches
+
+class Command(BaseCommand):
+    help = 'Load branches, vendors, sellers and warehouses into the reference-data cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help=f'Model label to warm (repeatable), one of: {", ".join(REFERENCE_MODELS)}'
+        )
+
+    def handle(self, *args, **options):
+        caches = reference_caches()
+        if options['models']:
+            unknown = [label for label in options['models'] if reference_cache(label) is None]
+            if unknown:
+                raise CommandError(f'Not cached: {", ".join(unknown)}')
+            caches = [reference_cache(label) for label in options['models']]
+        
+        for cache in caches:
+            count = cache.warm()
+            self.stdout.write(f'{cache.label}: {count} rows')
+        
+        self.stdout.write(self.style.SUCCESS(
+            'Reference cache warmed (only this process\' L1 unless REFERENCE_CACHE["L2"] is set)'
+        ))
@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 
+from .concurrency import StaleObjectError
+
 class SoftDeleteManager(models.Manager):
     """Manager that excludes soft-deleted objects by default"""
     
@@ -45,4 +48,31 @@ class TimeStampedModel(models.Model):
     updated_date = models.DateTimeField(auto_now=True)
     
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+
+class VersionedModel(models.Model):
+    """Abstract base model with optimistic concurrency control
+    
+    save() of an existing row is a compare-and-swap on version: the UPDATE
+    only applies if the row still has the version this instance was read
+    with (or was given), and bumps it. Otherwise StaleObjectError is raised
+    and nothing is written. Queryset update()s of the same rows should bump
+    version too.
+    """
+    
+    version = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        abstract = True
+    
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # UPDATE ... SET ..., version = version + 1 WHERE id = %s AND version = %s
+        version = self._meta.get_field('version')
+        values = [value for value in values if value[0] is not version] + [(version, None, F('version') + 1)]
+        if base_qs.filter(pk=pk_val, version=self.version)._update(values):
+            self.version += 1
+            return True
+        if base_qs.filter(pk=pk_val).exists():
+            raise StaleObjectError(f'{self._meta.label} {pk_val} changed since version {self.version}')
+        # The row is gone, save() inserts it again as usual
+        return False
@@ -0,0 +1,263 @@
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from .idempotency import (
+    MUTATING_METHODS, claim, release, replay, request_fingerprint, request_user_id, store, wait_for,
+)
+
+try:
+    import brotli
+except ImportError:  # Optional, br is not offered without it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional, zstd is not offered without it
+    zstandard = None
+
+
+class _GzipStream:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk):
+        # Sync flush so every chunk reaches the client as soon as it is produced
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, chunk):
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk):
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+# Content-Encoding -> (one-shot compress(data, level), streaming class), in
+# server preference order
+CODECS = OrderedDict()
+if zstandard is not None:
+    CODECS['zstd'] = (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data), _ZstdStream)
+if brotli is not None:
+    CODECS['br'] = (lambda data, level: brotli.compress(data, quality=level), _BrotliStream)
+CODECS['gzip'] = (lambda data, level: gzip.compress(data, compresslevel=level, mtime=0), _GzipStream)
+
+
+def compression_options():
+    options = {
+        'MIN_SIZE': 1024,
+        # (largest body size or None, levels per encoding); bigger bodies get
+        # cheaper levels so CPU per response stays bounded
+        'LEVELS': [
+            (64 * 1024, {'zstd': 9, 'br': 6, 'gzip': 6}),
+            (1024 * 1024, {'zstd': 6, 'br': 5, 'gzip': 5}),
+            (None, {'zstd': 3, 'br': 3, 'gzip': 2}),
+        ],
+        'CONTENT_TYPES': [
+            'application/json', 'application/javascript', 'application/xml',
+            'text/csv', 'text/plain', 'text/css', 'text/javascript', 'text/xml',
+        ],
+        'CACHE_ENTRIES': 256,
+        'CACHE_MAX_BYTES': 1024 * 1024,
+    }
+    options.update(getattr(settings, 'COMPRESSION', {}))
+    return options
+
+
+def negotiate(accept_encoding):
+    """Best supported Content-Encoding for an Accept-Encoding header, or None"""
+    accepted = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in CODECS:
+        quality = accepted.get(coding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def level_for(coding, size, levels):
+    """Level for a body of size bytes; None (streaming) uses the last bucket"""
+    for max_size, by_coding in levels:
+        if size is not None and max_size is not None and size <= max_size:
+            return by_coding[coding]
+    return levels[-1][1][coding]
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Compress responses with zstd, brotli or gzip as the client accepts
+
+    Only textual content types (HTML is left alone because of BREACH) and
+    bodies of at least MIN_SIZE bytes are compressed. Streaming responses
+    are compressed chunk by chunk with the cheapest level. Compressed bodies
+    of responses carrying an ETag are kept in a small per-process LRU cache,
+    so repeated identical responses are compressed once.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+
+        options = compression_options()
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in options['CONTENT_TYPES']:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if coding is None:
+            return response
+
+        if response.streaming:
+            level = level_for(coding, None, options['LEVELS'])
+            if response.is_async:
+                response.streaming_content = self._compress_async(response.streaming_content, coding, level)
+            else:
+                response.streaming_content = self._compress_stream(response.streaming_content, coding, level)
+            del response['Content-Length']
+        else:
+            if len(response.content) < options['MIN_SIZE']:
+                return response
+            compressed = self._compress(request, response, coding, options)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # The representation changed, a strong ETag no longer applies
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = coding
+        return response
+
+    def _compress(self, request, response, coding, options):
+        content = response.content
+        compress, _ = CODECS[coding]
+        level = level_for(coding, len(content), options['LEVELS'])
+
+        etag = response.get('ETag')
+        if not etag or len(content) > options['CACHE_MAX_BYTES']:
+            return compress(content, level)
+
+        key = (request.path, etag, coding, len(content))
+        with self._cache_lock:
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                return compressed
+
+        compressed = compress(content, level)
+        with self._cache_lock:
+            self._cache[key] = compressed
+            while len(self._cache) > options['CACHE_ENTRIES']:
+                self._cache.popitem(last=False)
+        return compressed
+
+    def _compress_stream(self, chunks, coding, level):
+        stream = CODECS[coding][1](level)
+        for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+    async def _compress_async(self, chunks, coding, level):
+        stream = CODECS[coding][1](level)
+        async for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+
+class IdempotencyMiddleware:
+    """Run a mutating API request at most once per Idempotency-Key header
+
+    Keys are scoped to the user of the bearer token. The first request with
+    a key claims it and stores its response; a retry replays that response
+    without running the view, and a duplicate arriving while the first one
+    still runs waits for it. A key reused for a different request gets 422.
+    Server errors release the key so the retry runs again. Requests without
+    a key or a valid token are passed through untouched.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        key = request.headers.get('Idempotency-Key')
+        if not key or request.method not in MUTATING_METHODS:
+            return self.get_response(request)
+        user_id = request_user_id(request)
+        if user_id is None:
+            return self.get_response(request)
+        if len(key) > 255:
+            return JsonResponse({'error': 'Idempotency-Key must be at most 255 characters'}, status=400)
+
+        fingerprint = request_fingerprint(request)
+        while True:
+            created, row = claim(user_id, key, fingerprint)
+            if created:
+                break
+            if row.fingerprint != fingerprint:
+                return JsonResponse({'error': 'Idempotency-Key was already used for a different request'},
+                                    status=422)
+            if row.response_status is None:
+                row = wait_for(row)
+                if row is None:
+                    continue
+                if row.response_status is None:
+                    return JsonResponse({'error': 'A request with this Idempotency-Key is still in progress'},
+                                        status=409)
+            return replay(row)
+
+        try:
+            response = self.get_response(request)
+        except Exception:
+            release(row)
+            raise
+        if response.streaming or response.status_code >= 500:
+            release(row)
+        else:
+            store(row, response)
+        return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='phone_normalized',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=32),
+        ),
+    ]
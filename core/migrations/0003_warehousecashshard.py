@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_customer_phone_normalized'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WarehouseCashShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveSmallIntegerField()),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('warehouse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cash_shards', to='core.warehouse')),
+            ],
+            options={
+                'db_table': 'warehouse_cash_shards',
+                'unique_together': {('warehouse', 'shard')},
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_revokedtoken'),
+        ('core', '0003_warehousecashshard'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['updated_date', 'id'], name='customers_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seller',
+            index=models.Index(fields=['updated_date', 'id'], name='sellers_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['updated_date', 'id'], name='vendors_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='warehouse',
+            index=models.Index(fields=['updated_date', 'id'], name='warehouse_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_sync_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WarehouseCashSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('taken_at', models.DateTimeField()),
+                ('warehouse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cash_snapshots', to='core.warehouse')),
+            ],
+            options={
+                'db_table': 'warehouse_cash_snapshots',
+                'indexes': [models.Index(fields=['warehouse', 'taken_at'], name='warehouse_cash_snapshot_idx')],
+            },
+        ),
+    ]
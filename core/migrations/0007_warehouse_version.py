@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_idempotency_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='warehouse',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,5 +1,15 @@
+import re
+
 from django.db import models
-from .managers import SoftDeleteModel, TimeStampedModel
+from .managers import SoftDeleteModel, TimeStampedModel, VersionedModel
+
+PHONE_EXTENSION_RE = re.compile(r'(?:x|ext\.?|#)\s*\d*\s*$', re.IGNORECASE)
+
+def normalize_phone(phone):
+    """Reduce a free-form phone number to its digits, dropping any extension"""
+    if not phone:
+        return ''
+    return re.sub(r'\D', '', PHONE_EXTENSION_RE.sub('', phone))
 
 class Vendor(SoftDeleteModel, TimeStampedModel):
     """Vendor model"""
@@ -9,11 +19,15 @@ class Vendor(SoftDeleteModel, TimeStampedModel):
     
     class Meta:
         db_table = 'vendors'
+        indexes = [
+            # Delta sync cursor (core.sync)
+            models.Index(fields=['updated_date', 'id'], name='vendors_updated_idx'),
+        ]
     
     def __str__(self):
         return self.name
 
-class Warehouse(SoftDeleteModel, TimeStampedModel):
+class Warehouse(SoftDeleteModel, TimeStampedModel, VersionedModel):
     """Warehouse model"""
     
     code = models.CharField(max_length=255)
@@ -23,22 +37,100 @@ class Warehouse(SoftDeleteModel, TimeStampedModel):
     
     class Meta:
         db_table = 'warehouse'
+        indexes = [
+            # Delta sync cursor (core.sync)
+            models.Index(fields=['updated_date', 'id'], name='warehouse_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.code} - {self.branch.name}"
 
+class WarehouseCashShard(models.Model):
+    """Warehouse cash counter shard - NO soft delete
+    
+    Cash movements are spread over several rows per warehouse so concurrent
+    checkouts don't serialize on the warehouse row. See core.cash.
+    """
+    
+    warehouse = models.ForeignKey(Warehouse, on_delete=models.CASCADE, related_name='cash_shards')
+    shard = models.PositiveSmallIntegerField()
+    amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    
+    class Meta:
+        db_table = 'warehouse_cash_shards'
+        unique_together = ['warehouse', 'shard']
+    
+    def __str__(self):
+        return f"{self.warehouse_id} #{self.shard}: {self.amount}"
+
+class WarehouseCashSnapshot(models.Model):
+    """Warehouse cash balance at a reconciliation - NO soft delete
+    
+    The opening balance the next reconciliation compares cash invoice
+    flows against. See invoicing.reconciliation.
+    """
+    
+    warehouse = models.ForeignKey(Warehouse, on_delete=models.CASCADE, related_name='cash_snapshots')
+    balance = models.DecimalField(max_digits=12, decimal_places=2)
+    taken_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'warehouse_cash_snapshots'
+        indexes = [
+            models.Index(fields=['warehouse', 'taken_at'], name='warehouse_cash_snapshot_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.warehouse_id} @ {self.taken_at}: {self.balance}"
+
+class IdempotencyKey(models.Model):
+    """Response stored for a mutating API request sent with an Idempotency-Key - NO soft delete
+    
+    The row is claimed before the view runs; response_status stays empty until
+    the first request finished. See core.idempotency.
+    """
+    
+    user = models.ForeignKey('authentication.User', on_delete=models.CASCADE, related_name='+')
+    key = models.CharField(max_length=255)
+    # sha256 of the method, path and body the key was first used with
+    fingerprint = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_headers = models.JSONField(default=dict)
+    response_body = models.BinaryField(default=b'')
+    created_date = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    
+    class Meta:
+        db_table = 'idempotency_keys'
+        unique_together = ['user', 'key']
+    
+    def __str__(self):
+        return f"{self.user_id}: {self.key}"
+
 class Customer(SoftDeleteModel, TimeStampedModel):
     """Customer model"""
     
     name = models.CharField(max_length=255)
     phone = models.CharField(max_length=255)
+    phone_normalized = models.CharField(max_length=32, blank=True, default='', db_index=True, editable=False)
     created_by = models.ForeignKey('authentication.User', on_delete=models.CASCADE)
     
     class Meta:
         db_table = 'customers'
+        indexes = [
+            # Delta sync cursor (core.sync)
+            models.Index(fields=['updated_date', 'id'], name='customers_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.phone}"
+    
+    def save(self, *args, **kwargs):
+        self.phone_normalized = normalize_phone(self.phone)[:32]
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'phone' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'phone_normalized'}
+        super().save(*args, **kwargs)
 
 class Seller(SoftDeleteModel, TimeStampedModel):
     """Seller model"""
@@ -49,6 +141,10 @@ class Seller(SoftDeleteModel, TimeStampedModel):
     
     class Meta:
         db_table = 'sellers'
+        indexes = [
+            # Delta sync cursor (core.sync)
+            models.Index(fields=['updated_date', 'id'], name='sellers_updated_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.branch.name}"
\ No newline at end of file
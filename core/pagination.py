@@ -0,0 +1,98 @@
+import base64
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+def encode_cursor(values):
+    """Opaque keyset cursor from the sort key values of the last row"""
+    raw = json.dumps(list(values), cls=DjangoJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, size=None):
+    """Sort key values from an encoded cursor, raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or (size is not None and len(values) != size):
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def keyset_filter(fields, values, descending=False):
+    """Q matching rows strictly after values in (fields...) order
+
+    Expands the row comparison (f1, f2, ...) > (v1, v2, ...) so every backend
+    can use a composite index on the same columns.
+    """
+    lookup = 'lt' if descending else 'gt'
+    conditions = []
+    equal = {}
+    for field, value in zip(fields, values):
+        conditions.append(Q(**equal, **{f'{field}__{lookup}': value}))
+        equal[field] = value
+    return reduce(or_, conditions)
+
+
+def page_limit(request, default=50, maximum=1000):
+    """Page size from the limit query parameter, clamped to [1, maximum]
+
+    Raises ValueError if limit is not an integer.
+    """
+    try:
+        limit = int(request.GET.get('limit', default))
+    except (TypeError, ValueError):
+        raise ValueError('limit must be an integer')
+    return max(1, min(limit, maximum))
+
+
+def id_param(request, name):
+    """Integer id from a query parameter, None when absent, raises ValueError if malformed"""
+    value = request.GET.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'Invalid {name}: {value}')
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that avoids an unbounded COUNT(*) where it can
+
+    Counts at most COUNT_LIMIT rows. Beyond that an unfiltered PostgreSQL
+    table reports the planner's row estimate; anything else (SQLite, filtered
+    changelists) reports COUNT_LIMIT, so only the pages up to it are linked.
+    """
+
+    COUNT_LIMIT = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset, 'query'):
+            return super().count
+
+        bounded = queryset.order_by().values('pk')[:self.COUNT_LIMIT + 1].count()
+        if bounded <= self.COUNT_LIMIT:
+            return bounded
+
+        if connections[queryset.db].vendor == 'postgresql' and not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.COUNT_LIMIT:
+                return row[0]
+        return self.COUNT_LIMIT
@@ -0,0 +1,50 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.db import connections
+
+
+def _context():
+    # fork shares the already-loaded project with the children; spawn
+    # (Windows) starts fresh interpreters that set Django up themselves
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+
+
+def _init_child():
+    if not apps.ready:
+        django.setup()
+    # A connection inherited through fork belongs to the parent; drop it
+    # without closing, which would end the parent's session too
+    for conn in connections.all(initialized_only=True):
+        conn.connection = None
+
+
+def _run_child(target, args):
+    _init_child()
+    target(*args)
+
+
+def process_pool(processes=None):
+    """ProcessPoolExecutor whose workers open their own database connections
+
+    The parent's connections are closed first, and children discard any
+    connection they still inherit, so no socket is ever shared.
+    """
+    connections.close_all()
+    return ProcessPoolExecutor(max_workers=processes, mp_context=_context(), initializer=_init_child)
+
+
+def start_process(target, *args, name=None):
+    """Start target(*args) in a child process with its own database connections"""
+    connections.close_all()
+    process = _context().Process(target=_run_child, args=(target, args), name=name, daemon=False)
+    process.start()
+    return process
+
+
+def event():
+    """Event shared between the parent and processes from start_process"""
+    return _context().Event()
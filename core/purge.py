@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import CASCADE, Exists, OuterRef
+from django.utils import timezone
+
+from .managers import SoftDeleteModel
+
+# Tables whose rows only exist for their parent and are removed with it, so
+# they never keep a soft-deleted parent alive
+OWNED_MODELS = {'core.WarehouseCashShard'}
+
+# How many levels of soft-deleted referrers are followed; deeper ones are
+# treated as live, which keeps the generated SQL bounded
+MAX_DEPTH = 2
+
+
+def soft_delete_models():
+    """Every concrete model using soft delete"""
+    return [
+        model for model in apps.get_models()
+        if issubclass(model, SoftDeleteModel) and not model._meta.proxy
+    ]
+
+
+def retention_days(model):
+    """Days a soft-deleted row of model is kept before it can be purged"""
+    retention = {'DEFAULT': 90}
+    retention.update(getattr(settings, 'SOFT_DELETE_RETENTION', {}))
+    return retention.get(model._meta.label, retention['DEFAULT'])
+
+
+def retention_cutoff(model, now=None):
+    return (now or timezone.now()) - timedelta(days=retention_days(model))
+
+
+def _referrers(model):
+    # Include hidden relations (related_name='+'), archive tables point here too
+    return [
+        field for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created and not field.concrete and field.is_relation
+        and field.related_model._meta.label not in OWNED_MODELS
+    ]
+
+
+def _live_referrer(relation, now, seen):
+    referrer = relation.related_model
+    rows = referrer._base_manager.filter(**{relation.field.name: OuterRef('pk')})
+    if (issubclass(referrer, SoftDeleteModel) and referrer not in seen
+            and relation.on_delete is CASCADE and len(seen) < MAX_DEPTH):
+        # A referrer that is purgeable itself is removed along with the row
+        rows = rows.exclude(pk__in=purgeable(referrer, now, seen).values('pk'))
+    return Exists(rows)
+
+
+def purgeable(model, now=None, seen=()):
+    """Soft-deleted rows past retention that nothing live still references
+
+    Referrers are checked recursively, a soft-deleted referrer only stops
+    blocking once it is purgeable too, since the delete cascades into it.
+    Relation cycles and referrers nested deeper than MAX_DEPTH are treated
+    as live.
+    """
+    now = now or timezone.now()
+    seen = (*seen, model)
+    rows = model.all_objects.filter(deleted_at__lt=retention_cutoff(model, now))
+    for relation in _referrers(model):
+        rows = rows.exclude(_live_referrer(relation, now, seen))
+    return rows
+
+
+def average_row_bytes(model):
+    """Approximate on-disk bytes per row, table plus indexes; None if unknown"""
+    connection = connections[model.objects.db]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    'SELECT pg_total_relation_size(oid) / GREATEST(reltuples, 1) '
+                    'FROM pg_class WHERE relname = %s',
+                    [table]
+                )
+            elif connection.vendor == 'sqlite':
+                # dbstat is only available when SQLite is built with it
+                cursor.execute(
+                    'SELECT SUM(pgsize) FROM dbstat WHERE name = %s OR name IN '
+                    '(SELECT name FROM sqlite_master WHERE type = %s AND tbl_name = %s)',
+                    [table, 'index', table]
+                )
+                total = cursor.fetchone()[0] or 0
+                return total / max(model.all_objects.count(), 1)
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    return float(row[0]) if row and row[0] is not None else None
+
+
+def purge(model, chunk_size=500, dry_run=False, now=None):
+    """Hard delete purgeable rows of model in chunks, one transaction each
+
+    Candidates are re-checked and locked inside each chunk's transaction, so
+    a row that gained a live referrer meanwhile is left alone. Returns the
+    number of rows purged (or that would be, with dry_run).
+    """
+    now = now or timezone.now()
+    purged = 0
+    last_pk = None
+    while True:
+        with transaction.atomic():
+            rows = purgeable(model, now).order_by('pk')
+            if last_pk is not None:
+                rows = rows.filter(pk__gt=last_pk)
+            if not dry_run:
+                rows = rows.select_for_update()
+            ids = list(rows.values_list('pk', flat=True)[:chunk_size])
+            if not ids:
+                break
+            last_pk = ids[-1]
+
+            if not dry_run:
+                model.all_objects.filter(pk__in=ids).delete()
+        purged += len(ids)
+    return purged
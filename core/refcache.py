@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
+
+# Model label -> fields left deferred on cached instances. Warehouse.cash is
+# moved by the cash shard compaction through update(), which sends no
+# signals, so it is always read from the database.
+REFERENCE_MODELS = {
+    'authentication.Branch': (),
+    'core.Vendor': (),
+    'core.Seller': (),
+    'core.Warehouse': ('cash',),
+}
+
+VERSION_KEY = 'refcache:version:{}'
+ENTRY_KEY = 'refcache:{}:{}:{}'
+
+_caches = {}
+
+
+def refcache_options():
+    options = {'MAX_ENTRIES': 5000, 'TTL': 300, 'L2': None, 'L2_TTL': 3600, 'VERSION_CHECK': 1}
+    options.update(getattr(settings, 'REFERENCE_CACHE', {}))
+    return options
+
+
+class ReferenceCache:
+    """Read-through cache of one reference model's rows by primary key
+
+    L1 is a per-process LRU whose entries expire after TTL seconds. L2, when
+    REFERENCE_CACHE['L2'] names a cache alias, is shared by all processes.
+    Rows are cached as column values and every get() builds a fresh
+    instance, so callers can never modify a shared object. Saving or deleting
+    a row bumps the model's version (see core.signals), which drops this
+    process' L1 and orphans every L2 entry; other processes notice the new
+    version within VERSION_CHECK seconds.
+    """
+
+    def __init__(self, model, deferred=()):
+        self.model = model
+        self.label = model._meta.label
+        self.field_names = [f.attname for f in model._meta.concrete_fields if f.name not in deferred]
+        self._pk_index = self.field_names.index(model._meta.pk.attname)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 1
+        self._version_checked_at = 0.0
+
+    def _l2(self, options):
+        return caches[options['L2']] if options['L2'] else None
+
+    def version(self, options=None):
+        options = options or refcache_options()
+        l2 = self._l2(options)
+        if l2 is None:
+            return self._version
+        now = time.monotonic()
+        if now - self._version_checked_at >= options['VERSION_CHECK']:
+            version = l2.get(VERSION_KEY.format(self.label))
+            if version is None:
+                version = self._new_version(l2)
+            with self._lock:
+                if version != self._version:
+                    self._entries.clear()
+                self._version, self._version_checked_at = version, now
+        return self._version
+
+    def _new_version(self, l2):
+        # Never reuse a number whose L2 entries may still be around
+        version = time.time_ns() // 1000
+        l2.set(VERSION_KEY.format(self.label), version, None)
+        return version
+
+    def invalidate(self):
+        """Forget every cached row of the model, in all processes"""
+        options = refcache_options()
+        l2 = self._l2(options)
+        with self._lock:
+            self._entries.clear()
+            if l2 is None:
+                self._version += 1
+                return
+        try:
+            version = l2.incr(VERSION_KEY.format(self.label))
+        except ValueError:
+            version = self._new_version(l2)
+        with self._lock:
+            self._version, self._version_checked_at = version, time.monotonic()
+
+    def _instance(self, values):
+        return self.model.from_db(DEFAULT_DB_ALIAS, self.field_names, values)
+
+    def _store(self, pk, values, version, options):
+        with self._lock:
+            self._entries[pk] = (version, time.monotonic() + options['TTL'], values)
+            self._entries.move_to_end(pk)
+            while len(self._entries) > options['MAX_ENTRIES']:
+                self._entries.popitem(last=False)
+
+    def get_many(self, pks, include_deleted=False):
+        """{pk: instance} for the pks that exist, querying only for misses"""
+        options = refcache_options()
+        version = self.version(options)
+        now = time.monotonic()
+        found, missing = {}, []
+        with self._lock:
+            for pk in set(pks):
+                entry = self._entries.get(pk)
+                if entry is not None and entry[0] == version and entry[1] > now:
+                    self._entries.move_to_end(pk)
+                    found[pk] = entry[2]
+                else:
+                    missing.append(pk)
+
+        l2 = self._l2(options)
+        if missing and l2 is not None:
+            keys = {ENTRY_KEY.format(self.label, version, pk): pk for pk in missing}
+            for key, values in l2.get_many(keys).items():
+                found[keys[key]] = values
+                self._store(keys[key], values, version, options)
+            missing = [pk for pk in missing if pk not in found]
+
+        if missing:
+            # _base_manager, like a foreign key access: soft-deleted rows too
+            rows = self.model._base_manager.filter(pk__in=missing).values_list(*self.field_names)
+            loaded = {}
+            for values in rows:
+                pk = values[self._pk_index]
+                found[pk] = loaded[pk] = values
+                self._store(pk, values, version, options)
+            if l2 is not None and loaded:
+                l2.set_many({
+                    ENTRY_KEY.format(self.label, version, pk): values for pk, values in loaded.items()
+                }, options['L2_TTL'])
+
+        instances = {pk: self._instance(values) for pk, values in found.items()}
+        if not include_deleted:
+            instances = {pk: obj for pk, obj in instances.items() if getattr(obj, 'deleted_at', None) is None}
+        return instances
+
+    def get(self, pk, include_deleted=False):
+        """Instance with the given pk, or None"""
+        return self.get_many([pk], include_deleted).get(pk)
+
+    def warm(self, chunk_size=1000):
+        """Load every live row, returns the number cached"""
+        pks = list(self.model.objects.values_list('pk', flat=True))
+        for start in range(0, len(pks), chunk_size):
+            self.get_many(pks[start:start + chunk_size])
+        return len(pks)
+
+
+def reference_cache(model):
+    """The ReferenceCache of model (a class or 'app_label.Model'), or None"""
+    label = model if isinstance(model, str) else model._meta.label
+    return _caches.get(label)
+
+
+def reference_caches():
+    return list(_caches.values())
+
+
+class CachedForwardDescriptor(ForwardManyToOneDescriptor):
+    """Foreign key accessor reading the related row from its ReferenceCache"""
+
+    def get_object(self, instance):
+        if instance._state.db in (None, DEFAULT_DB_ALIAS):
+            cache = _caches[self.field.related_model._meta.label]
+            obj = cache.get(getattr(instance, self.field.attname), include_deleted=True)
+            if obj is not None:
+                return obj
+        return super().get_object(instance)
+
+
+def install():
+    """Create the caches and route foreign keys to them; run from CoreConfig.ready()"""
+    for label, deferred in REFERENCE_MODELS.items():
+        _caches[label] = ReferenceCache(apps.get_model(label), deferred)
+
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if (field.many_to_one and field.related_model._meta.label in _caches
+                    and field.target_field.primary_key and field.name in model.__dict__):
+                setattr(model, field.name, CachedForwardDescriptor(field))
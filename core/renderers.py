@@ -0,0 +1,38 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # Optional, the stdlib based renderer is used instead
+    orjson = None
+
+# Types orjson has no native support for (Decimal, lazy strings, querysets,
+# ...) are converted exactly like DRF's encoder does
+_default = encoders.JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer producing the same bytes through orjson
+
+    Compact, non-ASCII-escaped output is what orjson produces natively, so
+    it only handles that configuration and pretty printing (indent=...,
+    the browsable API) falls back to DRF. Datetimes use 'Z' for UTC like
+    DRF and Decimals become numbers, as with the stdlib encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib still encodes
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping of U+2028/U+2029 as JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
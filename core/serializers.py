@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Vendor, Warehouse, Customer, Seller
+from .cash import cash_balance, set_cash
 from authentication.models import Branch, User
 
 
@@ -32,8 +33,8 @@ class WarehouseSerializer(serializers.ModelSerializer):
     class Meta:
         model = Warehouse
         fields = ['id', 'code', 'branch', 'branch_name', 'cash', 'created_by', 
-                 'created_by_username', 'created_date', 'updated_date']
-        read_only_fields = ['id', 'created_date', 'updated_date', 'created_by']
+                 'created_by_username', 'version', 'created_date', 'updated_date']
+        read_only_fields = ['id', 'version', 'created_date', 'updated_date', 'created_by']
     
     def validate_branch(self, value):
         """Validate branch access for non-admin users"""
@@ -42,6 +43,35 @@ class WarehouseSerializer(serializers.ModelSerializer):
             if request.user.branch != value:
                 raise serializers.ValidationError("You can only create warehouses in your own branch.")
         return value
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Include cash movements still sitting in the counter shards
+        if instance.pk is not None:
+            data['cash'] = self.fields['cash'].to_representation(cash_balance(instance))
+        return data
+    
+    def update(self, instance, validated_data):
+        cash = validated_data.pop('cash', None)
+        instance = super().update(instance, validated_data)
+        if cash is not None:
+            # A written balance replaces both the row value and the shards
+            set_cash(instance, cash)
+        return instance
+
+class SyncWarehouseSerializer(WarehouseSerializer):
+    """Warehouse rows for the sync feed, without cash
+
+    Cash movements go to the counter shards and leave updated_date alone, so
+    a synced balance would go stale; terminals read it from the warehouse
+    endpoints instead.
+    """
+
+    class Meta(WarehouseSerializer.Meta):
+        fields = [name for name in WarehouseSerializer.Meta.fields if name != 'cash']
+
+    def to_representation(self, instance):
+        return serializers.ModelSerializer.to_representation(self, instance)
 
 class CustomerSerializer(serializers.ModelSerializer):
     """Customer serializer"""
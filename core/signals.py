@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import Branch
+from .models import Vendor, Warehouse, Seller
+from .refcache import reference_cache
+
+
+@receiver([post_save, post_delete], sender=Branch)
+@receiver([post_save, post_delete], sender=Vendor)
+@receiver([post_save, post_delete], sender=Warehouse)
+@receiver([post_save, post_delete], sender=Seller)
+def reference_changed(sender, instance, **kwargs):
+    """Invalidate the cached rows of the model
+
+    Again on commit, in case another request cached the old row between
+    the write and the commit.
+    """
+    cache = reference_cache(sender)
+    cache.invalidate()
+    transaction.on_commit(cache.invalidate)
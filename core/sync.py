@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.fields import DateTimeField
+
+from .models import Vendor, Warehouse, Customer, Seller
+from .pagination import decode_cursor, encode_cursor, keyset_filter
+from .serializers import VendorSerializer, SyncWarehouseSerializer, CustomerSerializer, SellerSerializer
+
+SYNC_ORDER = ('updated_date', 'id')
+
+_datetime_field = DateTimeField()
+
+
+# Entity name -> (queryset factory including soft-deleted rows, serializer,
+# branch lookup used to scope non-admin users); same scoping as the list views
+ENTITIES = {
+    'vendors': (lambda: Vendor.all_objects.select_related('created_by'), VendorSerializer, 'created_by__branch'),
+    'sellers': (lambda: Seller.all_objects.select_related('branch', 'created_by'), SellerSerializer, 'branch'),
+    'customers': (lambda: Customer.all_objects.select_related('created_by'), CustomerSerializer, 'created_by__branch'),
+    'warehouses': (lambda: Warehouse.all_objects.select_related('branch', 'created_by'), SyncWarehouseSerializer, 'branch'),
+}
+
+
+def sync_options():
+    options = {'LAG_SECONDS': 2, 'CHUNK_SIZE': 500}
+    options.update(getattr(settings, 'SYNC', {}))
+    return options
+
+
+def decode_sync_cursor(cursor):
+    """{entity: (updated_date, id)} from an opaque sync cursor"""
+    if not cursor:
+        return {}
+    positions = {}
+    for entry in decode_cursor(cursor):
+        if not isinstance(entry, list) or len(entry) != 3 or entry[0] not in ENTITIES:
+            raise ValueError('Invalid cursor')
+        updated_date = parse_datetime(entry[1]) if isinstance(entry[1], str) else None
+        if updated_date is None or not isinstance(entry[2], int):
+            raise ValueError('Invalid cursor')
+        positions[entry[0]] = (updated_date, entry[2])
+    return positions
+
+
+def encode_sync_cursor(positions):
+    # isoformat() keeps the microseconds the JSON encoder would drop
+    return encode_cursor([
+        [entity, updated_date.isoformat(), pk] for entity, (updated_date, pk) in sorted(positions.items())
+    ])
+
+
+def changes(user, entities, positions, chunk_size=None):
+    """Rows of each entity changed after its cursor position
+
+    Returns ({entity: [row, ...]}, new positions, has_more). Soft-deleted rows
+    come back as tombstones ({'id', 'deleted_at'}). Rows updated during the
+    last LAG_SECONDS are left for the next call, so a transaction that
+    commits slightly after its updated_date was taken is not skipped.
+    """
+    options = sync_options()
+    chunk_size = chunk_size or options['CHUNK_SIZE']
+    horizon = timezone.now() - timedelta(seconds=options['LAG_SECONDS'])
+    positions = dict(positions)
+    results = {}
+    has_more = False
+
+    for entity in entities:
+        queryset, serializer_class, branch_lookup = ENTITIES[entity]
+        rows = queryset().filter(updated_date__lte=horizon)
+        if user.role != 'Admin':
+            rows = rows.filter(**{branch_lookup: user.branch})
+        if entity in positions:
+            rows = rows.filter(keyset_filter(SYNC_ORDER, positions[entity]))
+        rows = list(rows.order_by(*SYNC_ORDER)[:chunk_size + 1])
+
+        if len(rows) > chunk_size:
+            rows = rows[:chunk_size]
+            has_more = True
+
+        live = [row for row in rows if row.deleted_at is None]
+        serialized = iter(serializer_class(live, many=True).data)
+        results[entity] = [
+            next(serialized) if row.deleted_at is None
+            else {'id': row.id, 'deleted_at': _datetime_field.to_representation(row.deleted_at)}
+            for row in rows
+        ]
+        if rows:
+            positions[entity] = (rows[-1].updated_date, rows[-1].id)
+
+    return results, positions, has_more
@@ -0,0 +1,74 @@
+import json
+from decimal import Decimal
+
+from django.db.models import CharField, Q, Value
+from django.http import StreamingHttpResponse
+from rest_framework.fields import DateTimeField
+from rest_framework.utils.encoders import JSONEncoder
+
+from .pagination import encode_cursor, keyset_filter
+
+_datetime_field = DateTimeField()
+
+
+def metal_union(querysets, fields, order_by, cursor=None, descending=False, limit=50):
+    """Combine per-metal querysets into one metal-tagged UNION ALL statement
+
+    querysets maps a metal name to a queryset over that metal's table. Every
+    branch selects the same fields plus a constant 'metal' column. Rows are
+    ordered server side by (*order_by, metal, id) and paged with a keyset
+    cursor holding those values for the last row of the previous page.
+    """
+    branches = []
+    for metal, queryset in querysets.items():
+        queryset = queryset.annotate(metal=Value(metal, output_field=CharField()))
+        if cursor is not None:
+            queryset = queryset.filter(metal_keyset_filter(order_by, cursor, metal, descending))
+        branches.append(queryset.order_by().values(*fields, 'metal'))
+
+    combined = branches[0].union(*branches[1:], all=True)
+    direction = '-' if descending else ''
+    return combined.order_by(*[direction + f for f in (*order_by, 'metal', 'id')])[:limit]
+
+
+def metal_keyset_filter(order_by, cursor, metal, descending=False):
+    """Q matching one metal's rows after a (*order_by, metal, id) cursor"""
+    # The constant metal column is compared in Python, only the real
+    # columns end up in each branch's WHERE clause
+    *values, cursor_metal, cursor_id = cursor
+    before = keyset_filter(order_by, values, descending)
+    equal = Q(**dict(zip(order_by, values)))
+    if metal == cursor_metal:
+        return before | (equal & Q(**{'id__lt' if descending else 'id__gt': cursor_id}))
+    if (metal > cursor_metal) != descending:
+        return before | equal
+    return before
+
+
+def _jsonable(row):
+    for key, value in row.items():
+        if isinstance(value, Decimal):
+            row[key] = str(value)
+        elif hasattr(value, 'utcoffset') and hasattr(value, 'hour'):
+            row[key] = _datetime_field.to_representation(value)
+    return row
+
+
+def stream_union(rows, order_by, limit):
+    """Stream union rows to the client as JSON, ending with the next cursor"""
+
+    def generate():
+        encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        yield '{"results":['
+        last = None
+        count = 0
+        for row in rows.iterator(chunk_size=500):
+            last = _jsonable(dict(row))
+            yield (',' if count else '') + encoder.encode(last)
+            count += 1
+        next_cursor = None
+        if count == limit and last is not None:
+            next_cursor = encode_cursor([last[f] for f in (*order_by, 'metal', 'id')])
+        yield '],"next_cursor":' + json.dumps(next_cursor) + '}'
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
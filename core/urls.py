@@ -16,9 +16,13 @@ urlpatterns = [
     
     # Customer endpoints
     path('customers/', views.customer_list_create, name='customer_list_create'),
+    path('customers/lookup/', views.customer_lookup, name='customer_lookup'),
     path('customers/<int:pk>/', views.customer_detail, name='customer_detail'),
     
     # Seller endpoints
     path('sellers/', views.seller_list_create, name='seller_list_create'),
     path('sellers/<int:pk>/', views.seller_detail, name='seller_detail'),
+    
+    # Sync endpoints
+    path('sync/', views.sync_changes, name='sync_changes'),
 ]
\ No newline at end of file
@@ -3,9 +3,11 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Q, F, Sum, Value, DecimalField, ExpressionWrapper
+from django.db.models.functions import Coalesce
 
-from .models import Vendor, Warehouse, Customer, Seller
+from .concurrency import StaleObjectError, retry_on_conflict
+from .models import Vendor, Warehouse, Customer, Seller, normalize_phone
 from authentication.models import Branch
 from authentication.permissions import (
     IsAdminUser, IsManagerOrAdmin, IsSameBranchOrAdmin,
@@ -15,6 +17,13 @@ from .serializers import (
     VendorSerializer, WarehouseSerializer, CustomerSerializer, 
     SellerSerializer, BranchSerializer
 )
+from .fast_serializers import serialize_values
+from .writequeue import write
+from .pagination import page_limit
+from .sync import (
+    ENTITIES as SYNC_ENTITIES, changes as sync_changes_since,
+    decode_sync_cursor, encode_sync_cursor, sync_options
+)
 
 
 # ============= VENDOR ENDPOINTS =============
@@ -44,10 +53,10 @@ def vendor_list_create(request):
         paginator = Paginator(vendors, page_size)
         vendors_page = paginator.get_page(page)
         
-        serializer = VendorSerializer(vendors_page, many=True)
+        results = serialize_values(vendors_page.object_list, VendorSerializer)
         
         return Response({
-            'results': serializer.data,
+            'results': results,
             'count': paginator.count,
             'page': int(page),
             'page_size': int(page_size),
@@ -57,7 +66,7 @@ def vendor_list_create(request):
     elif request.method == 'POST':
         serializer = VendorSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(created_by=request.user)
+            write(serializer.save, created_by=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -110,10 +119,10 @@ def branch_list_create(request):
         paginator = Paginator(branches, page_size)
         branches_page = paginator.get_page(page)
         
-        serializer = BranchSerializer(branches_page, many=True)
+        results = serialize_values(branches_page.object_list, BranchSerializer)
         
         return Response({
-            'results': serializer.data,
+            'results': results,
             'count': paginator.count,
             'page': int(page),
             'page_size': int(page_size),
@@ -123,7 +132,7 @@ def branch_list_create(request):
     elif request.method == 'POST':
         serializer = BranchSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            serializer.save(created_by=request.user)
+            write(serializer.save, created_by=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -166,6 +175,13 @@ def warehouse_list_create(request):
         else:
             warehouses = Warehouse.objects.filter(branch=request.user.branch)
         
+        # Cash still held in the counter shards, summed in the same query
+        warehouses = warehouses.annotate(
+            shard_cash=Coalesce(Sum('cash_shards__amount'), Value(0), output_field=DecimalField())
+        ).annotate(
+            cash_balance=ExpressionWrapper(F('cash') + F('shard_cash'), output_field=DecimalField())
+        )
+        
         # Search functionality
         search = request.GET.get('search', '')
         if search:
@@ -179,10 +195,10 @@ def warehouse_list_create(request):
         paginator = Paginator(warehouses, page_size)
         warehouses_page = paginator.get_page(page)
         
-        serializer = WarehouseSerializer(warehouses_page, many=True)
+        results = serialize_values(warehouses_page.object_list, WarehouseSerializer, {'cash': 'cash_balance'})
         
         return Response({
-            'results': serializer.data,
+            'results': results,
             'count': paginator.count,
             'page': int(page),
             'page_size': int(page_size),
@@ -192,7 +208,7 @@ def warehouse_list_create(request):
     elif request.method == 'POST':
         serializer = WarehouseSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            serializer.save(created_by=request.user)
+            write(serializer.save, created_by=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -212,15 +228,29 @@ def warehouse_detail(request, pk):
         return Response(serializer.data)
     
     elif request.method == 'PUT':
+        # Optimistic concurrency: the update only applies to the version the
+        # client read (or the one just loaded when it sends none)
+        if 'version' in request.data:
+            try:
+                warehouse.version = int(request.data['version'])
+            except (TypeError, ValueError):
+                return Response({'version': ['A valid integer is required.']},
+                               status=status.HTTP_400_BAD_REQUEST)
         serializer = WarehouseSerializer(warehouse, data=request.data, partial=True,
                                        context={'request': request})
         if serializer.is_valid():
-            serializer.save()
+            try:
+                serializer.save()
+            except StaleObjectError:
+                current = Warehouse.all_objects.filter(pk=pk).values_list('version', flat=True).first()
+                return Response({'error': 'Warehouse was changed by another request, reload it and retry',
+                                 'version': current}, status=status.HTTP_409_CONFLICT)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     elif request.method == 'DELETE':
-        warehouse.delete()
+        # Deleting does not depend on the other columns, so re-read and retry
+        retry_on_conflict(lambda: get_object_or_404(Warehouse, pk=pk).delete())
         return Response({'message': 'Warehouse deleted successfully'}, 
                        status=status.HTTP_204_NO_CONTENT)
 
@@ -252,10 +282,10 @@ def customer_list_create(request):
         paginator = Paginator(customers, page_size)
         customers_page = paginator.get_page(page)
         
-        serializer = CustomerSerializer(customers_page, many=True)
+        results = serialize_values(customers_page.object_list, CustomerSerializer)
         
         return Response({
-            'results': serializer.data,
+            'results': results,
             'count': paginator.count,
             'page': int(page),
             'page_size': int(page_size),
@@ -265,10 +295,46 @@ def customer_list_create(request):
     elif request.method == 'POST':
         serializer = CustomerSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(created_by=request.user)
+            write(serializer.save, created_by=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@api_view(['GET'])
+@permission_classes([IsManagerWarehouseKeeperOrAdmin])
+def customer_lookup(request):
+    """Find returning customers by phone number (exact or prefix match)"""
+    
+    phone = normalize_phone(request.GET.get('phone', ''))
+    if not phone:
+        return Response({'error': 'A phone number with at least one digit is required'},
+                       status=status.HTTP_400_BAD_REQUEST)
+    
+    match = request.GET.get('match', 'exact')
+    if match == 'exact':
+        customers = Customer.objects.filter(phone_normalized=phone)
+    elif match == 'prefix':
+        # Digits-only values, so the prefix is the range [phone, phone + 1)
+        # and stays an index range scan on every backend
+        upper = phone[:-1] + chr(ord(phone[-1]) + 1)
+        customers = Customer.objects.filter(phone_normalized__gte=phone, phone_normalized__lt=upper)
+    else:
+        return Response({'error': "match must be 'exact' or 'prefix'"},
+                       status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        limit = page_limit(request, default=10, maximum=50)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Filter customers for non-admin users
+    if request.user.role != 'Admin':
+        customers = customers.filter(created_by__branch=request.user.branch)
+    
+    customers = customers.select_related('created_by').order_by('phone_normalized', 'id')[:limit]
+    
+    serializer = CustomerSerializer(customers, many=True)
+    return Response({'results': serializer.data})
+
 @api_view(['GET', 'PUT', 'DELETE'])
 @permission_classes([IsSameBranchOrAdmin])
 def customer_detail(request, pk):
@@ -324,10 +390,10 @@ def seller_list_create(request):
         paginator = Paginator(sellers, page_size)
         sellers_page = paginator.get_page(page)
         
-        serializer = SellerSerializer(sellers_page, many=True)
+        results = serialize_values(sellers_page.object_list, SellerSerializer)
         
         return Response({
-            'results': serializer.data,
+            'results': results,
             'count': paginator.count,
             'page': int(page),
             'page_size': int(page_size),
@@ -337,7 +403,7 @@ def seller_list_create(request):
     elif request.method == 'POST':
         serializer = SellerSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            serializer.save(created_by=request.user)
+            write(serializer.save, created_by=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -367,4 +433,46 @@ def seller_detail(request, pk):
     elif request.method == 'DELETE':
         seller.delete()
         return Response({'message': 'Seller deleted successfully'}, 
-                       status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+                       status=status.HTTP_204_NO_CONTENT)
+
+
+# ============= SYNC ENDPOINTS =============
+
+@api_view(['GET'])
+@permission_classes([IsManagerWarehouseKeeperOrAdmin])
+def sync_changes(request):
+    """Rows changed since the given cursor, for terminals keeping a local copy
+    
+    Call without a cursor for the initial download, then keep passing back
+    the returned cursor; repeat at once while has_more is true.
+    """
+    
+    # Warehouse keepers may only list customers, same as the list endpoints
+    if request.user.role in ['Admin', 'Manager']:
+        allowed = list(SYNC_ENTITIES)
+    else:
+        allowed = ['customers']
+    
+    requested = request.GET.get('entities', '')
+    entities = [e for e in requested.split(',') if e] if requested else allowed
+    unknown = [e for e in entities if e not in SYNC_ENTITIES]
+    if unknown:
+        return Response({'error': f'Unknown entities: {", ".join(unknown)}'},
+                       status=status.HTTP_400_BAD_REQUEST)
+    if any(e not in allowed for e in entities):
+        return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        positions = decode_sync_cursor(request.GET.get('cursor', ''))
+        chunk_size = sync_options()['CHUNK_SIZE']
+        limit = page_limit(request, default=chunk_size, maximum=chunk_size)
+    except ValueError:
+        return Response({'error': 'Invalid cursor or limit'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    results, positions, has_more = sync_changes_since(request.user, entities, positions, chunk_size=limit)
+    
+    return Response({
+        'changes': results,
+        'cursor': encode_sync_cursor(positions),
+        'has_more': has_more
+    })
@@ -0,0 +1,170 @@
+import gc
+import logging
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.template import engines
+from django.urls import get_resolver
+from django.utils.module_loading import autodiscover_modules
+from rest_framework import serializers
+
+from .refcache import reference_caches
+
+logger = logging.getLogger(__name__)
+
+
+def warmup_options():
+    options = {'ENABLED': True, 'REFERENCE_CACHE': True, 'CHECK_DATABASES': True, 'FREEZE_GC': True}
+    options.update(getattr(settings, 'WARMUP', {}))
+    return options
+
+
+def _project_serializers():
+    autodiscover_modules('serializers')
+    pending, found = [serializers.BaseSerializer], []
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            pending.append(subclass)
+            if not subclass.__module__.startswith('rest_framework'):
+                found.append(subclass)
+    return found
+
+
+def warm_urls():
+    """Populate the URL resolver of every (nested) URLconf"""
+    pending = [get_resolver()]
+    count = 0
+    while pending:
+        resolver = pending.pop()
+        # reverse_dict populates the resolver and compiles its patterns
+        resolver.reverse_dict
+        for pattern in resolver.url_patterns:
+            if hasattr(pattern, 'url_patterns'):
+                pending.append(pattern)
+            else:
+                pattern.pattern.regex
+                count += 1
+    return count
+
+
+def warm_models():
+    """Build the field and relation caches of every model's _meta"""
+    count = 0
+    for model in apps.get_models(include_auto_created=True):
+        model._meta.get_fields(include_hidden=True)
+        model._meta._forward_fields_map
+        model._meta.fields_map
+        count += 1
+    return count
+
+
+def warm_serializers():
+    """Instantiate every project serializer and build its fields"""
+    count = 0
+    for serializer_class in _project_serializers():
+        try:
+            serializer_class().fields
+        except Exception:
+            # Serializers needing constructor arguments warm on first use
+            logger.debug('Could not warm %s', serializer_class.__qualname__, exc_info=True)
+            continue
+        count += 1
+    return count
+
+
+def _project_templates(engine):
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for directory in getattr(engine, 'template_dirs', ()):
+        directory = Path(directory).resolve()
+        # Only the project's own templates, not those of installed packages
+        if not directory.is_relative_to(base_dir) or not directory.is_dir():
+            continue
+        for path in sorted(directory.rglob('*.html')):
+            yield path.relative_to(directory).as_posix()
+
+
+def warm_templates():
+    """Compile every project template into the engines' cached loaders"""
+    count = 0
+    for engine in engines.all():
+        for name in _project_templates(engine):
+            engine.get_template(name)
+            count += 1
+    return count
+
+
+def warm_reference_cache():
+    """Load the reference rows, shared with forked workers through their L1"""
+    try:
+        return sum(cache.warm() for cache in reference_caches())
+    except DatabaseError:
+        # e.g. a deploy starting before its migrations ran
+        logger.warning('Reference cache not warmed', exc_info=True)
+        return 0
+    finally:
+        connections.close_all()
+
+
+def check_databases():
+    """Connect to every database, run a trivial query and disconnect
+
+    Connections are closed again so no socket is inherited by forked
+    workers; each worker opens its own on its first query.
+    """
+    for conn in connections.all():
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+    connections.close_all()
+    return len(connections.all())
+
+
+def freeze_gc():
+    """Move every object allocated so far to the permanent generation
+
+    Collections in the forked workers then never touch (and copy) the
+    pages holding the preloaded project.
+    """
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def warm_up():
+    """Do the per-process work of the first requests before workers fork
+
+    Called from the WSGI/ASGI modules once the application is created. With
+    a preloading server (gunicorn --preload, uvicorn with workers importing
+    in the parent) it runs once and the forked workers share the result;
+    otherwise every worker runs it before serving. Returns
+    {step: (count, seconds)}.
+    """
+    options = warmup_options()
+    if not options['ENABLED']:
+        return {}
+
+    steps = [
+        ('urls', warm_urls),
+        ('models', warm_models),
+        ('serializers', warm_serializers),
+        ('templates', warm_templates),
+    ]
+    if options['REFERENCE_CACHE']:
+        steps.append(('reference_cache', warm_reference_cache))
+    if options['CHECK_DATABASES']:
+        steps.append(('databases', check_databases))
+    if options['FREEZE_GC']:
+        steps.append(('gc_freeze', freeze_gc))
+
+    timings = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        count = step()
+        timings[name] = (count, time.perf_counter() - start)
+    logger.info('Warm-up done: %s', ', '.join(
+        f'{name} {count} in {seconds * 1000:.1f}ms' for name, (count, seconds) in timings.items()
+    ))
+    return timings
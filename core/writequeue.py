@@ -0,0 +1,171 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import connections, transaction
+
+
+def write_queue_options():
+    options = {'ENABLED': False, 'DATABASE': 'default', 'MAX_DELAY': 0.002, 'MAX_BATCH': 100}
+    options.update(getattr(settings, 'WRITE_QUEUE', {}))
+    return options
+
+
+class WriteQueue:
+    """Group commit: short write units from many threads share one transaction
+
+    Units are run one after the other by a dedicated writer thread, each in
+    its own savepoint, and committed together. The writer waits up to
+    max_delay seconds for a batch to hold a unit from every thread that
+    submitted in the last ACTIVE_WINDOW seconds (at most max_batch); a
+    lone writer is committed right away, since it cannot submit again
+    before its write is acknowledged. Each caller's future is resolved only
+    after that commit, so an acknowledged write is as durable as one
+    committed on its own, and a unit that raises is rolled back alone.
+    """
+
+    # Seconds a thread counts as an active writer after its last submit
+    ACTIVE_WINDOW = 0.1
+
+    def __init__(self, using='default', max_delay=0.002, max_batch=100):
+        self.using = using
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending = None
+        self._thread = None
+        self._pid = None
+        self._submitters = {}
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs), returns a Future of its result"""
+        future = Future()
+        self._submitters[threading.get_ident()] = time.monotonic()
+        self._started().put((future, fn, args, kwargs))
+        return future
+
+    def close(self):
+        """Commit what is queued and stop the writer thread"""
+        with self._lock:
+            thread, pending = self._thread, self._pending
+            self._thread = self._pending = None
+        if thread is not None and thread.is_alive():
+            pending.put(None)
+            thread.join()
+
+    def _started(self):
+        # The writer is started lazily, and again in a forked worker process
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                self._pending = queue.SimpleQueue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._pending,), name=f'write-queue-{self.using}', daemon=True
+                )
+                self._thread.start()
+            return self._pending
+
+    def _run(self, pending):
+        stopping = False
+        while not stopping:
+            item = pending.get()
+            if item is None:
+                break
+            batch = [item]
+            # A thread blocked on its unit cannot submit another, so only
+            # the other recently active threads are worth waiting for
+            target = min(self._active_writers(), self.max_batch)
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                if len(batch) >= target and pending.empty():
+                    break
+                try:
+                    item = pending.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+        connections[self.using].close()
+
+    def _active_writers(self):
+        now = time.monotonic()
+        active = 0
+        for ident, submitted_at in list(self._submitters.items()):
+            if now - submitted_at < self.ACTIVE_WINDOW:
+                active += 1
+            else:
+                self._submitters.pop(ident, None)
+        return active
+
+    def _commit(self, batch):
+        # The writer keeps its connection across batches, CONN_MAX_AGE is
+        # meant for request threads
+        connection = connections[self.using]
+        if connection.connection is not None and not connection.is_usable():
+            connection.close()
+        outcomes = []
+        try:
+            with transaction.atomic(using=self.using):
+                for future, fn, args, kwargs in batch:
+                    if not future.set_running_or_notify_cancel():
+                        outcomes.append((None, None))
+                        continue
+                    if len(batch) == 1:
+                        # Nothing to isolate from, the transaction is enough
+                        outcomes.append((fn(*args, **kwargs), None))
+                        continue
+                    try:
+                        with transaction.atomic(using=self.using):
+                            outcomes.append((fn(*args, **kwargs), None))
+                    except Exception as exc:
+                        outcomes.append((None, exc))
+        except Exception as exc:
+            # A lone unit or the commit itself failed, nothing was written
+            for future, *_ in batch:
+                if future.running():
+                    future.set_exception(exc)
+            return
+
+        for (future, *_), (result, error) in zip(batch, outcomes):
+            if not future.running():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+_queues = {}
+_queues_lock = threading.Lock()
+
+
+def write_queue(using='default'):
+    """The process-wide WriteQueue of a database alias"""
+    with _queues_lock:
+        if using not in _queues:
+            options = write_queue_options()
+            _queues[using] = WriteQueue(using, options['MAX_DELAY'], options['MAX_BATCH'])
+        return _queues[using]
+
+
+def write(fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) as one write transaction and return its result
+
+    With WRITE_QUEUE['ENABLED'] on a SQLite database the unit goes through
+    the group-commit queue and runs in the writer thread, so it must only
+    touch the database and the objects passed to it. Callers already inside
+    a transaction, and other databases, run it directly.
+    """
+    options = write_queue_options()
+    using = options['DATABASE']
+    connection = connections[using]
+    if not options['ENABLED'] or connection.vendor != 'sqlite' or connection.in_atomic_block:
+        with transaction.atomic(using=using):
+            return fn(*args, **kwargs)
+    return write_queue(using).submit(fn, *args, **kwargs).result()
@@ -1,7 +1,8 @@
 """
 ASGI config for gold_silver_management project.
 
-It exposes the ASGI callable as a module-level variable named ``application``.
+It exposes the ASGI callable as a module-level variable named ``application``,
+after warming the process up (see core.warmup).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -14,3 +15,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'gold_silver_management.settings')
 
 application = get_asgi_application()
+
+# Runs before the server forks its workers when the application is preloaded
+from core.warmup import warm_up  # noqa: E402
+
+warm_up()
@@ -45,17 +45,23 @@ INSTALLED_APPS = [
     "inventory",
     "invoicing",
     "transactions",
+    "jobs",
 ]
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "core.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # Replays responses of retried POST/PUT/PATCH/DELETE requests
+    "core.middleware.IdempotencyMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    # Sets ETags (reused by the compression cache) and answers If-None-Match
+    "django.middleware.http.ConditionalGetMiddleware",
 ]
 
 CORS_ALLOW_ALL_ORIGINS = True
@@ -106,6 +112,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson based, same output as the stdlib JSON renderer
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 # Simple JWT
@@ -114,7 +125,8 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    # last_login is written through authentication.last_login.LastLoginBuffer
+    'UPDATE_LAST_LOGIN': False,
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'VERIFYING_KEY': None,
@@ -125,6 +137,171 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_REFRESH_SERIALIZER': 'authentication.serializers.RevocableTokenRefreshSerializer',
+}
+
+# Refresh token blacklist (authentication.blacklist.RevocationFilter)
+# SYNC_INTERVAL is how long (seconds) a revocation made by another process
+# can take to be seen here; expired rows are removed by purge_revoked_tokens.
+TOKEN_BLACKLIST = {
+    'FILTER_CAPACITY': 100000,
+    'FILTER_ERROR_RATE': 0.001,
+    'SYNC_INTERVAL': 5,
+    'REBUILD_INTERVAL': 3600,
+}
+
+# Write-behind buffer for User.last_login
+# FLUSH_INTERVAL bounds how stale last_login can be (seconds), MAX_PENDING
+# triggers an early flush when that many logins are waiting.
+LAST_LOGIN_BUFFER = {
+    'ENABLED': True,
+    'FLUSH_INTERVAL': 30,
+    'MAX_PENDING': 500,
+}
+
+# Sales reports are cached until the next invoice in scope; the TTL bounds
+# staleness when several processes share no common cache backend. The
+# invoicing.warm_sales_reports job needs a shared default CACHES backend
+# (the default LocMemCache is per process) and refuses to run without one.
+SALES_REPORT_CACHE_TTL = 300
+
+# Invoices older than this many days are moved to the archive tables by the
+# archive_invoices command; reports read the archive only when needed.
+INVOICE_HOT_RETENTION_DAYS = 365
+
+# Days soft-deleted rows are kept before purge_soft_deleted hard deletes
+# them, per model label with a DEFAULT for the rest.
+SOFT_DELETE_RETENTION = {
+    'DEFAULT': 90,
+    'authentication.User': 365,
+    'core.Customer': 365,
+}
+
+# Sharded warehouse cash counters (core.cash)
+# SHARDS is the number of counter rows per warehouse; CACHE_TTL (seconds)
+# bounds how stale a cached cash balance read can be, 0 disables caching.
+CASH_COUNTERS = {
+    'SHARDS': 8,
+    'CACHE_TTL': 5,
+}
+
+# Response compression (core.middleware.CompressionMiddleware)
+# zstd and br are offered when the zstandard / brotli packages are
+# installed, gzip always. Bodies under MIN_SIZE bytes are sent as is; LEVELS
+# maps body size (bytes, None = larger/streaming) to a level per encoding.
+COMPRESSION = {
+    'MIN_SIZE': 1024,
+    'LEVELS': [
+        (64 * 1024, {'zstd': 9, 'br': 6, 'gzip': 6}),
+        (1024 * 1024, {'zstd': 6, 'br': 5, 'gzip': 5}),
+        (None, {'zstd': 3, 'br': 3, 'gzip': 2}),
+    ],
+}
+
+# Delta sync for branch terminals (core.sync)
+# Rows updated in the last LAG_SECONDS are held back until the next call;
+# CHUNK_SIZE is the default and maximum rows per entity per response.
+SYNC = {
+    'LAG_SECONDS': 2,
+    'CHUNK_SIZE': 500,
+}
+
+# Product catalog facets (inventory.catalog)
+# Lower bounds (grams) of the weight buckets counted in ProductFacet; run
+# rebuild_product_facets after changing them.
+CATALOG = {
+    'WEIGHT_BUCKETS': [0, 1, 2, 5, 10, 20, 50, 100],
+}
+
+# Live price board (inventory.priceboard)
+# Boards are served from memory; the published price and catalog version
+# are compared every CHECK_INTERVAL seconds and the catalog is reloaded at
+# least every CATALOG_TTL seconds.
+PRICE_BOARD = {
+    'CHECK_INTERVAL': 1,
+    'CATALOG_TTL': 300,
+}
+
+# Invoice receipts (invoicing.receipts)
+# CACHE names a CACHES alias shared by all processes (e.g. Redis or the
+# database cache); rendered documents are then cached per invoice for
+# CACHE_TTL seconds, else every receipt is rendered on request. Set
+# REFERENCE_CACHE['L2'] as well, so a renamed branch or seller is not
+# rendered from another process' stale reference cache. PDFs use
+# weasyprint when installed, else the WKHTMLTOPDF binary.
+RECEIPTS = {
+    'CACHE': None,
+    'CACHE_TTL': 86400,
+    'WKHTMLTOPDF': 'wkhtmltopdf',
+}
+
+# Idempotency-Key handling (core.middleware.IdempotencyMiddleware)
+# Stored responses are replayed for TTL seconds, then removed by
+# purge_idempotency_keys. Duplicates wait up to WAIT_TIMEOUT seconds for the
+# first request; a claim older than LOCK_TIMEOUT seconds is taken over.
+IDEMPOTENCY = {
+    'TTL': 86400,
+    'WAIT_TIMEOUT': 10,
+    'LOCK_TIMEOUT': 60,
+    'POLL_INTERVAL': 0.05,
+}
+
+# Background jobs (jobs app, run with manage.py run_workers)
+# POLL_INTERVAL is how often idle workers and the scheduler check the queue
+# (seconds); Running jobs without progress for STALE_AFTER seconds are
+# requeued. COMMANDS lists the management commands the jobs.call_command
+# task may run.
+JOBS = {
+    'POLL_INTERVAL': 2,
+    'STALE_AFTER': 3600,
+    'COMMANDS': [
+        'archive_invoices',
+        'compact_cash_shards',
+        'compact_stock_ledger',
+        'populate_fake_data',
+        'purge_idempotency_keys',
+        'purge_revoked_tokens',
+        'purge_soft_deleted',
+        'rebuild_product_facets',
+        'reconcile_invoices',
+        'render_receipts',
+    ],
+}
+
+# Reference-data cache for branches, vendors, sellers and warehouses
+# (core.refcache). L1 is per process (MAX_ENTRIES rows per model, TTL
+# seconds); L2 names an optional shared CACHES alias. Writes in another
+# process are seen within VERSION_CHECK seconds when L2 is set, else TTL.
+REFERENCE_CACHE = {
+    'MAX_ENTRIES': 5000,
+    'TTL': 300,
+    'L2': None,
+    'L2_TTL': 3600,
+    'VERSION_CHECK': 1,
+}
+
+# Group commit for SQLite (core.writequeue)
+# When ENABLED, create views hand their write to one writer thread per
+# process, which commits up to MAX_BATCH units in one transaction, waiting
+# at most MAX_DELAY seconds for the other recently active writer threads.
+# Pays off from a few concurrent writers on; ignored for other engines.
+WRITE_QUEUE = {
+    'ENABLED': False,
+    'DATABASE': 'default',
+    'MAX_DELAY': 0.002,
+    'MAX_BATCH': 100,
+}
+
+# Worker warm start (core.warmup, run from wsgi.py / asgi.py)
+# REFERENCE_CACHE preloads core.refcache; CHECK_DATABASES connects to every
+# database once at startup so a bad configuration fails the deploy;
+# FREEZE_GC calls gc.freeze() so forked workers keep sharing the preloaded
+# pages.
+WARMUP = {
+    'ENABLED': True,
+    'REFERENCE_CACHE': True,
+    'CHECK_DATABASES': True,
+    'FREEZE_GC': True,
 }
 
 # Custom User Model
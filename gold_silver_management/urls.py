@@ -21,5 +21,8 @@ urlpatterns = [
         path('admin/', admin.site.urls),
         path('api/auth/', include('authentication.urls')),
         path('api/core/', include('core.urls')),
+        path('api/inventory/', include('inventory.urls')),
+        path('api/invoicing/', include('invoicing.urls')),
+        path('api/jobs/', include('jobs.urls')),
         path('api-auth/', include('rest_framework.urls'))
 ]
@@ -1,6 +1,11 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import GoldProduct, SilverProduct, GoldWarehouseStock, SilverWarehouseStock
+from .models import (
+    GoldProduct, SilverProduct, GoldWarehouseStock, SilverWarehouseStock,
+    GoldStockMovement, SilverStockMovement, ProductFacet, MetalPrice
+)
+from core.admin import VersionedModelAdmin
+from core.pagination import EstimatedCountPaginator
 
 @admin.register(GoldProduct)
 class GoldProductAdmin(admin.ModelAdmin):
@@ -11,6 +16,10 @@ class GoldProductAdmin(admin.ModelAdmin):
     search_fields = ['name', 'vendor__name']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['vendor']
+    autocomplete_fields = ['vendor', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -31,6 +40,10 @@ class SilverProductAdmin(admin.ModelAdmin):
     search_fields = ['name', 'vendor__name']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['vendor']
+    autocomplete_fields = ['vendor', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -43,7 +56,7 @@ class SilverProductAdmin(admin.ModelAdmin):
         return SilverProduct.all_objects.get_queryset()
 
 @admin.register(GoldWarehouseStock)
-class GoldWarehouseStockAdmin(admin.ModelAdmin):
+class GoldWarehouseStockAdmin(VersionedModelAdmin):
     """Gold warehouse stock admin"""
     
     list_display = ['product', 'warehouse', 'quantity', 'created_by', 'status', 'updated_date']
@@ -51,6 +64,10 @@ class GoldWarehouseStockAdmin(admin.ModelAdmin):
     search_fields = ['product__name', 'warehouse__code']
     ordering = ['-updated_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['product', 'warehouse__branch', 'created_by']
+    autocomplete_fields = ['warehouse', 'product', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -63,7 +80,7 @@ class GoldWarehouseStockAdmin(admin.ModelAdmin):
         return GoldWarehouseStock.all_objects.get_queryset()
 
 @admin.register(SilverWarehouseStock)
-class SilverWarehouseStockAdmin(admin.ModelAdmin):
+class SilverWarehouseStockAdmin(VersionedModelAdmin):
     """Silver warehouse stock admin"""
     
     list_display = ['product', 'warehouse', 'quantity', 'created_by', 'status', 'updated_date']
@@ -71,6 +88,10 @@ class SilverWarehouseStockAdmin(admin.ModelAdmin):
     search_fields = ['product__name', 'warehouse__code']
     ordering = ['-updated_date']
     readonly_fields = ['created_date', 'updated_date']
+    list_select_related = ['product', 'warehouse__branch', 'created_by']
+    autocomplete_fields = ['warehouse', 'product', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status(self, obj):
         if obj.deleted_at:
@@ -80,4 +101,61 @@ class SilverWarehouseStockAdmin(admin.ModelAdmin):
     status.short_description = 'Status'
     
     def get_queryset(self, request):
-        return SilverWarehouseStock.all_objects.get_queryset()
\ No newline at end of file
+        return SilverWarehouseStock.all_objects.get_queryset()
+
+class StockMovementAdmin(admin.ModelAdmin):
+    """Read-only admin for the append-only stock ledgers"""
+    
+    list_display = ['product', 'warehouse', 'movement_type', 'quantity', 'invoice_id', 'warehouse_transaction_id', 'created_by', 'created_date']
+    list_filter = ['movement_type', 'created_date']
+    search_fields = ['product__name', 'warehouse__code']
+    ordering = ['-id']
+    list_select_related = ['product', 'warehouse__branch', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+admin.site.register(GoldStockMovement, StockMovementAdmin)
+admin.site.register(SilverStockMovement, StockMovementAdmin)
+
+@admin.register(ProductFacet)
+class ProductFacetAdmin(admin.ModelAdmin):
+    """Read-only admin for the catalog facet counts"""
+    
+    list_display = ['metal', 'vendor', 'carat', 'weight_bucket', 'product_count']
+    list_filter = ['metal', 'carat']
+    ordering = ['metal', 'vendor', 'carat', 'weight_bucket']
+    list_select_related = ['vendor']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+@admin.register(MetalPrice)
+class MetalPriceAdmin(admin.ModelAdmin):
+    """Metal price admin, prices are published as new rows"""
+    
+    list_display = ['id', 'gold_price_21', 'gold_price_24', 'silver_price', 'created_by', 'created_date']
+    ordering = ['-id']
+    readonly_fields = ['created_date']
+    list_select_related = ['created_by']
+    autocomplete_fields = ['created_by']
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,171 @@
+import bisect
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Sum
+
+from core.refcache import reference_cache
+from .ledger import with_current_quantity
+from .models import GoldProduct, SilverProduct, GoldWarehouseStock, SilverWarehouseStock, ProductFacet
+
+# Product model and stock row model per metal
+METALS = {
+    'gold': (GoldProduct, GoldWarehouseStock),
+    'silver': (SilverProduct, SilverWarehouseStock),
+}
+
+CATALOG_ORDERING = ['name', 'id']
+
+# Facet name -> ProductFacet column
+FACETS = {
+    'vendor': 'vendor_id',
+    'carat': 'carat',
+    'weight': 'weight_bucket',
+}
+
+
+def weight_buckets():
+    """Sorted lower bounds of the weight buckets"""
+    bounds = getattr(settings, 'CATALOG', {}).get('WEIGHT_BUCKETS', [0, 1, 2, 5, 10, 20, 50, 100])
+    return sorted(Decimal(str(bound)) for bound in bounds)
+
+
+def weight_bucket(weight, buckets=None):
+    """Lower bound of the bucket holding weight"""
+    buckets = buckets or weight_buckets()
+    index = bisect.bisect_right(buckets, weight) - 1
+    return buckets[max(index, 0)]
+
+
+def facet_key(product):
+    """(vendor_id, carat, weight_bucket) a product is counted under, None if not live"""
+    if product.deleted_at is not None:
+        return None
+    return (product.vendor_id, Decimal(str(product.carat)), weight_bucket(Decimal(str(product.weight))))
+
+
+def _add(metal, key, delta):
+    vendor_id, carat, bucket = key
+    facets = ProductFacet.objects.filter(metal=metal, vendor_id=vendor_id, carat=carat, weight_bucket=bucket)
+    if facets.update(product_count=F('product_count') + delta):
+        return
+    try:
+        with transaction.atomic():
+            ProductFacet.objects.create(
+                metal=metal, vendor_id=vendor_id, carat=carat, weight_bucket=bucket, product_count=delta
+            )
+    except IntegrityError:
+        # Created concurrently, the update now finds it
+        facets.update(product_count=F('product_count') + delta)
+
+
+def move_product(metal, old_key, new_key):
+    """Move a product's count from old_key to new_key (either may be None)"""
+    if old_key == new_key:
+        return
+    with transaction.atomic():
+        if old_key is not None:
+            _add(metal, old_key, -1)
+        if new_key is not None:
+            _add(metal, new_key, 1)
+
+
+def rebuild(metal):
+    """Recompute the facet rows of a metal from the product table
+
+    For data written without signals (bulk_create, update()). Returns the
+    number of facet rows.
+    """
+    product_model, _ = METALS[metal]
+    buckets = weight_buckets()
+    counts = {}
+    rows = product_model.objects.values('vendor_id', 'carat', 'weight').annotate(n=Count('id')).order_by()
+    for row in rows:
+        key = (row['vendor_id'], row['carat'], weight_bucket(row['weight'], buckets))
+        counts[key] = counts.get(key, 0) + row['n']
+
+    with transaction.atomic():
+        ProductFacet.objects.filter(metal=metal).delete()
+        ProductFacet.objects.bulk_create([
+            ProductFacet(metal=metal, vendor_id=vendor_id, carat=carat, weight_bucket=bucket, product_count=n)
+            for (vendor_id, carat, bucket), n in counts.items()
+        ])
+    return len(counts)
+
+
+def catalog_filters(vendor_ids=None, carats=None, weight_min=None, weight_max=None):
+    """{facet: Q over product columns} for the given filter values"""
+    filters = {}
+    if vendor_ids:
+        filters['vendor'] = Q(vendor_id__in=vendor_ids)
+    if carats:
+        filters['carat'] = Q(carat__in=carats)
+    weight = Q()
+    if weight_min is not None:
+        weight &= Q(weight__gte=weight_min)
+    if weight_max is not None:
+        weight &= Q(weight__lte=weight_max)
+    if weight:
+        filters['weight'] = weight
+    return filters
+
+
+def products(metal, filters, warehouse_id=None):
+    """Live products of a metal matching filters, optionally in stock at a warehouse"""
+    product_model, stock_model = METALS[metal]
+    queryset = product_model.objects.filter(*filters.values())
+    if warehouse_id is not None:
+        # Current quantity from the stock ledger, not just the snapshot
+        in_stock = with_current_quantity(
+            metal, stock_model.objects.filter(warehouse_id=warehouse_id, product=OuterRef('pk'))
+        ).filter(current_quantity__gt=0)
+        queryset = queryset.filter(Exists(in_stock))
+    return queryset
+
+
+def _bucket_filter(weight_min, weight_max, buckets):
+    # Buckets overlapping [weight_min, weight_max]
+    condition = Q()
+    if weight_min is not None:
+        condition &= Q(weight_bucket__gte=weight_bucket(weight_min, buckets))
+    if weight_max is not None:
+        condition &= Q(weight_bucket__lte=weight_max)
+    return condition
+
+
+def facet_counts(metal, vendor_ids=None, carats=None, weight_min=None, weight_max=None):
+    """Product counts per vendor, carat and weight bucket from ProductFacet
+
+    Each facet is narrowed by the other facets' filters but not its own, so
+    a client can offer every alternative value with its count. Weight
+    ranges narrow the other facets at bucket granularity.
+    """
+    buckets = weight_buckets()
+    conditions = {
+        'vendor': Q(vendor_id__in=vendor_ids) if vendor_ids else Q(),
+        'carat': Q(carat__in=carats) if carats else Q(),
+        'weight': _bucket_filter(weight_min, weight_max, buckets),
+    }
+    rows = ProductFacet.objects.filter(metal=metal, product_count__gt=0)
+
+    result = {}
+    for facet, column in FACETS.items():
+        others = [condition for name, condition in conditions.items() if name != facet]
+        result[facet] = list(
+            rows.filter(*others).values(column).annotate(count=Sum('product_count'))
+            .filter(count__gt=0).order_by(column)
+        )
+
+    vendors = reference_cache('core.Vendor').get_many([row['vendor_id'] for row in result['vendor']])
+    for row in result['vendor']:
+        row['value'] = row.pop('vendor_id')
+        row['label'] = vendors[row['value']].name if row['value'] in vendors else None
+    for row in result['carat']:
+        row['value'] = str(row.pop('carat'))
+    for row in result['weight']:
+        lower = row.pop('weight_bucket')
+        upper = buckets.index(lower) + 1 if lower in buckets else len(buckets)
+        row['value'] = str(lower)
+        row['max'] = f'{buckets[upper]:.2f}' if upper < len(buckets) else None
+    return result
@@ -0,0 +1,149 @@
+from django.db import transaction
+from django.db.models import Exists, F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import (
+    GoldWarehouseStock, SilverWarehouseStock, GoldStockMovement, SilverStockMovement
+)
+
+# Stock row model and ledger model per metal
+METALS = {
+    'gold': (GoldWarehouseStock, GoldStockMovement),
+    'silver': (SilverWarehouseStock, SilverStockMovement),
+}
+
+# Direction of each movement type; adjustments carry their own sign
+MOVEMENT_SIGNS = {
+    'Sale': -1,
+    'Return Packing': 1,
+    'Return Unpacking': 1,
+    'Transfer In': 1,
+    'Transfer Out': -1,
+}
+
+
+def record_movement(metal, warehouse, product, movement_type, quantity, created_by,
+                    invoice=None, warehouse_transaction=None):
+    """Append a movement to the ledger
+
+    quantity is the number of pieces moved; for 'Adjustment' it is the signed
+    correction. The stock row itself is never updated here, only created the
+    first time a product shows up in a warehouse.
+    """
+    stock_model, movement_model = METALS[metal]
+
+    if movement_type == 'Adjustment':
+        delta = quantity
+    elif movement_type in MOVEMENT_SIGNS:
+        delta = MOVEMENT_SIGNS[movement_type] * abs(quantity)
+    else:
+        raise ValueError(f'Unknown movement type: {movement_type}')
+
+    stock_model.objects.get_or_create(
+        warehouse=warehouse, product=product,
+        defaults={'quantity': 0, 'created_by': created_by}
+    )
+    return movement_model.objects.create(
+        warehouse=warehouse,
+        product=product,
+        movement_type=movement_type,
+        quantity=delta,
+        invoice=invoice,
+        warehouse_transaction=warehouse_transaction,
+        created_by=created_by,
+    )
+
+
+def record_transfer(metal, warehouse_transaction, product, created_by):
+    """Record both legs of an approved warehouse transfer"""
+    with transaction.atomic():
+        return [
+            record_movement(metal, warehouse_transaction.from_warehouse, product, 'Transfer Out',
+                            warehouse_transaction.quantity, created_by,
+                            warehouse_transaction=warehouse_transaction),
+            record_movement(metal, warehouse_transaction.to_warehouse, product, 'Transfer In',
+                            warehouse_transaction.quantity, created_by,
+                            warehouse_transaction=warehouse_transaction),
+        ]
+
+
+def _pending_movements(movement_model):
+    return movement_model.objects.filter(
+        warehouse=OuterRef('warehouse'),
+        product=OuterRef('product'),
+        compacted_at__isnull=True,
+    )
+
+
+def _pending_delta(movement_model):
+    movements = _pending_movements(movement_model)
+    return Coalesce(
+        Subquery(
+            movements.order_by().values('warehouse').annotate(total=Sum('quantity')).values('total'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def with_current_quantity(metal, stocks=None):
+    """Annotate stock rows with current_quantity = snapshot + movements since it
+
+    Evaluated as a single statement, so it stays consistent with a concurrent
+    compaction.
+    """
+    stock_model, movement_model = METALS[metal]
+    if stocks is None:
+        stocks = stock_model.objects.all()
+    return stocks.annotate(current_quantity=F('quantity') + _pending_delta(movement_model))
+
+
+def current_quantity(metal, warehouse, product):
+    """Current stock of one product in one warehouse"""
+    stock_model, _ = METALS[metal]
+    stocks = stock_model.objects.filter(warehouse=warehouse, product=product)
+    quantity = with_current_quantity(metal, stocks).values_list('current_quantity', flat=True).first()
+    return quantity or 0
+
+
+def compact(metal, chunk_size=500):
+    """Fold ledger movements into the stock row snapshots
+
+    Only rows with pending movements are touched. For each row the pending
+    movements are first stamped with compacted_at and then exactly the
+    stamped ones are added to quantity, in one transaction. A movement whose
+    transaction commits late is therefore picked up by a later run, whatever
+    its id, and the row locks taken by the stamping keep concurrent
+    compactions from applying a movement twice. The row's version is bumped
+    so an edit of the row read before compaction fails. Returns the number
+    of rows updated.
+    """
+    stock_model, movement_model = METALS[metal]
+
+    compacted = 0
+    last_pk = 0
+    while True:
+        rows = list(
+            stock_model.all_objects.filter(pk__gt=last_pk)
+            .filter(Exists(_pending_movements(movement_model)))
+            .order_by('pk')
+            .values('pk', 'warehouse_id', 'product_id')[:chunk_size]
+        )
+        if not rows:
+            break
+        last_pk = rows[-1]['pk']
+
+        with transaction.atomic():
+            for row in rows:
+                movements = movement_model.objects.filter(warehouse_id=row['warehouse_id'],
+                                                          product_id=row['product_id'])
+                stamp = timezone.now()
+                if not movements.filter(compacted_at__isnull=True).update(compacted_at=stamp):
+                    continue
+                delta = movements.filter(compacted_at=stamp).aggregate(total=Sum('quantity'))['total']
+                compacted += stock_model.all_objects.filter(pk=row['pk']).update(
+                    quantity=F('quantity') + delta,
+                    version=F('version') + 1,
+                )
+    return compacted
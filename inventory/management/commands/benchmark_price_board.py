@@ -0,0 +1,76 @@
+import random
+import timeit
+from decimal import Decimal
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory import priceboard
+from inventory.models import MetalPrice
+from inventory.priceboard import PRICE_COLUMNS, Catalog, _decimal_strings, build_board, reprice
+
+class Command(BaseCommand):
+    help = 'Time a full price board repricing with numpy and row by row, on a synthetic catalog'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[1000, 10000, 100000],
+            help='Catalog sizes to benchmark'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Timing runs per measurement (best one is reported)'
+        )
+
+    def handle(self, *args, **options):
+        if priceboard.numpy is None:
+            raise CommandError('numpy is not installed')
+
+        numpy = priceboard.numpy
+        rng = random.Random(0)
+        price = MetalPrice(id=1, gold_price_21=Decimal('3425.50'), gold_price_24=Decimal('3914.85'),
+                           silver_price=Decimal('52.75'))
+        prices = {
+            'gold_price_21': 342550,
+            'gold_price_24': 391485,
+            'silver_price': 5275,
+        }
+        best = lambda fn: min(timeit.repeat(fn, number=1, repeat=options['repeat'])) * 1000
+
+        self.stdout.write(f'{"products":>9}{"numpy":>11}{"row by row":>13}{"speedup":>9}{"full board":>13}  identical')
+        for size in options['sizes']:
+            values = {
+                'weight': [rng.randint(50, 5000) for _ in range(size)],
+                'carat': [rng.choice([1800, 2100, 2400]) for _ in range(size)],
+                'stamp_enduser': [rng.randint(5000, 20000) for _ in range(size)],
+                'cashback': [rng.randint(1000, 5000) for _ in range(size)],
+                'cashback_unpacking': [rng.randint(500, 2500) for _ in range(size)],
+            }
+            arrays = {column: numpy.array(values[column], dtype=numpy.int64) for column in PRICE_COLUMNS}
+
+            vectorized = lambda: reprice('gold', arrays, prices)
+            expected = [a.tolist() for a in vectorized()]
+            with mock.patch.object(priceboard, 'numpy', None):
+                row_by_row = lambda: reprice('gold', values, prices)
+                identical = expected == list(row_by_row())
+                python_ms = best(row_by_row)
+            numpy_ms = best(vectorized)
+
+            catalog = Catalog(1, 0, list(range(1, size + 1)), [f'Product {i}' for i in range(size)],
+                              ['Vendor'] * size, _decimal_strings(arrays['weight']),
+                              _decimal_strings(arrays['carat']), arrays)
+            board_ms = best(lambda: build_board('gold', catalog, price))
+
+            self.stdout.write(
+                f'{size:>9}{numpy_ms:>9.2f}ms{python_ms:>11.2f}ms{python_ms / numpy_ms:>8.1f}x'
+                f'{board_ms:>11.2f}ms  {"yes" if identical else "NO"}'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            'Full board includes rendering the JSON snapshot; reads then serve it from memory'
+        ))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from inventory.ledger import METALS, compact
+
+class Command(BaseCommand):
+    help = 'Fold stock ledger movements into the warehouse stock snapshots'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--metal',
+            choices=list(METALS),
+            help='Only compact one metal (default: both)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of stock rows updated per transaction'
+        )
+
+    def handle(self, *args, **options):
+        metals = [options['metal']] if options['metal'] else list(METALS)
+        
+        for metal in metals:
+            compacted = compact(metal, chunk_size=options['chunk_size'])
+            self.stdout.write(
+                self.style.SUCCESS(f'Compacted {compacted} {metal} stock rows')
+            )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from inventory.catalog import METALS, rebuild
+
+class Command(BaseCommand):
+    help = 'Recompute the catalog facet counts from the product tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--metal',
+            choices=list(METALS),
+            help='Only rebuild one metal (default: both)'
+        )
+
+    def handle(self, *args, **options):
+        metals = [options['metal']] if options['metal'] else list(METALS)
+        
+        for metal in metals:
+            rows = rebuild(metal)
+            self.stdout.write(
+                self.style.SUCCESS(f'Rebuilt {rows} {metal} facet rows')
+            )
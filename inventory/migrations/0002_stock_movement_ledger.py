@@ -0,0 +1,65 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_customer_phone_normalized'),
+        ('inventory', '0001_initial'),
+        ('invoicing', '0001_initial'),
+        ('transactions', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goldwarehousestock',
+            name='ledger_position',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='silverwarehousestock',
+            name='ledger_position',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='GoldStockMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('movement_type', models.CharField(choices=[('Sale', 'Sale'), ('Return Packing', 'Return Packing'), ('Return Unpacking', 'Return Unpacking'), ('Transfer In', 'Transfer In'), ('Transfer Out', 'Transfer Out'), ('Adjustment', 'Adjustment')], max_length=255)),
+                ('quantity', models.BigIntegerField()),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('invoice', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='stock_movements', to='invoicing.goldinvoice')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_movements', to='inventory.goldproduct')),
+                ('warehouse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gold_stock_movements', to='core.warehouse')),
+                ('warehouse_transaction', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='gold_stock_movements', to='transactions.warehousetransaction')),
+            ],
+            options={
+                'db_table': 'gold_stock_movements',
+                'indexes': [models.Index(fields=['warehouse', 'product', 'id'], name='gold_movement_stock_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SilverStockMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('movement_type', models.CharField(choices=[('Sale', 'Sale'), ('Return Packing', 'Return Packing'), ('Return Unpacking', 'Return Unpacking'), ('Transfer In', 'Transfer In'), ('Transfer Out', 'Transfer Out'), ('Adjustment', 'Adjustment')], max_length=255)),
+                ('quantity', models.BigIntegerField()),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('invoice', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='stock_movements', to='invoicing.silverinvoice')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_movements', to='inventory.silverproduct')),
+                ('warehouse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='silver_stock_movements', to='core.warehouse')),
+                ('warehouse_transaction', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='silver_stock_movements', to='transactions.warehousetransaction')),
+            ],
+            options={
+                'db_table': 'silver_stock_movements',
+                'indexes': [models.Index(fields=['warehouse', 'product', 'id'], name='silver_movement_stock_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_sync_indexes'),
+        ('inventory', '0002_stock_movement_ledger'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metal', models.CharField(choices=[('gold', 'Gold'), ('silver', 'Silver')], max_length=10)),
+                ('carat', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('weight_bucket', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('product_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'product_facets',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='goldproduct',
+            index=models.Index(fields=['name', 'id'], name='gold_product_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverproduct',
+            index=models.Index(fields=['name', 'id'], name='silver_product_name_idx'),
+        ),
+        migrations.AddField(
+            model_name='productfacet',
+            name='vendor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.vendor'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='productfacet',
+            unique_together={('metal', 'vendor', 'carat', 'weight_bucket')},
+        ),
+    ]
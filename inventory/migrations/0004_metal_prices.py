@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0003_product_catalog_facets'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetalPrice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gold_price_21', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('gold_price_24', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('silver_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'metal_prices',
+            },
+        ),
+    ]
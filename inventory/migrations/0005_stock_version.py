@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_metal_prices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goldwarehousestock',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='silverwarehousestock',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:53
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, Max, OuterRef, Subquery
+from django.utils import timezone
+
+
+def mark_compacted(apps, schema_editor):
+    # Movements up to a stock row's ledger_position are already in its quantity
+    now = timezone.now()
+    for stock_name, movement_name in (('GoldWarehouseStock', 'GoldStockMovement'),
+                                      ('SilverWarehouseStock', 'SilverStockMovement')):
+        stock_model = apps.get_model('inventory', stock_name)
+        movement_model = apps.get_model('inventory', movement_name)
+        position = stock_model.objects.filter(
+            warehouse=OuterRef('warehouse'), product=OuterRef('product')
+        ).values('ledger_position')[:1]
+        movement_model.objects.filter(id__lte=Subquery(position)).update(compacted_at=now)
+
+
+def restore_positions(apps, schema_editor):
+    for stock_name, movement_name in (('GoldWarehouseStock', 'GoldStockMovement'),
+                                      ('SilverWarehouseStock', 'SilverStockMovement')):
+        stock_model = apps.get_model('inventory', stock_name)
+        movement_model = apps.get_model('inventory', movement_name)
+        position = movement_model.objects.filter(
+            warehouse=OuterRef('warehouse'), product=OuterRef('product'), compacted_at__isnull=False
+        ).order_by().values('warehouse').annotate(last=Max('id')).values('last')
+        stock_model.objects.filter(Exists(position)).update(ledger_position=Subquery(position))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_warehouse_version'),
+        ('inventory', '0005_stock_version'),
+        ('invoicing', '0005_invoice_customer_indexes'),
+        ('transactions', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goldstockmovement',
+            name='compacted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='silverstockmovement',
+            name='compacted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_compacted, restore_positions),
+        migrations.RemoveField(
+            model_name='goldwarehousestock',
+            name='ledger_position',
+        ),
+        migrations.RemoveField(
+            model_name='silverwarehousestock',
+            name='ledger_position',
+        ),
+        migrations.AddIndex(
+            model_name='goldstockmovement',
+            index=models.Index(condition=models.Q(('compacted_at__isnull', True)), fields=['warehouse', 'product'], name='gold_movement_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverstockmovement',
+            index=models.Index(condition=models.Q(('compacted_at__isnull', True)), fields=['warehouse', 'product'], name='silver_movement_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:57
+
+from django.db import migrations, models
+
+
+def create_versions(apps, schema_editor):
+    CatalogVersion = apps.get_model('inventory', 'CatalogVersion')
+    for metal in ('gold', 'silver'):
+        CatalogVersion.objects.get_or_create(metal=metal)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_stock_movement_compacted_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metal', models.CharField(choices=[('gold', 'Gold'), ('silver', 'Silver')], max_length=10, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'catalog_versions',
+            },
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
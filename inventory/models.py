@@ -1,5 +1,5 @@
 from django.db import models
-from core.models import SoftDeleteModel, TimeStampedModel
+from core.models import SoftDeleteModel, TimeStampedModel, VersionedModel
 
 # inventory/models.py - Product and stock models
 class GoldProduct(SoftDeleteModel, TimeStampedModel):
@@ -16,6 +16,10 @@ class GoldProduct(SoftDeleteModel, TimeStampedModel):
     
     class Meta:
         db_table = 'gold_products'
+        indexes = [
+            # Catalog keyset paging (inventory.catalog)
+            models.Index(fields=['name', 'id'], name='gold_product_name_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.weight}g ({self.carat}K)"
@@ -34,11 +38,15 @@ class SilverProduct(SoftDeleteModel, TimeStampedModel):
     
     class Meta:
         db_table = 'silver_products'
+        indexes = [
+            # Catalog keyset paging (inventory.catalog)
+            models.Index(fields=['name', 'id'], name='silver_product_name_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.weight}g ({self.carat}K)"
 
-class GoldWarehouseStock(SoftDeleteModel, TimeStampedModel):
+class GoldWarehouseStock(SoftDeleteModel, TimeStampedModel, VersionedModel):
     """Gold warehouse stock model"""
     
     warehouse = models.ForeignKey('core.Warehouse', on_delete=models.CASCADE, related_name='gold_stocks')
@@ -53,7 +61,7 @@ class GoldWarehouseStock(SoftDeleteModel, TimeStampedModel):
     def __str__(self):
         return f"{self.product.name} - {self.warehouse.code}: {self.quantity}"
 
-class SilverWarehouseStock(SoftDeleteModel, TimeStampedModel):
+class SilverWarehouseStock(SoftDeleteModel, TimeStampedModel, VersionedModel):
     """Silver warehouse stock model"""
     
     warehouse = models.ForeignKey('core.Warehouse', on_delete=models.CASCADE, related_name='silver_stocks')
@@ -67,3 +75,145 @@ class SilverWarehouseStock(SoftDeleteModel, TimeStampedModel):
     
     def __str__(self):
         return f"{self.product.name} - {self.warehouse.code}: {self.quantity}"
+
+class GoldStockMovement(models.Model):
+    """Gold stock movement - append-only ledger entry, NO soft delete"""
+    
+    MOVEMENT_TYPE_CHOICES = [
+        ('Sale', 'Sale'),
+        ('Return Packing', 'Return Packing'),
+        ('Return Unpacking', 'Return Unpacking'),
+        ('Transfer In', 'Transfer In'),
+        ('Transfer Out', 'Transfer Out'),
+        ('Adjustment', 'Adjustment'),
+    ]
+    
+    warehouse = models.ForeignKey('core.Warehouse', on_delete=models.CASCADE, related_name='gold_stock_movements')
+    product = models.ForeignKey(GoldProduct, on_delete=models.CASCADE, related_name='stock_movements')
+    movement_type = models.CharField(max_length=255, choices=MOVEMENT_TYPE_CHOICES)
+    quantity = models.BigIntegerField()  # Signed change in stock
+    # No database constraint, so the history survives invoice archiving
+    invoice = models.ForeignKey('invoicing.GoldInvoice', on_delete=models.DO_NOTHING, db_constraint=False,
+                                null=True, blank=True, related_name='stock_movements')
+    warehouse_transaction = models.ForeignKey('transactions.WarehouseTransaction', on_delete=models.DO_NOTHING,
+                                              db_constraint=False, null=True, blank=True,
+                                              related_name='gold_stock_movements')
+    # Set once ledger compaction has folded the movement into the stock row
+    compacted_at = models.DateTimeField(null=True, blank=True)
+    created_date = models.DateTimeField(auto_now_add=True)
+    created_by = models.ForeignKey('authentication.User', on_delete=models.CASCADE)
+    
+    class Meta:
+        db_table = 'gold_stock_movements'
+        indexes = [
+            models.Index(fields=['warehouse', 'product', 'id'], name='gold_movement_stock_idx'),
+            # Movements not compacted yet (inventory.ledger)
+            models.Index(fields=['warehouse', 'product'], condition=models.Q(compacted_at__isnull=True),
+                         name='gold_movement_pending_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.movement_type} {self.quantity:+d} - {self.product_id} @ {self.warehouse_id}"
+
+class SilverStockMovement(models.Model):
+    """Silver stock movement - append-only ledger entry, NO soft delete"""
+    
+    MOVEMENT_TYPE_CHOICES = [
+        ('Sale', 'Sale'),
+        ('Return Packing', 'Return Packing'),
+        ('Return Unpacking', 'Return Unpacking'),
+        ('Transfer In', 'Transfer In'),
+        ('Transfer Out', 'Transfer Out'),
+        ('Adjustment', 'Adjustment'),
+    ]
+    
+    warehouse = models.ForeignKey('core.Warehouse', on_delete=models.CASCADE, related_name='silver_stock_movements')
+    product = models.ForeignKey(SilverProduct, on_delete=models.CASCADE, related_name='stock_movements')
+    movement_type = models.CharField(max_length=255, choices=MOVEMENT_TYPE_CHOICES)
+    quantity = models.BigIntegerField()  # Signed change in stock
+    # No database constraint, so the history survives invoice archiving
+    invoice = models.ForeignKey('invoicing.SilverInvoice', on_delete=models.DO_NOTHING, db_constraint=False,
+                                null=True, blank=True, related_name='stock_movements')
+    warehouse_transaction = models.ForeignKey('transactions.WarehouseTransaction', on_delete=models.DO_NOTHING,
+                                              db_constraint=False, null=True, blank=True,
+                                              related_name='silver_stock_movements')
+    # Set once ledger compaction has folded the movement into the stock row
+    compacted_at = models.DateTimeField(null=True, blank=True)
+    created_date = models.DateTimeField(auto_now_add=True)
+    created_by = models.ForeignKey('authentication.User', on_delete=models.CASCADE)
+    
+    class Meta:
+        db_table = 'silver_stock_movements'
+        indexes = [
+            models.Index(fields=['warehouse', 'product', 'id'], name='silver_movement_stock_idx'),
+            # Movements not compacted yet (inventory.ledger)
+            models.Index(fields=['warehouse', 'product'], condition=models.Q(compacted_at__isnull=True),
+                         name='silver_movement_pending_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.movement_type} {self.quantity:+d} - {self.product_id} @ {self.warehouse_id}"
+
+class ProductFacet(models.Model):
+    """Number of live products per (metal, vendor, carat, weight bucket)
+
+    Kept up to date by inventory.signals and rebuilt by the
+    rebuild_product_facets command; catalog facet counts are summed from
+    these few rows instead of grouping the product tables.
+    """
+    
+    METAL_CHOICES = [
+        ('gold', 'Gold'),
+        ('silver', 'Silver'),
+    ]
+    
+    metal = models.CharField(max_length=10, choices=METAL_CHOICES)
+    vendor = models.ForeignKey('core.Vendor', on_delete=models.CASCADE, related_name='+')
+    carat = models.DecimalField(max_digits=10, decimal_places=2)
+    # Lower bound of the CATALOG['WEIGHT_BUCKETS'] bucket holding the weight
+    weight_bucket = models.DecimalField(max_digits=10, decimal_places=2)
+    product_count = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'product_facets'
+        unique_together = ['metal', 'vendor', 'carat', 'weight_bucket']
+    
+    def __str__(self):
+        return f"{self.metal} {self.vendor_id} {self.carat}K {self.weight_bucket}g+: {self.product_count}"
+
+class MetalPrice(models.Model):
+    """Published metal prices per gram, append-only; the latest row is current"""
+    
+    gold_price_21 = models.DecimalField(max_digits=10, decimal_places=2)
+    gold_price_24 = models.DecimalField(max_digits=10, decimal_places=2)
+    # Pure (1000) silver
+    silver_price = models.DecimalField(max_digits=10, decimal_places=2)
+    created_date = models.DateTimeField(auto_now_add=True)
+    created_by = models.ForeignKey('authentication.User', on_delete=models.CASCADE)
+    
+    class Meta:
+        db_table = 'metal_prices'
+    
+    def __str__(self):
+        return f"21K {self.gold_price_21} / 24K {self.gold_price_24} / silver {self.silver_price}"
+
+class CatalogVersion(models.Model):
+    """Change counter of one metal's priced catalog
+
+    Bumped by inventory.signals in the same transaction as a product or
+    vendor change; price boards compare it every CHECK_INTERVAL seconds.
+    """
+    
+    METAL_CHOICES = [
+        ('gold', 'Gold'),
+        ('silver', 'Silver'),
+    ]
+    
+    metal = models.CharField(max_length=10, choices=METAL_CHOICES, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'catalog_versions'
+    
+    def __str__(self):
+        return f"{self.metal} catalog v{self.version}"
@@ -0,0 +1,210 @@
+import hashlib
+import threading
+import time
+from collections import namedtuple
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from core.renderers import ORJSONRenderer
+from .models import GoldProduct, SilverProduct, MetalPrice, CatalogVersion
+
+try:
+    import numpy
+except ImportError:  # Optional, prices are then computed row by row
+    numpy = None
+
+PRODUCT_MODELS = {'gold': GoldProduct, 'silver': SilverProduct}
+
+# Columns priced per product, all DecimalField(decimal_places=2)
+PRICE_COLUMNS = ['weight', 'carat', 'stamp_enduser', 'cashback', 'cashback_unpacking']
+
+# Immutable priced catalog of one metal. body is the rendered JSON served as
+# is, prices maps a product id to its (sale, return packing, return
+# unpacking) prices.
+PriceBoard = namedtuple('PriceBoard', 'metal price_id catalog_version computed_at etag body prices')
+
+# Products of one metal: ids, names, vendor names, weights and carats as
+# rendered, and {column: hundredths as an int64 array (a list without numpy)}
+Catalog = namedtuple('Catalog', 'version loaded_at ids names vendor_names weights carats columns')
+
+_lock = threading.Lock()
+_boards = {}
+_checked_at = {}
+_catalogs = {}
+_renderer = ORJSONRenderer()
+_FRACTIONS = numpy.array([f'.{i:02d}' for i in range(100)]) if numpy is not None else None
+
+
+def price_board_options():
+    options = {'CHECK_INTERVAL': 1, 'CATALOG_TTL': 300}
+    options.update(getattr(settings, 'PRICE_BOARD', {}))
+    return options
+
+
+def _hundredths(value):
+    return int(Decimal(value).scaleb(2))
+
+
+def _decimal_string(hundredths):
+    sign = '-' if hundredths < 0 else ''
+    hundredths = abs(hundredths)
+    return f'{sign}{hundredths // 100}.{hundredths % 100:02d}'
+
+
+def _decimal_strings(hundredths):
+    """Two-place decimal strings, as DRF renders them, for a column of hundredths"""
+    if numpy is None or not isinstance(hundredths, numpy.ndarray):
+        return [_decimal_string(value) for value in hundredths]
+    magnitude = numpy.abs(hundredths)
+    text = numpy.strings.add((magnitude // 100).astype(str), _FRACTIONS[magnitude % 100])
+    if (hundredths < 0).any():
+        text = numpy.strings.add(numpy.where(hundredths < 0, '-', ''), text)
+    return text.tolist()
+
+
+def bump_catalog_version(metal):
+    """Make every process reload the metal's products on its next version check
+
+    The counter row is updated in the caller's transaction, so the new
+    version becomes visible together with the change.
+    """
+    if not CatalogVersion.objects.filter(metal=metal).update(version=F('version') + 1):
+        CatalogVersion.objects.get_or_create(metal=metal, defaults={'version': 1})
+    _checked_at.pop(metal, None)
+
+
+def prices_changed():
+    """Make this process compare the published prices on its next board read"""
+    _checked_at.clear()
+
+
+def _catalog_version(metal):
+    return CatalogVersion.objects.filter(metal=metal).values_list('version', flat=True).first() or 0
+
+
+def load_catalog(metal, version=None):
+    """Live products of a metal as column arrays"""
+    rows = list(
+        PRODUCT_MODELS[metal].objects.order_by('id')
+        .values_list('id', 'name', 'vendor__name', *PRICE_COLUMNS)
+    )
+    ids = [row[0] for row in rows]
+    columns = {
+        column: [_hundredths(row[3 + index]) for row in rows] for index, column in enumerate(PRICE_COLUMNS)
+    }
+    if numpy is not None:
+        columns = {column: numpy.array(values, dtype=numpy.int64) for column, values in columns.items()}
+    return Catalog(
+        version, time.monotonic(), ids, [row[1] for row in rows], [row[2] for row in rows],
+        _decimal_strings(columns['weight']), _decimal_strings(columns['carat']), columns,
+    )
+
+
+def _unit_prices(metal, carat, prices):
+    # Price per gram of the product's carat (hundredths), rounded half up.
+    # Gold uses the published 21K / 24K prices as is and scales the 24K
+    # price for other carats; silver carats are fineness (925, 999, ...).
+    if metal == 'silver':
+        return (prices['silver_price'] * carat + 50000) // 100000
+    scaled = (prices['gold_price_24'] * carat + 1200) // 2400
+    if numpy is not None and isinstance(carat, numpy.ndarray):
+        return numpy.where(carat == 2100, prices['gold_price_21'],
+                           numpy.where(carat == 2400, prices['gold_price_24'], scaled))
+    if carat == 2100:
+        return prices['gold_price_21']
+    if carat == 2400:
+        return prices['gold_price_24']
+    return scaled
+
+
+def _totals(weight, unit, extra):
+    # weight (g) x (unit price + per-gram charge), both in hundredths
+    return (weight * (unit + extra) + 50) // 100
+
+
+def reprice(metal, columns, prices):
+    """(sale, return packing, return unpacking) price arrays in hundredths
+
+    Sale is weight x (metal price + stamp_enduser); a returned piece is
+    bought back at weight x (metal price + cashback), or cashback_unpacking
+    when it comes back without its packing. All arithmetic is on integer
+    hundredths, so numpy and the row-by-row fallback agree to the cent.
+    """
+    weight, carat = columns['weight'], columns['carat']
+    extras = (columns['stamp_enduser'], columns['cashback'], columns['cashback_unpacking'])
+    if numpy is not None:
+        unit = _unit_prices(metal, carat, prices)
+        return tuple(_totals(weight, unit, extra) for extra in extras)
+
+    units = [_unit_prices(metal, k, prices) for k in carat]
+    return tuple(
+        [_totals(w, u, e) for w, u, e in zip(weight, units, extra)] for extra in extras
+    )
+
+
+def build_board(metal, catalog, price):
+    """Price a catalog and render the snapshot served to clients"""
+    prices = {
+        'gold_price_21': _hundredths(price.gold_price_21),
+        'gold_price_24': _hundredths(price.gold_price_24),
+        'silver_price': _hundredths(price.silver_price),
+    }
+    sale, packing, unpacking = (_decimal_strings(values) for values in reprice(metal, catalog.columns, prices))
+    computed_at = timezone.now()
+    body = _renderer.render({
+        'metal': metal,
+        'prices': {name: _decimal_string(value) for name, value in prices.items()},
+        'price_id': price.id,
+        'computed_at': computed_at,
+        'products': [
+            {
+                'id': catalog.ids[i],
+                'name': catalog.names[i],
+                'vendor_name': catalog.vendor_names[i],
+                'weight': catalog.weights[i],
+                'carat': catalog.carats[i],
+                'sale_price': sale[i],
+                'return_packing_price': packing[i],
+                'return_unpacking_price': unpacking[i],
+            }
+            for i in range(len(catalog.ids))
+        ],
+    })
+    etag = '"{}"'.format(hashlib.md5(body, usedforsecurity=False).hexdigest())
+    return PriceBoard(
+        metal, price.id, catalog.version, computed_at, etag, body,
+        dict(zip(catalog.ids, zip(sale, packing, unpacking))),
+    )
+
+
+def current_board(metal):
+    """The metal's PriceBoard, or None before any price is published
+
+    Served from memory: the published price and the catalog version are
+    only compared every CHECK_INTERVAL seconds, and the catalog is reloaded
+    at least every CATALOG_TTL seconds.
+    """
+    board = _boards.get(metal)
+    options = price_board_options()
+    now = time.monotonic()
+    if board is not None and now - _checked_at.get(metal, 0) < options['CHECK_INTERVAL']:
+        return board
+
+    price = MetalPrice.objects.order_by('-id').first()
+    if price is None:
+        return None
+    version = _catalog_version(metal)
+
+    with _lock:
+        board = _boards.get(metal)
+        catalog = _catalogs.get(metal)
+        if catalog is None or catalog.version != version or now - catalog.loaded_at >= options['CATALOG_TTL']:
+            catalog = _catalogs[metal] = load_catalog(metal, version)
+            board = None
+        if board is None or board.price_id != price.id or board.catalog_version != catalog.version:
+            board = _boards[metal] = build_board(metal, catalog, price)
+        _checked_at[metal] = now
+    return board
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+from .models import GoldProduct, SilverProduct, MetalPrice
+
+PRODUCT_FIELDS = ['id', 'name', 'vendor', 'vendor_name', 'weight', 'carat', 'stamp_enduser',
+                  'cashback', 'cashback_unpacking', 'created_date', 'updated_date']
+
+
+class GoldProductSerializer(serializers.ModelSerializer):
+    """Gold product serializer"""
+    
+    vendor_name = serializers.CharField(source='vendor.name', read_only=True)
+    
+    class Meta:
+        model = GoldProduct
+        fields = PRODUCT_FIELDS
+        read_only_fields = ['id', 'created_date', 'updated_date']
+
+class SilverProductSerializer(serializers.ModelSerializer):
+    """Silver product serializer"""
+    
+    vendor_name = serializers.CharField(source='vendor.name', read_only=True)
+    
+    class Meta:
+        model = SilverProduct
+        fields = PRODUCT_FIELDS
+        read_only_fields = ['id', 'created_date', 'updated_date']
+
+class MetalPriceSerializer(serializers.ModelSerializer):
+    """Metal price serializer"""
+    
+    created_by_username = serializers.CharField(source='created_by.username', read_only=True)
+    
+    class Meta:
+        model = MetalPrice
+        fields = ['id', 'gold_price_21', 'gold_price_24', 'silver_price', 'created_by',
+                  'created_by_username', 'created_date']
+        read_only_fields = ['id', 'created_date', 'created_by']
+    
+    def validate(self, attrs):
+        for name in ('gold_price_21', 'gold_price_24', 'silver_price'):
+            if attrs[name] <= 0:
+                raise serializers.ValidationError({name: 'Prices must be positive.'})
+        return attrs
@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.models import Vendor
+from .catalog import facet_key, move_product
+from .models import GoldProduct, SilverProduct, MetalPrice
+from .priceboard import bump_catalog_version, prices_changed
+
+METAL_OF = {GoldProduct: 'gold', SilverProduct: 'silver'}
+
+
+@receiver(pre_save, sender=GoldProduct)
+@receiver(pre_save, sender=SilverProduct)
+def remember_facet_key(sender, instance, **kwargs):
+    """Key the product is counted under before this save"""
+    instance._facet_key = None
+    if instance.pk is not None and not kwargs.get('raw'):
+        old = sender._base_manager.filter(pk=instance.pk).first()
+        if old is not None:
+            instance._facet_key = facet_key(old)
+
+
+@receiver(post_save, sender=GoldProduct)
+@receiver(post_save, sender=SilverProduct)
+def product_saved(sender, instance, raw=False, **kwargs):
+    """Move the product between facet rows when its facets changed"""
+    if not raw:
+        move_product(METAL_OF[sender], getattr(instance, '_facet_key', None), facet_key(instance))
+        instance._facet_key = facet_key(instance)
+        bump_catalog_version(METAL_OF[sender])
+
+
+@receiver(post_delete, sender=GoldProduct)
+@receiver(post_delete, sender=SilverProduct)
+def product_deleted(sender, instance, **kwargs):
+    """Drop a hard-deleted product from its facet row"""
+    move_product(METAL_OF[sender], facet_key(instance), None)
+    bump_catalog_version(METAL_OF[sender])
+
+
+@receiver(post_save, sender=Vendor)
+def vendor_saved(sender, instance, created, raw=False, **kwargs):
+    """Reload the catalogs, which show vendor names"""
+    if not created and not raw:
+        for metal in METAL_OF.values():
+            bump_catalog_version(metal)
+
+
+@receiver(post_save, sender=MetalPrice)
+def metal_price_published(sender, instance, **kwargs):
+    """Reprice the boards of this process on their next read"""
+    prices_changed()
+    transaction.on_commit(prices_changed)
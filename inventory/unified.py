@@ -0,0 +1,43 @@
+from django.db.models import F
+
+from .ledger import with_current_quantity
+from .models import GoldProduct, SilverProduct, GoldWarehouseStock, SilverWarehouseStock
+
+PRODUCT_FIELDS = ['id', 'name', 'vendor_id', 'vendor_name', 'weight', 'carat', 'stamp_enduser']
+PRODUCT_ORDERING = ['name']
+
+STOCK_FIELDS = ['id', 'warehouse_id', 'product_id', 'product_name', 'vendor_name',
+                'weight', 'carat', 'current_quantity']
+STOCK_ORDERING = ['product_name']
+
+
+def product_querysets(search=None, vendor_id=None):
+    """Gold and silver catalog querysets with matching columns"""
+    querysets = {'gold': GoldProduct.objects.all(), 'silver': SilverProduct.objects.all()}
+    for metal, products in querysets.items():
+        if search:
+            products = products.filter(name__icontains=search)
+        if vendor_id:
+            products = products.filter(vendor_id=vendor_id)
+        querysets[metal] = products.annotate(vendor_name=F('vendor__name'))
+    return querysets
+
+
+def stock_querysets(warehouse_id):
+    """Gold and silver stock of one warehouse with matching columns
+
+    current_quantity comes from the stock ledger, not just the snapshot.
+    """
+    querysets = {}
+    for metal, stock_model in (('gold', GoldWarehouseStock), ('silver', SilverWarehouseStock)):
+        stocks = stock_model.objects.filter(warehouse_id=warehouse_id)
+        querysets[metal] = (
+            with_current_quantity(metal, stocks)
+            .annotate(
+                product_name=F('product__name'),
+                vendor_name=F('product__vendor__name'),
+                weight=F('product__weight'),
+                carat=F('product__carat'),
+            )
+        )
+    return querysets
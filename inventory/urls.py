@@ -0,0 +1,16 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    # Catalog
+    path('catalog/<str:metal>/products/', views.catalog_product_list, name='catalog_product_list'),
+    path('catalog/<str:metal>/facets/', views.catalog_facets, name='catalog_facets'),
+    
+    # Price board
+    path('prices/', views.metal_price_current, name='metal_price_current'),
+    path('price-board/<str:metal>/', views.price_board, name='price_board'),
+    
+    # Unified gold + silver endpoints
+    path('unified/products/', views.unified_product_list, name='unified_product_list'),
+    path('unified/warehouses/<int:pk>/stock/', views.unified_warehouse_stock, name='unified_warehouse_stock'),
+]
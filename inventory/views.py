@@ -1,3 +1,178 @@
-from django.shortcuts import render
+from decimal import Decimal, InvalidOperation
 
-# Create your views here.
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+
+from core.fast_serializers import serialize_values
+from core.models import Warehouse
+from core.pagination import decode_cursor, encode_cursor, id_param, keyset_filter, page_limit
+from core.unified import metal_union, stream_union
+from core.writequeue import write
+from .catalog import CATALOG_ORDERING, METALS, catalog_filters, facet_counts, products
+from .models import MetalPrice
+from .priceboard import current_board
+from .serializers import GoldProductSerializer, SilverProductSerializer, MetalPriceSerializer
+from .unified import (
+    PRODUCT_FIELDS, PRODUCT_ORDERING, STOCK_FIELDS, STOCK_ORDERING,
+    product_querysets, stock_querysets
+)
+
+PRODUCT_SERIALIZERS = {'gold': GoldProductSerializer, 'silver': SilverProductSerializer}
+
+
+# ============= CATALOG ENDPOINTS =============
+
+def _catalog_params(request):
+    """Filter arguments from the query string, raises ValueError if malformed"""
+    def decimal(value):
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f'Invalid number: {value}')
+    
+    def listed(name, convert):
+        values = [value.strip() for value in request.GET.get(name, '').split(',') if value.strip()]
+        try:
+            return [convert(value) for value in values]
+        except ValueError:
+            raise ValueError(f'Invalid {name}: {request.GET[name]}')
+    
+    return {
+        'vendor_ids': listed('vendor', int),
+        'carats': listed('carat', decimal),
+        'weight_min': decimal(request.GET['weight_min']) if request.GET.get('weight_min') else None,
+        'weight_max': decimal(request.GET['weight_max']) if request.GET.get('weight_max') else None,
+    }
+
+@api_view(['GET'])
+def catalog_product_list(request, metal):
+    """Gold or silver catalog, filterable and keyset-paged by name
+    
+    Filters: vendor and carat (comma separated), weight_min, weight_max and
+    warehouse (only products currently in stock there).
+    """
+    
+    if metal not in METALS:
+        raise Http404
+    
+    try:
+        filters = catalog_filters(**_catalog_params(request))
+        cursor = (decode_cursor(request.GET['cursor'], size=len(CATALOG_ORDERING))
+                  if request.GET.get('cursor') else None)
+        limit = page_limit(request)
+        warehouse_id = id_param(request, 'warehouse')
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    if warehouse_id is not None:
+        warehouse = get_object_or_404(Warehouse, pk=warehouse_id)
+        if request.user.role != 'Admin' and warehouse.branch_id != request.user.branch_id:
+            return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+    
+    rows = products(metal, filters, warehouse_id)
+    if cursor is not None:
+        rows = rows.filter(keyset_filter(CATALOG_ORDERING, cursor))
+    results = serialize_values(rows.order_by(*CATALOG_ORDERING)[:limit + 1], PRODUCT_SERIALIZERS[metal])
+    
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = encode_cursor([results[-1]['name'], results[-1]['id']])
+    return Response({'results': results, 'next_cursor': next_cursor})
+
+@api_view(['GET'])
+def catalog_facets(request, metal):
+    """Vendor, carat and weight bucket counts of the catalog, from the precomputed facets"""
+    
+    if metal not in METALS:
+        raise Http404
+    
+    try:
+        params = _catalog_params(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(facet_counts(metal, **params))
+
+
+# ============= PRICE BOARD ENDPOINTS =============
+
+@api_view(['GET', 'POST'])
+def metal_price_current(request):
+    """Current metal prices, or publish new ones - Manager/Admin only"""
+    
+    if request.method == 'GET':
+        price = MetalPrice.objects.select_related('created_by').order_by('-id').first()
+        if price is None:
+            return Response({'error': 'No prices published yet'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(MetalPriceSerializer(price).data)
+    
+    elif request.method == 'POST':
+        if request.user.role not in ['Admin', 'Manager']:
+            return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+        serializer = MetalPriceSerializer(data=request.data)
+        if serializer.is_valid():
+            write(serializer.save, created_by=request.user)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+@api_view(['GET'])
+def price_board(request, metal):
+    """Sale and buyback price of every gold or silver product at the current prices"""
+    
+    if metal not in METALS:
+        raise Http404
+    
+    board = current_board(metal)
+    if board is None:
+        return Response({'error': 'No prices published yet'}, status=status.HTTP_404_NOT_FOUND)
+    
+    # Pre-rendered snapshot, sent as is
+    response = HttpResponse(board.body, content_type='application/json')
+    response['ETag'] = board.etag
+    return response
+
+
+# ============= UNIFIED (GOLD + SILVER) ENDPOINTS =============
+
+@api_view(['GET'])
+def unified_product_list(request):
+    """Gold and silver products in one name-ordered, keyset-paged stream"""
+    
+    try:
+        cursor = (decode_cursor(request.GET['cursor'], size=len(PRODUCT_ORDERING) + 2)
+                  if request.GET.get('cursor') else None)
+        limit = page_limit(request)
+        vendor_id = id_param(request, 'vendor')
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    querysets = product_querysets(
+        search=request.GET.get('search', ''),
+        vendor_id=vendor_id,
+    )
+    rows = metal_union(querysets, PRODUCT_FIELDS, PRODUCT_ORDERING, cursor=cursor, limit=limit)
+    return stream_union(rows, PRODUCT_ORDERING, limit)
+
+@api_view(['GET'])
+def unified_warehouse_stock(request, pk):
+    """Gold and silver stock of a warehouse in one keyset-paged stream"""
+    
+    warehouse = get_object_or_404(Warehouse, pk=pk)
+    
+    # Check permissions
+    if request.user.role != 'Admin' and warehouse.branch_id != request.user.branch_id:
+        return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        cursor = (decode_cursor(request.GET['cursor'], size=len(STOCK_ORDERING) + 2)
+                  if request.GET.get('cursor') else None)
+        limit = page_limit(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    rows = metal_union(stock_querysets(warehouse.pk), STOCK_FIELDS, STOCK_ORDERING,
+                       cursor=cursor, limit=limit)
+    return stream_union(rows, STOCK_ORDERING, limit)
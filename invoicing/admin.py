@@ -1,5 +1,44 @@
 from django.contrib import admin
-from .models import GoldInvoice, GoldInvoiceItem, SilverInvoice, SilverInvoiceItem
+from .models import (
+    GoldInvoice, GoldInvoiceItem, SilverInvoice, SilverInvoiceItem,
+    ArchivedGoldInvoice, ArchivedSilverInvoice,
+)
+from core.models import Vendor
+from core.pagination import EstimatedCountPaginator
+from inventory.models import GoldProduct, SilverProduct
+
+class VendorNameListFilter(admin.SimpleListFilter):
+    """Filter items by vendor, choices come from the vendors table"""
+    title = 'vendor'
+    parameter_name = 'vendor_name'
+    
+    def lookups(self, request, model_admin):
+        names = Vendor.objects.order_by('name').values_list('name', flat=True).distinct()
+        return [(name, name) for name in names]
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(vendor_name=self.value())
+        return queryset
+
+class GoldCaratListFilter(admin.SimpleListFilter):
+    """Filter items by carat, choices come from the gold catalog"""
+    title = 'carat'
+    parameter_name = 'item_carat'
+    product_model = GoldProduct
+    
+    def lookups(self, request, model_admin):
+        carats = self.product_model.objects.order_by('carat').values_list('carat', flat=True).distinct()
+        return [(str(carat), str(carat)) for carat in carats]
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(item_carat=self.value())
+        return queryset
+
+class SilverCaratListFilter(GoldCaratListFilter):
+    """Filter items by carat, choices come from the silver catalog"""
+    product_model = SilverProduct
 
 class GoldInvoiceItemInline(admin.TabularInline):
     """Inline for gold invoice items"""
@@ -17,6 +56,10 @@ class GoldInvoiceAdmin(admin.ModelAdmin):
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'total_price']
     inlines = [GoldInvoiceItemInline]
+    list_select_related = ['customer', 'seller__branch', 'branch']
+    autocomplete_fields = ['warehouse', 'seller', 'branch', 'customer', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def get_readonly_fields(self, request, obj=None):
         if obj:  # Editing existing object
@@ -28,9 +71,13 @@ class GoldInvoiceItemAdmin(admin.ModelAdmin):
     """Gold invoice item admin"""
     
     list_display = ['invoice', 'item_name', 'vendor_name', 'item_quantity', 'item_weight', 'item_total_price']
-    list_filter = ['vendor_name', 'item_carat']
+    list_filter = [VendorNameListFilter, GoldCaratListFilter]
     search_fields = ['item_name', 'vendor_name', 'invoice__customer__name']
-    ordering = ['-invoice__created_date']
+    ordering = ['-id']  # Same order as invoice date, without the join
+    list_select_related = ['invoice__customer']
+    autocomplete_fields = ['invoice']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 class SilverInvoiceItemInline(admin.TabularInline):
     """Inline for silver invoice items"""
@@ -48,6 +95,10 @@ class SilverInvoiceAdmin(admin.ModelAdmin):
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'total_price']
     inlines = [SilverInvoiceItemInline]
+    list_select_related = ['customer', 'seller__branch', 'branch']
+    autocomplete_fields = ['warehouse', 'seller', 'branch', 'customer', 'created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def get_readonly_fields(self, request, obj=None):
         if obj:  # Editing existing object
@@ -59,6 +110,33 @@ class SilverInvoiceItemAdmin(admin.ModelAdmin):
     """Silver invoice item admin"""
     
     list_display = ['invoice', 'item_name', 'vendor_name', 'item_quantity', 'item_weight', 'item_total_price']
-    list_filter = ['vendor_name', 'item_carat']
+    list_filter = [VendorNameListFilter, SilverCaratListFilter]
     search_fields = ['item_name', 'vendor_name', 'invoice__customer__name']
-    ordering = ['-invoice__created_date']
\ No newline at end of file
+    ordering = ['-id']  # Same order as invoice date, without the join
+    list_select_related = ['invoice__customer']
+    autocomplete_fields = ['invoice']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+class ArchivedInvoiceAdmin(admin.ModelAdmin):
+    """Read-only admin for the invoice archive tables"""
+    
+    list_display = ['id', 'customer', 'seller', 'branch', 'total_price', 'transaction_type', 'invoice_type', 'created_date']
+    list_filter = ['transaction_type', 'invoice_type', 'branch']
+    search_fields = ['customer__name', 'seller__name', 'id']
+    ordering = ['-created_date']
+    list_select_related = ['customer', 'seller', 'branch']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+admin.site.register(ArchivedGoldInvoice, ArchivedInvoiceAdmin)
+admin.site.register(ArchivedSilverInvoice, ArchivedInvoiceAdmin)
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import (
+    GoldInvoice, GoldInvoiceItem, SilverInvoice, SilverInvoiceItem,
+    ArchivedGoldInvoice, ArchivedGoldInvoiceItem, ArchivedSilverInvoice, ArchivedSilverInvoiceItem,
+)
+
+# (hot invoice, hot item, archived invoice, archived item) per metal
+METALS = {
+    'gold': (GoldInvoice, GoldInvoiceItem, ArchivedGoldInvoice, ArchivedGoldInvoiceItem),
+    'silver': (SilverInvoice, SilverInvoiceItem, ArchivedSilverInvoice, ArchivedSilverInvoiceItem),
+}
+
+
+def retention_cutoff(days=None):
+    """Invoices created before this moment belong in the archive"""
+    if days is None:
+        days = getattr(settings, 'INVOICE_HOT_RETENTION_DAYS', 365)
+    return timezone.now() - timedelta(days=days)
+
+
+def _copy(rows, target):
+    fields = [f.attname for f in target._meta.concrete_fields]
+    target.objects.bulk_create([target(**row) for row in rows.values(*fields)], batch_size=500)
+
+
+def archive_chunk(metal, cutoff, chunk_size=500):
+    """Move the oldest chunk of invoices created before cutoff to the archive
+
+    Invoices and their items are copied with their ids and then deleted from
+    the hot tables in one transaction. Returns the number of invoices moved.
+    """
+    invoice_model, item_model, archived_invoice_model, archived_item_model = METALS[metal]
+
+    with transaction.atomic():
+        ids = list(
+            invoice_model.objects.select_for_update()
+            .filter(created_date__lt=cutoff)
+            .order_by('id').values_list('id', flat=True)[:chunk_size]
+        )
+        if not ids:
+            return 0
+
+        invoices = invoice_model.objects.filter(id__in=ids)
+        items = item_model.objects.filter(invoice_id__in=ids)
+        _copy(invoices, archived_invoice_model)
+        _copy(items, archived_item_model)
+
+        # Archiving does not change any report total, so the rows are removed
+        # without per-row delete signals (and their report invalidation)
+        items._raw_delete(items.db)
+        invoices._raw_delete(invoices.db)
+
+    return len(ids)
+
+
+def archive_boundary(metal):
+    """created_date of the newest archived invoice, None while the archive is empty"""
+    archived_invoice_model = METALS[metal][2]
+    # Index-only lookup on created_date, cheap enough to run per read
+    return archived_invoice_model.objects.aggregate(last=Max('created_date'))['last']
+
+
+def invoice_sources(metal, start=None):
+    """(invoice model, item model) pairs to read for rows created from start on
+
+    The archive is only consulted when the range reaches back to or before
+    the newest archived invoice, so recent ranges stay on the hot tables.
+    """
+    invoice_model, item_model, archived_invoice_model, archived_item_model = METALS[metal]
+    sources = [(invoice_model, item_model)]
+    boundary = archive_boundary(metal)
+    if boundary is not None and (start is None or start <= boundary):
+        sources.append((archived_invoice_model, archived_item_model))
+    return sources
@@ -0,0 +1,50 @@
+import heapq
+from itertools import islice
+
+from django.db.models import Prefetch, prefetch_related_objects
+
+from core.unified import metal_keyset_filter
+from .archive import METALS, invoice_sources
+
+HISTORY_ORDERING = ['created_date']
+
+
+def _newest_first(metal, invoice_model, customer_id, branch_id, scope_to_branch, cursor, limit):
+    # One (customer, created_date, id) index range scan, read lazily and never
+    # past the page size
+    invoices = invoice_model.objects.filter(customer_id=customer_id)
+    if scope_to_branch or branch_id is not None:
+        invoices = invoices.filter(branch_id=branch_id)
+    if cursor is not None:
+        invoices = invoices.filter(metal_keyset_filter(HISTORY_ORDERING, cursor, metal, descending=True))
+    for invoice in invoices.order_by('-created_date', '-id')[:limit].iterator(chunk_size=limit):
+        invoice.metal = metal
+        yield (invoice.created_date, metal, invoice.id), invoice
+
+
+def customer_history(customer_id, branch_id=None, cursor=None, limit=50, scope_to_branch=False):
+    """One page of a customer's gold and silver invoices, newest first
+
+    The hot and archive tables of both metals are each read in index order
+    and combined with a streaming heap merge, so a page costs the same for a
+    customer with ten invoices or ten thousand. Items are prefetched for the
+    page only. cursor is the (created_date, metal, id) of the previous page's
+    last invoice. With scope_to_branch only invoices of branch_id are read,
+    none when it is None. Returns the invoices, each tagged with its metal.
+    """
+    streams = [
+        _newest_first(metal, invoice_model, customer_id, branch_id, scope_to_branch, cursor, limit)
+        for metal in METALS for invoice_model, _ in invoice_sources(metal)
+    ]
+    page = [invoice for _, invoice in islice(heapq.merge(*streams, key=lambda entry: entry[0], reverse=True), limit)]
+
+    items = {}
+    for invoice_model, item_model, archived_invoice_model, archived_item_model in METALS.values():
+        items[invoice_model] = item_model
+        items[archived_invoice_model] = archived_item_model
+    by_model = {}
+    for invoice in page:
+        by_model.setdefault(type(invoice), []).append(invoice)
+    for invoice_model, invoices in by_model.items():
+        prefetch_related_objects(invoices, Prefetch('items', queryset=items[invoice_model].objects.order_by('id')))
+    return page
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from invoicing.archive import METALS, archive_chunk, retention_cutoff
+
+class Command(BaseCommand):
+    help = 'Move invoices older than the hot retention window into the archive tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Keep invoices from the last N days hot (default: INVOICE_HOT_RETENTION_DAYS)'
+        )
+        parser.add_argument(
+            '--metal',
+            choices=list(METALS),
+            help='Only archive one metal (default: both)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of invoices moved per transaction'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = retention_cutoff(options['days'])
+        metals = [options['metal']] if options['metal'] else list(METALS)
+        
+        for metal in metals:
+            archived = 0
+            while True:
+                moved = archive_chunk(metal, cutoff, chunk_size=options['chunk_size'])
+                if not moved:
+                    break
+                archived += moved
+            self.stdout.write(
+                self.style.SUCCESS(f'Archived {archived} {metal} invoices created before {cutoff:%Y-%m-%d}')
+            )
@@ -0,0 +1,65 @@
+import csv
+import json
+import sys
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from invoicing.reconciliation import REPORT_COLUMNS, reconcile
+
+class Command(BaseCommand):
+    help = 'Reconcile a day of invoices and the warehouse cash, one branch per worker process'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+            help='Invoice day, YYYY-MM-DD (default: today)'
+        )
+        parser.add_argument(
+            '--branch',
+            type=int,
+            nargs='+',
+            dest='branches',
+            help='Branch ids to reconcile (default: all)'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            help='Worker processes (default: CPU count)'
+        )
+        parser.add_argument(
+            '--skip-cash',
+            action='store_true',
+            help='Only check invoice and item totals, e.g. when re-checking an earlier day'
+        )
+        parser.add_argument(
+            '--output',
+            default='-',
+            help='Report path (.csv or .json), or - for CSV on stdout'
+        )
+
+    def handle(self, *args, **options):
+        day = options['date'] or timezone.localdate()
+        rows = reconcile(
+            day, branch_ids=options['branches'], processes=options['processes'], cash=not options['skip_cash'],
+            progress=lambda done, total: self.stderr.write(f'{done}/{total} branches', ending='\r'),
+        )
+        
+        output = options['output']
+        stream = sys.stdout if output == '-' else open(output, 'w', newline='')
+        try:
+            if output.endswith('.json'):
+                json.dump({'date': day, 'discrepancies': rows}, stream, cls=DjangoJSONEncoder, indent=2)
+            else:
+                writer = csv.DictWriter(stream, REPORT_COLUMNS)
+                writer.writeheader()
+                writer.writerows(rows)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+        
+        message = f'{len(rows)} discrepancies on {day:%Y-%m-%d}'
+        self.stderr.write(self.style.SUCCESS(message) if not rows else self.style.WARNING(message))
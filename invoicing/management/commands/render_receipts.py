@@ -0,0 +1,110 @@
+import sys
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from invoicing.archive import METALS
+from invoicing.receipts import ARCHIVE_FORMATS, CONTENT_TYPES, pdf_available, render_batch
+
+class Command(BaseCommand):
+    help = 'Render invoice receipts in bulk into a zip or tar archive, over a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output',
+            help='Archive path (.zip, .tar or .tar.gz), or - for stdout'
+        )
+        parser.add_argument(
+            '--metal',
+            choices=list(METALS),
+            help='Only render one metal (default: both)'
+        )
+        parser.add_argument(
+            '--ids',
+            type=int,
+            nargs='+',
+            help='Invoice ids to render (with --metal)'
+        )
+        parser.add_argument(
+            '--date-from',
+            type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+            help='First invoice day, YYYY-MM-DD'
+        )
+        parser.add_argument(
+            '--date-to',
+            type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+            help='Last invoice day, YYYY-MM-DD'
+        )
+        parser.add_argument(
+            '--output-format',
+            choices=list(CONTENT_TYPES),
+            default='html',
+            help='Document format'
+        )
+        parser.add_argument(
+            '--archive',
+            choices=list(ARCHIVE_FORMATS),
+            help='Archive format (default: from the output suffix, zip for stdout)'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            help='Worker processes (default: CPU count)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=200,
+            help='Invoices rendered per worker task'
+        )
+
+    def handle(self, *args, **options):
+        if options['ids'] and not options['metal']:
+            raise CommandError('--ids needs --metal')
+        if options['output_format'] == 'pdf' and not pdf_available():
+            raise CommandError('Rendering PDF receipts needs weasyprint or wkhtmltopdf')
+        
+        output = options['output']
+        archive_format = options['archive'] or next(
+            (name for name in ('tar.gz', 'tar', 'zip') if output.endswith('.' + name)), 'zip'
+        )
+        ids_by_metal = self._ids(options)
+        
+        total = sum(len(ids) for ids in ids_by_metal.values())
+        stream = sys.stdout.buffer if output == '-' else open(output, 'wb')
+        try:
+            written = render_batch(
+                ids_by_metal, options['output_format'], stream, archive_format,
+                processes=options['processes'], chunk_size=options['chunk_size'],
+                progress=lambda done: self.stderr.write(f'{done}/{total}', ending='\r'),
+            )
+        finally:
+            if stream is not sys.stdout.buffer:
+                stream.close()
+        
+        self.stderr.write(self.style.SUCCESS(f'Rendered {written} receipts into {output}'))
+
+    def _ids(self, options):
+        metals = [options['metal']] if options['metal'] else list(METALS)
+        if options['ids']:
+            return {options['metal']: options['ids']}
+        
+        tz = timezone.get_current_timezone()
+        ids_by_metal = {}
+        for metal in metals:
+            invoice_model, _, archived_invoice_model, _ = METALS[metal]
+            ids = []
+            for model in (invoice_model, archived_invoice_model):
+                invoices = model.objects.all()
+                if options['date_from']:
+                    invoices = invoices.filter(
+                        created_date__gte=timezone.make_aware(datetime.combine(options['date_from'], time.min), tz)
+                    )
+                if options['date_to']:
+                    invoices = invoices.filter(
+                        created_date__lte=timezone.make_aware(datetime.combine(options['date_to'], time.max), tz)
+                    )
+                ids.extend(invoices.values_list('id', flat=True))
+            ids_by_metal[metal] = sorted(ids)
+        return ids_by_metal
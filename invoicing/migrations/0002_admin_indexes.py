@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_revokedtoken'),
+        ('core', '0003_warehousecashshard'),
+        ('invoicing', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goldinvoice',
+            index=models.Index(fields=['created_date'], name='gold_invoice_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goldinvoiceitem',
+            index=models.Index(fields=['vendor_name', 'id'], name='gold_invoice_item_vendor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goldinvoiceitem',
+            index=models.Index(fields=['item_carat', 'id'], name='gold_invoice_item_carat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverinvoice',
+            index=models.Index(fields=['created_date'], name='silver_invoice_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverinvoiceitem',
+            index=models.Index(fields=['vendor_name', 'id'], name='silver_invoice_item_vendor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverinvoiceitem',
+            index=models.Index(fields=['item_carat', 'id'], name='silver_invoice_item_carat_idx'),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_revokedtoken'),
+        ('core', '0003_warehousecashshard'),
+        ('invoicing', '0002_admin_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedGoldInvoice',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('gold_price_21', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('gold_price_24', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('transaction_type', models.CharField(choices=[('Cash', 'Cash'), ('Visa', 'Visa')], max_length=255)),
+                ('invoice_type', models.CharField(choices=[('Sale', 'Sale'), ('Return Packing', 'Return Packing'), ('Return Unpacking', 'Return Unpacking')], max_length=255)),
+                ('created_date', models.DateTimeField(db_index=True)),
+                ('branch', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='authentication.branch')),
+                ('created_by', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('customer', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.customer')),
+                ('seller', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.seller')),
+                ('warehouse', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.warehouse')),
+            ],
+            options={
+                'db_table': 'gold_invoice_archive',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedGoldInvoiceItem',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('item_name', models.CharField(max_length=255)),
+                ('item_weight', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_carat', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_stamp_enduser', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_quantity', models.IntegerField()),
+                ('item_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_total_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('vendor_name', models.CharField(max_length=255)),
+                ('invoice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='invoicing.archivedgoldinvoice')),
+            ],
+            options={
+                'db_table': 'gold_invoice_items_archive',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedSilverInvoice',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('silver_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('transaction_type', models.CharField(choices=[('Cash', 'Cash'), ('Visa', 'Visa')], max_length=255)),
+                ('invoice_type', models.CharField(choices=[('Sale', 'Sale'), ('Return Packing', 'Return Packing'), ('Return Unpacking', 'Return Unpacking')], max_length=255)),
+                ('created_date', models.DateTimeField(db_index=True)),
+                ('branch', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='authentication.branch')),
+                ('created_by', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('customer', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.customer')),
+                ('seller', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.seller')),
+                ('warehouse', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.warehouse')),
+            ],
+            options={
+                'db_table': 'silver_invoice_archive',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedSilverInvoiceItem',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('item_name', models.CharField(max_length=255)),
+                ('item_weight', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_carat', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_stamp_enduser', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_quantity', models.BigIntegerField()),
+                ('item_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_total_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('vendor_name', models.CharField(max_length=255)),
+                ('invoice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='invoicing.archivedsilverinvoice')),
+            ],
+            options={
+                'db_table': 'silver_invoice_items_archive',
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_revokedtoken'),
+        ('core', '0005_warehouse_cash_snapshots'),
+        ('invoicing', '0003_invoice_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goldinvoice',
+            index=models.Index(fields=['branch', 'created_date'], name='gold_invoice_branch_day_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverinvoice',
+            index=models.Index(fields=['branch', 'created_date'], name='silver_invoice_branch_day_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_revokedtoken'),
+        ('core', '0005_warehouse_cash_snapshots'),
+        ('invoicing', '0004_invoice_branch_day_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archivedgoldinvoice',
+            index=models.Index(fields=['customer', 'created_date', 'id'], name='gold_archive_customer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedsilverinvoice',
+            index=models.Index(fields=['customer', 'created_date', 'id'], name='silver_archive_customer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goldinvoice',
+            index=models.Index(fields=['customer', 'created_date', 'id'], name='gold_invoice_customer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='silverinvoice',
+            index=models.Index(fields=['customer', 'created_date', 'id'], name='silver_invoice_customer_idx'),
+        ),
+    ]
@@ -30,6 +30,13 @@ class GoldInvoice(models.Model):
     
     class Meta:
         db_table = 'gold_invoice'
+        indexes = [
+            models.Index(fields=['created_date'], name='gold_invoice_created_idx'),
+            # Per-branch day ranges (reconciliation)
+            models.Index(fields=['branch', 'created_date'], name='gold_invoice_branch_day_idx'),
+            # Customer purchase history, newest first (invoicing.history)
+            models.Index(fields=['customer', 'created_date', 'id'], name='gold_invoice_customer_idx'),
+        ]
     
     def __str__(self):
         return f"Gold Invoice #{self.id} - {self.customer.name}"
@@ -49,6 +56,11 @@ class GoldInvoiceItem(models.Model):
     
     class Meta:
         db_table = 'gold_invoice_items'
+        indexes = [
+            # Admin filters, ordered by id within each value
+            models.Index(fields=['vendor_name', 'id'], name='gold_invoice_item_vendor_idx'),
+            models.Index(fields=['item_carat', 'id'], name='gold_invoice_item_carat_idx'),
+        ]
     
     def __str__(self):
         return f"{self.item_name} - Invoice #{self.invoice.id}"
@@ -80,6 +92,13 @@ class SilverInvoice(models.Model):
     
     class Meta:
         db_table = 'silver_invoice'
+        indexes = [
+            models.Index(fields=['created_date'], name='silver_invoice_created_idx'),
+            # Per-branch day ranges (reconciliation)
+            models.Index(fields=['branch', 'created_date'], name='silver_invoice_branch_day_idx'),
+            # Customer purchase history, newest first (invoicing.history)
+            models.Index(fields=['customer', 'created_date', 'id'], name='silver_invoice_customer_idx'),
+        ]
     
     def __str__(self):
         return f"Silver Invoice #{self.id} - {self.customer.name}"
@@ -99,6 +118,103 @@ class SilverInvoiceItem(models.Model):
     
     class Meta:
         db_table = 'silver_invoice_items'
+        indexes = [
+            # Admin filters, ordered by id within each value
+            models.Index(fields=['vendor_name', 'id'], name='silver_invoice_item_vendor_idx'),
+            models.Index(fields=['item_carat', 'id'], name='silver_invoice_item_carat_idx'),
+        ]
     
     def __str__(self):
         return f"{self.item_name} - Invoice #{self.invoice.id}"
+
+# Archive tables - invoices older than INVOICE_HOT_RETENTION_DAYS are moved
+# here by the archive_invoices command, keeping their ids. Relations have no
+# database constraint so archived rows never block deletes elsewhere.
+class ArchivedGoldInvoice(models.Model):
+    """Archived gold invoice - NO soft delete"""
+    
+    id = models.BigIntegerField(primary_key=True)
+    warehouse = models.ForeignKey('core.Warehouse', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    seller = models.ForeignKey('core.Seller', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    branch = models.ForeignKey('authentication.Branch', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    customer = models.ForeignKey('core.Customer', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    gold_price_21 = models.DecimalField(max_digits=10, decimal_places=2)
+    gold_price_24 = models.DecimalField(max_digits=10, decimal_places=2)
+    total_price = models.DecimalField(max_digits=10, decimal_places=2)
+    transaction_type = models.CharField(max_length=255, choices=GoldInvoice.TRANSACTION_TYPE_CHOICES)
+    invoice_type = models.CharField(max_length=255, choices=GoldInvoice.INVOICE_TYPE_CHOICES)
+    created_date = models.DateTimeField(db_index=True)
+    created_by = models.ForeignKey('authentication.User', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    
+    class Meta:
+        db_table = 'gold_invoice_archive'
+        indexes = [
+            models.Index(fields=['customer', 'created_date', 'id'], name='gold_archive_customer_idx'),
+        ]
+    
+    def __str__(self):
+        return f"Gold Invoice #{self.id} (archived)"
+
+class ArchivedGoldInvoiceItem(models.Model):
+    """Archived gold invoice item - NO soft delete"""
+    
+    id = models.BigIntegerField(primary_key=True)
+    invoice = models.ForeignKey(ArchivedGoldInvoice, on_delete=models.CASCADE, related_name='items')
+    item_name = models.CharField(max_length=255)
+    item_weight = models.DecimalField(max_digits=10, decimal_places=2)
+    item_carat = models.DecimalField(max_digits=10, decimal_places=2)
+    item_stamp_enduser = models.DecimalField(max_digits=10, decimal_places=2)
+    item_quantity = models.IntegerField()
+    item_price = models.DecimalField(max_digits=10, decimal_places=2)
+    item_total_price = models.DecimalField(max_digits=10, decimal_places=2)
+    vendor_name = models.CharField(max_length=255)
+    
+    class Meta:
+        db_table = 'gold_invoice_items_archive'
+    
+    def __str__(self):
+        return f"{self.item_name} - Invoice #{self.invoice_id} (archived)"
+
+class ArchivedSilverInvoice(models.Model):
+    """Archived silver invoice - NO soft delete"""
+    
+    id = models.BigIntegerField(primary_key=True)
+    warehouse = models.ForeignKey('core.Warehouse', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    seller = models.ForeignKey('core.Seller', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    branch = models.ForeignKey('authentication.Branch', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    customer = models.ForeignKey('core.Customer', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    silver_price = models.DecimalField(max_digits=10, decimal_places=2)
+    total_price = models.DecimalField(max_digits=10, decimal_places=2)
+    transaction_type = models.CharField(max_length=255, choices=SilverInvoice.TRANSACTION_TYPE_CHOICES)
+    invoice_type = models.CharField(max_length=255, choices=SilverInvoice.INVOICE_TYPE_CHOICES)
+    created_date = models.DateTimeField(db_index=True)
+    created_by = models.ForeignKey('authentication.User', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    
+    class Meta:
+        db_table = 'silver_invoice_archive'
+        indexes = [
+            models.Index(fields=['customer', 'created_date', 'id'], name='silver_archive_customer_idx'),
+        ]
+    
+    def __str__(self):
+        return f"Silver Invoice #{self.id} (archived)"
+
+class ArchivedSilverInvoiceItem(models.Model):
+    """Archived silver invoice item - NO soft delete"""
+    
+    id = models.BigIntegerField(primary_key=True)
+    invoice = models.ForeignKey(ArchivedSilverInvoice, on_delete=models.CASCADE, related_name='items')
+    item_name = models.CharField(max_length=255)
+    item_weight = models.DecimalField(max_digits=10, decimal_places=2)
+    item_carat = models.DecimalField(max_digits=10, decimal_places=2)
+    item_stamp_enduser = models.DecimalField(max_digits=10, decimal_places=2)
+    item_quantity = models.BigIntegerField()
+    item_price = models.DecimalField(max_digits=10, decimal_places=2)
+    item_total_price = models.DecimalField(max_digits=10, decimal_places=2)
+    vendor_name = models.CharField(max_length=255)
+    
+    class Meta:
+        db_table = 'silver_invoice_items_archive'
+    
+    def __str__(self):
+        return f"{self.item_name} - Invoice #{self.invoice_id} (archived)"
@@ -0,0 +1,227 @@
+import os
+import shutil
+import subprocess
+import tarfile
+import time
+import zipfile
+from collections import deque
+from contextlib import contextmanager
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Prefetch
+from django.template.loader import get_template
+
+from core.parallel import process_pool
+from .archive import METALS
+
+try:
+    import weasyprint
+except ImportError:  # Optional, wkhtmltopdf is used when installed
+    weasyprint = None
+
+TEMPLATE_NAME = 'invoicing/receipt.html'
+
+CACHE_KEY = 'receipt:{}:{}:{}:{}'
+
+# Bumped when a branch, warehouse, seller or customer shown on receipts changes
+VERSION_KEY = 'receipt:version'
+
+CONTENT_TYPES = {'html': 'text/html; charset=utf-8', 'pdf': 'application/pdf'}
+
+ARCHIVE_FORMATS = {'zip': None, 'tar': 'w|', 'tar.gz': 'w|gz'}
+
+
+def receipt_options():
+    options = {'CACHE': None, 'CACHE_TTL': 86400, 'WKHTMLTOPDF': 'wkhtmltopdf'}
+    options.update(getattr(settings, 'RECEIPTS', {}))
+    return options
+
+
+def _cache():
+    # Only a cache shared by every process can be invalidated on writes
+    alias = receipt_options()['CACHE']
+    return caches[alias] if alias else None
+
+
+def _version(cache):
+    # A fresh version never reuses a number whose documents may still be cached
+    return cache.get_or_set(VERSION_KEY, lambda: time.time_ns() // 1000, None)
+
+
+def _template():
+    # Compiled once per process by the cached template loader
+    return get_template(TEMPLATE_NAME)
+
+
+def load_invoices(metal, ids):
+    """{id: invoice with its items} from the hot and archive tables
+
+    Branch, warehouse and seller come from the reference cache.
+    """
+    invoice_model, item_model, archived_invoice_model, archived_item_model = METALS[metal]
+    invoices = {}
+    for model, items in ((invoice_model, item_model), (archived_invoice_model, archived_item_model)):
+        missing = [pk for pk in ids if pk not in invoices]
+        if not missing:
+            break
+        rows = model.objects.filter(id__in=missing).select_related('customer').prefetch_related(
+            Prefetch('items', queryset=items.objects.order_by('id'))
+        )
+        invoices.update((invoice.id, invoice) for invoice in rows)
+    return invoices
+
+
+def invoice_branch_id(metal, invoice_id):
+    """Branch of an invoice in the hot or archive table, None if it does not exist"""
+    invoice_model, _, archived_invoice_model, _ = METALS[metal]
+    for model in (invoice_model, archived_invoice_model):
+        branch_id = model.objects.filter(id=invoice_id).values_list('branch_id', flat=True).first()
+        if branch_id is not None:
+            return branch_id
+    return None
+
+
+def render_html(metal, invoice):
+    """Receipt of a loaded invoice as HTML bytes"""
+    if metal == 'gold':
+        title, carat_unit = 'Gold Receipt', 'K'
+        prices = [('Gold 21K', invoice.gold_price_21), ('Gold 24K', invoice.gold_price_24)]
+    else:
+        title, carat_unit = 'Silver Receipt', ''
+        prices = [('Silver', invoice.silver_price)]
+    return _template().render({
+        'title': title,
+        'invoice': invoice,
+        'items': invoice.items.all(),
+        'prices': prices,
+        'carat_unit': carat_unit,
+    }).encode()
+
+
+def html_to_pdf(html):
+    """PDF bytes from HTML with the locally installed renderer"""
+    if weasyprint is not None:
+        return weasyprint.HTML(string=html.decode()).write_pdf()
+    binary = shutil.which(receipt_options()['WKHTMLTOPDF'])
+    if binary is None:
+        raise ImproperlyConfigured('Rendering PDF receipts needs weasyprint or wkhtmltopdf')
+    return subprocess.run(
+        [binary, '--quiet', '--encoding', 'utf-8', '-', '-'], input=html, capture_output=True, check=True
+    ).stdout
+
+
+def pdf_available():
+    return weasyprint is not None or shutil.which(receipt_options()['WKHTMLTOPDF']) is not None
+
+
+def render_receipts(metal, ids, fmt='html'):
+    """{id: document bytes} for the invoices that exist
+
+    With RECEIPTS['CACHE'] naming a shared cache alias documents are cached
+    per invoice and format, else every call renders.
+    """
+    cache = _cache()
+    documents = {}
+    if cache is not None:
+        version = _version(cache)
+        keys = {CACHE_KEY.format(metal, pk, fmt, version): pk for pk in ids}
+        documents = {keys[key]: document for key, document in cache.get_many(keys).items()}
+
+    missing = [pk for pk in ids if pk not in documents]
+    if missing:
+        rendered = {}
+        for pk, invoice in load_invoices(metal, missing).items():
+            document = render_html(metal, invoice)
+            rendered[pk] = html_to_pdf(document) if fmt == 'pdf' else document
+        if cache is not None:
+            cache.set_many({
+                CACHE_KEY.format(metal, pk, fmt, version): document for pk, document in rendered.items()
+            }, receipt_options()['CACHE_TTL'])
+        documents.update(rendered)
+    return documents
+
+
+def render_receipt(metal, invoice_id, fmt='html'):
+    """Document bytes of one invoice, or None if it does not exist"""
+    return render_receipts(metal, [invoice_id], fmt).get(invoice_id)
+
+
+def forget_receipts(metal, invoice_id):
+    """Drop the cached documents of an invoice after it changed"""
+    cache = _cache()
+    if cache is not None:
+        version = _version(cache)
+        cache.delete_many([CACHE_KEY.format(metal, invoice_id, fmt, version) for fmt in CONTENT_TYPES])
+
+
+def forget_all_receipts():
+    """Orphan every cached document, e.g. after a branch or seller was renamed"""
+    cache = _cache()
+    if cache is not None:
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            _version(cache)
+
+
+def entry_name(metal, invoice_id, fmt):
+    return f'{metal}/receipt-{invoice_id}.{fmt}'
+
+
+def _render_chunk(metal, ids, fmt):
+    return sorted(render_receipts(metal, ids, fmt).items())
+
+
+def render_batch(ids_by_metal, fmt, stream, archive_format='zip', processes=None, chunk_size=200,
+                 progress=None):
+    """Render receipts over a process pool into a zip or tar archive on stream
+
+    ids_by_metal maps a metal to the invoice ids to render. Chunks of ids
+    are rendered by the pool workers and written to the archive in order as
+    they come back; only a few chunks per worker are in flight, so memory
+    stays bounded and a non seekable stream is fine. progress, if given, is
+    called with the number of documents written so far. Returns that number.
+    """
+    chunks = deque(
+        (metal, ids[start:start + chunk_size])
+        for metal, ids in ids_by_metal.items() for start in range(0, len(ids), chunk_size)
+    )
+    written = 0
+    processes = processes or os.cpu_count() or 1
+    window = 2 * processes
+    with open_archive(stream, archive_format) as add, process_pool(processes) as pool:
+        pending = deque()
+        while chunks or pending:
+            while chunks and len(pending) < window:
+                metal, ids = chunks.popleft()
+                pending.append((metal, pool.submit(_render_chunk, metal, ids, fmt)))
+            metal, future = pending.popleft()
+            for pk, document in future.result():
+                add(entry_name(metal, pk, fmt), document)
+                written += 1
+            if progress is not None:
+                progress(written)
+    return written
+
+
+@contextmanager
+def open_archive(stream, archive_format):
+    """Yield add(name, data) writing members of a zip or tar archive to stream"""
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f'Unknown archive format: {archive_format}')
+
+    if archive_format == 'zip':
+        with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as archive:
+            yield archive.writestr
+        return
+
+    with tarfile.open(fileobj=stream, mode=ARCHIVE_FORMATS[archive_format]) as archive:
+        def add(name, data):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            archive.addfile(info, BytesIO(data))
+        yield add
@@ -0,0 +1,225 @@
+import os
+from concurrent.futures import as_completed
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from authentication.models import Branch
+from core.cash import cash_balance
+from core.models import Warehouse, WarehouseCashSnapshot
+from core.parallel import process_pool
+from .archive import METALS, invoice_sources
+from .reports import day_range
+
+CHECKS = ['invoice_total', 'item_total', 'warehouse_cash']
+
+REPORT_COLUMNS = [
+    'check', 'metal', 'branch_id', 'warehouse_id', 'invoice_id', 'item_id', 'expected', 'actual', 'difference',
+]
+
+# Differences below half a cent are rounding noise from databases that sum
+# decimals as floats (SQLite)
+TOLERANCE = Decimal('0.005')
+
+TWO_PLACES = Decimal('0.01')
+
+MONEY = DecimalField(max_digits=14, decimal_places=2)
+
+
+def _money(value):
+    return Decimal(value or 0).quantize(TWO_PLACES)
+
+
+def _off(column):
+    return Q(**{f'{column}__gt': TOLERANCE}) | Q(**{f'{column}__lt': -TOLERANCE})
+
+
+def _row(check, metal, branch_id, expected, actual, warehouse_id=None, invoice_id=None, item_id=None):
+    expected, actual = _money(expected), _money(actual)
+    return {
+        'check': check,
+        'metal': metal,
+        'branch_id': branch_id,
+        'warehouse_id': warehouse_id,
+        'invoice_id': invoice_id,
+        'item_id': item_id,
+        'expected': expected,
+        'actual': actual,
+        'difference': actual - expected,
+    }
+
+
+def invoice_total_mismatches(metal, branch_id, start, end):
+    """Invoices whose total_price is not the sum of their items' item_total_price"""
+    rows = []
+    for invoice_model, _ in invoice_sources(metal, start):
+        invoices = (
+            invoice_model.objects.filter(branch_id=branch_id, created_date__gte=start, created_date__lt=end)
+            .annotate(items_total=Coalesce(Sum('items__item_total_price'), Value(0), output_field=MONEY))
+            .annotate(difference=ExpressionWrapper(F('total_price') - F('items_total'), output_field=MONEY))
+            .filter(_off('difference'))
+            .values_list('id', 'warehouse_id', 'items_total', 'total_price')
+        )
+        rows.extend(
+            _row('invoice_total', metal, branch_id, expected, actual, warehouse_id=warehouse_id, invoice_id=pk)
+            for pk, warehouse_id, expected, actual in invoices
+        )
+    return rows
+
+
+def item_total_mismatches(metal, branch_id, start, end):
+    """Items whose item_total_price is not item_price x item_quantity"""
+    rows = []
+    for _, item_model in invoice_sources(metal, start):
+        items = (
+            item_model.objects.filter(
+                invoice__branch_id=branch_id, invoice__created_date__gte=start, invoice__created_date__lt=end
+            )
+            .annotate(expected=ExpressionWrapper(F('item_price') * F('item_quantity'), output_field=MONEY))
+            .annotate(difference=ExpressionWrapper(F('item_total_price') - F('expected'), output_field=MONEY))
+            .filter(_off('difference'))
+            .values_list('id', 'invoice_id', 'invoice__warehouse_id', 'expected', 'item_total_price')
+        )
+        rows.extend(
+            _row('item_total', metal, branch_id, expected, actual,
+                 warehouse_id=warehouse_id, invoice_id=invoice_id, item_id=pk)
+            for pk, invoice_id, warehouse_id, expected, actual in items
+        )
+    return rows
+
+
+def _cash_flows(warehouses, as_of):
+    # {warehouse_id: cash taken by sales minus cash paid out for returns}
+    # over Cash invoices created after each warehouse's opening snapshot
+    opened = {w.pk: w.opened_at for w in warehouses if w.opened_at is not None}
+    if not opened:
+        return {}
+    window = Q()
+    for warehouse_id, opened_at in opened.items():
+        window |= Q(warehouse_id=warehouse_id, created_date__gt=opened_at)
+
+    flows = dict.fromkeys(opened, Decimal('0'))
+    for metal in METALS:
+        for invoice_model, _ in invoice_sources(metal, min(opened.values())):
+            rows = (
+                invoice_model.objects.filter(window, transaction_type='Cash', created_date__lte=as_of)
+                .values('warehouse_id')
+                .annotate(
+                    cash_in=Sum('total_price', filter=Q(invoice_type='Sale')),
+                    cash_out=Sum('total_price', filter=~Q(invoice_type='Sale')),
+                )
+                .order_by()
+            )
+            for row in rows:
+                flows[row['warehouse_id']] += _money(row['cash_in']) - _money(row['cash_out'])
+    return flows
+
+
+def _snapshot_isolation():
+    # Later statements of the transaction see the same data as the first;
+    # a SQLite read transaction already does. Only possible as the first
+    # statement of the outermost transaction.
+    if connection.vendor == 'postgresql' and len(connection.atomic_blocks) == 1:
+        with connection.cursor() as cursor:
+            cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+
+
+def warehouse_cash_mismatches(branch_id, record=True):
+    """Warehouses whose cash moved by something other than their cash invoices
+
+    The balance now (Warehouse.cash plus pending shards) is compared with the
+    last snapshot plus the Cash invoices created since, sales adding and
+    returns paying out. Balances and invoices are read in one snapshot, and
+    its time is the cut-off of the invoice window and the taken_at of the
+    new snapshot, recorded as the next opening balance; a warehouse without
+    one only gets its first snapshot.
+    """
+    latest = WarehouseCashSnapshot.objects.filter(warehouse=OuterRef('pk')).order_by('-taken_at')
+    with transaction.atomic():
+        _snapshot_isolation()
+        warehouses = list(
+            Warehouse.objects.filter(branch_id=branch_id)
+            .annotate(
+                shard_cash=Coalesce(Sum('cash_shards__amount'), Value(0), output_field=MONEY),
+                opening=Subquery(latest.values('balance')[:1]),
+                opened_at=Subquery(latest.values('taken_at')[:1]),
+            )
+            .order_by('id')
+        )
+        as_of = timezone.now()
+        flows = _cash_flows(warehouses, as_of)
+
+    rows = []
+    balances = {}
+    for warehouse in warehouses:
+        balances[warehouse.pk] = cash_balance(warehouse)
+        if warehouse.opened_at is None:
+            continue
+        expected = warehouse.opening + flows[warehouse.pk]
+        if abs(balances[warehouse.pk] - expected) > TOLERANCE:
+            rows.append(_row('warehouse_cash', None, branch_id, expected, balances[warehouse.pk],
+                             warehouse_id=warehouse.pk))
+
+    # Written after the read snapshot, which a SQLite read transaction could
+    # not upgrade to a write without conflicting with concurrent writers
+    if record and balances:
+        with transaction.atomic():
+            WarehouseCashSnapshot.objects.bulk_create([
+                WarehouseCashSnapshot(warehouse_id=pk, balance=balance, taken_at=as_of)
+                for pk, balance in balances.items()
+            ])
+    return rows
+
+
+def reconcile_branch(branch_id, start, end, cash=True, record=True):
+    """Discrepancies of one branch: invoices created in [start, end), cash up to now"""
+    rows = []
+    for metal in METALS:
+        rows.extend(invoice_total_mismatches(metal, branch_id, start, end))
+        rows.extend(item_total_mismatches(metal, branch_id, start, end))
+    if cash:
+        rows.extend(warehouse_cash_mismatches(branch_id, record=record))
+    return rows
+
+
+def reconcile(day, branch_ids=None, processes=None, cash=True, record=True, progress=None):
+    """Reconcile the invoices of one day across branches, one branch per pool task
+
+    Every check is a grouped query per branch and metal, so a branch costs a
+    handful of index range scans however many invoices it has. The cash
+    check compares the current balances, so it belongs to the run at the end
+    of the trading day; pass cash=False when re-checking an earlier day.
+    progress, if given, is called with (branches done, branch count).
+    Returns the discrepancy rows ordered by branch, check and ids.
+    """
+    start, end = day_range(day, day)
+    if branch_ids is None:
+        branch_ids = list(Branch.all_objects.order_by('id').values_list('id', flat=True))
+    processes = processes or os.cpu_count() or 1
+
+    rows = []
+    if processes == 1 or len(branch_ids) <= 1:
+        for done, branch_id in enumerate(branch_ids, 1):
+            rows.extend(reconcile_branch(branch_id, start, end, cash, record))
+            if progress is not None:
+                progress(done, len(branch_ids))
+    else:
+        with process_pool(min(processes, len(branch_ids))) as pool:
+            futures = [
+                pool.submit(reconcile_branch, branch_id, start, end, cash, record)
+                for branch_id in branch_ids
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                rows.extend(future.result())
+                if progress is not None:
+                    progress(done, len(branch_ids))
+
+    order = {check: index for index, check in enumerate(CHECKS)}
+    rows.sort(key=lambda row: (
+        row['branch_id'], order[row['check']], row['metal'] or '', row['warehouse_id'] or 0,
+        row['invoice_id'] or 0, row['item_id'] or 0,
+    ))
+    return rows
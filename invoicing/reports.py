@@ -0,0 +1,162 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from core.concurrency import SingleFlight
+from .archive import METALS, invoice_sources
+
+# Grouping column and display column for each report dimension. Invoice-level
+# dimensions aggregate the invoice table, item-level ones the items table.
+DIMENSIONS = {
+    'branch': ('invoice', 'branch_id', 'branch__name'),
+    'seller': ('invoice', 'seller_id', 'seller__name'),
+    'warehouse': ('invoice', 'warehouse_id', 'warehouse__code'),
+    'vendor': ('item', 'vendor_name', None),
+    'carat': ('item', 'item_carat', None),
+}
+
+VERSION_KEY = 'sales-report:version:{}'
+
+# Cache backends whose entries no other process can read
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+TWO_PLACES = Decimal('0.01')
+
+_single_flight = SingleFlight()
+
+
+def bump_version(branch_id):
+    """Invalidate cached reports that include the given branch"""
+    for scope in ('all', branch_id):
+        key = VERSION_KEY.format(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+
+def shared_cache():
+    """Whether the default cache, which holds the reports, is shared by all processes"""
+    return settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES
+
+
+def _version(scope):
+    return cache.get_or_set(VERSION_KEY.format(scope), 1, None)
+
+
+def _money(value):
+    # Same rendering as the DecimalField(decimal_places=2) serializer fields
+    return str(Decimal(value or 0).quantize(TWO_PLACES))
+
+
+def day_range(date_from, date_to):
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(date_from, time.min), tz)
+    end = timezone.make_aware(datetime.combine(date_to + timedelta(days=1), time.min), tz)
+    return start, end
+
+
+def _grouped_rows(invoice_model, item_model, source, key, label, start, end, branch_id, scope_to_branch,
+                  invoice_type):
+    if source == 'invoice':
+        rows = invoice_model.objects.filter(created_date__gte=start, created_date__lt=end)
+        if invoice_type:
+            rows = rows.filter(invoice_type=invoice_type)
+        if scope_to_branch:
+            rows = rows.filter(branch_id=branch_id)
+        return (
+            rows.annotate(day=TruncDay('created_date'))
+            .values('day', key, label)
+            .annotate(invoice_count=Count('id'), total_amount=Sum('total_price'))
+        )
+
+    rows = item_model.objects.filter(invoice__created_date__gte=start, invoice__created_date__lt=end)
+    if invoice_type:
+        rows = rows.filter(invoice__invoice_type=invoice_type)
+    if scope_to_branch:
+        rows = rows.filter(invoice__branch_id=branch_id)
+    return (
+        rows.annotate(day=TruncDay('invoice__created_date'))
+        .values('day', key)
+        .annotate(
+            invoice_count=Count('invoice_id', distinct=True),
+            item_quantity=Sum('item_quantity'),
+            total_amount=Sum('item_total_price'),
+        )
+    )
+
+
+def _aggregate(metal, dimension, start, end, branch_id, scope_to_branch, invoice_type):
+    source, key, label = DIMENSIONS[dimension]
+
+    # Hot and archived invoices never share an id, so per-group counts and
+    # sums from both storages simply add up
+    merged = {}
+    for invoice_model, item_model in invoice_sources(metal, start):
+        rows = _grouped_rows(invoice_model, item_model, source, key, label,
+                             start, end, branch_id, scope_to_branch, invoice_type)
+        for row in rows.order_by():
+            group = (row['day'], row[key])
+            if group not in merged:
+                merged[group] = row
+                continue
+            total = merged[group]
+            for field in ('invoice_count', 'item_quantity', 'total_amount'):
+                if field in row:
+                    total[field] = (total[field] or 0) + (row[field] or 0)
+
+    results = []
+    for (day, value), row in sorted(merged.items(), key=lambda group: group[0]):
+        value = _money(value) if isinstance(value, Decimal) else value
+        entry = {
+            'day': day.date().isoformat(),
+            'key': value,
+            'label': row[label] if label else value,
+            'invoice_count': row['invoice_count'],
+            'total_amount': _money(row['total_amount']),
+        }
+        if 'item_quantity' in row:
+            entry['item_quantity'] = row['item_quantity']
+        results.append(entry)
+    return results
+
+
+def sales_report(dimension, date_from, date_to, branch_id=None, invoice_type='Sale', scope_to_branch=False):
+    """Daily sales totals grouped by dimension, one grouped query per metal
+
+    Ranges reaching back into archived invoices also query the archive
+    tables. Results are cached until the next invoice in the same scope is
+    written (see invoicing.signals) and concurrent identical requests share a
+    single computation. With scope_to_branch the report only covers
+    branch_id, and is empty when that is None.
+    """
+    if dimension not in DIMENSIONS:
+        raise ValueError(f'Unknown report dimension: {dimension}')
+
+    scope_to_branch = scope_to_branch or branch_id is not None
+    scope = branch_id if scope_to_branch else 'all'
+    cache_key = 'sales-report:{}:{}:{}:{}:{}:{}'.format(
+        dimension, date_from.isoformat(), date_to.isoformat(),
+        scope, (invoice_type or 'all').replace(' ', '_'), _version(scope)
+    )
+
+    def compute():
+        report = cache.get(cache_key)
+        if report is None:
+            start, end = day_range(date_from, date_to)
+            report = {
+                metal: _aggregate(metal, dimension, start, end, branch_id, scope_to_branch, invoice_type)
+                for metal in METALS
+            }
+            cache.set(cache_key, report, getattr(settings, 'SALES_REPORT_CACHE_TTL', 300))
+        return report
+
+    return _single_flight.do(cache_key, compute)
@@ -0,0 +1,47 @@
+from rest_framework import serializers
+from .models import GoldInvoice, GoldInvoiceItem, SilverInvoice, SilverInvoiceItem
+
+ITEM_FIELDS = ['id', 'item_name', 'item_weight', 'item_carat', 'item_stamp_enduser', 'item_quantity',
+               'item_price', 'item_total_price', 'vendor_name']
+
+INVOICE_FIELDS = ['id', 'branch', 'branch_name', 'warehouse', 'warehouse_code', 'seller', 'seller_name',
+                  'customer', 'total_price', 'transaction_type', 'invoice_type', 'created_date']
+
+
+class GoldInvoiceItemSerializer(serializers.ModelSerializer):
+    """Gold invoice item serializer"""
+    
+    class Meta:
+        model = GoldInvoiceItem
+        fields = ITEM_FIELDS
+
+class SilverInvoiceItemSerializer(serializers.ModelSerializer):
+    """Silver invoice item serializer"""
+    
+    class Meta:
+        model = SilverInvoiceItem
+        fields = ITEM_FIELDS
+
+class GoldInvoiceSerializer(serializers.ModelSerializer):
+    """Gold invoice serializer, also used for archived gold invoices"""
+    
+    branch_name = serializers.CharField(source='branch.name', read_only=True)
+    warehouse_code = serializers.CharField(source='warehouse.code', read_only=True)
+    seller_name = serializers.CharField(source='seller.name', read_only=True)
+    items = GoldInvoiceItemSerializer(many=True, read_only=True)
+    
+    class Meta:
+        model = GoldInvoice
+        fields = INVOICE_FIELDS + ['gold_price_21', 'gold_price_24', 'items']
+
+class SilverInvoiceSerializer(serializers.ModelSerializer):
+    """Silver invoice serializer, also used for archived silver invoices"""
+    
+    branch_name = serializers.CharField(source='branch.name', read_only=True)
+    warehouse_code = serializers.CharField(source='warehouse.code', read_only=True)
+    seller_name = serializers.CharField(source='seller.name', read_only=True)
+    items = SilverInvoiceItemSerializer(many=True, read_only=True)
+    
+    class Meta:
+        model = SilverInvoice
+        fields = INVOICE_FIELDS + ['silver_price', 'items']
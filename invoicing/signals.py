@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import Branch
+from core.models import Customer, Seller, Warehouse
+from .models import GoldInvoice, GoldInvoiceItem, SilverInvoice, SilverInvoiceItem
+from .receipts import forget_all_receipts, forget_receipts
+from .reports import bump_version
+
+METAL_OF = {
+    GoldInvoice: 'gold', GoldInvoiceItem: 'gold',
+    SilverInvoice: 'silver', SilverInvoiceItem: 'silver',
+}
+
+
+@receiver([post_save, post_delete], sender=GoldInvoice)
+@receiver([post_save, post_delete], sender=SilverInvoice)
+def invoice_changed(sender, instance, **kwargs):
+    """Invalidate cached sales reports for the invoice's branch, and its receipts"""
+    bump_version(instance.branch_id)
+    forget_receipts(METAL_OF[sender], instance.id)
+
+
+@receiver([post_save, post_delete], sender=GoldInvoiceItem)
+@receiver([post_save, post_delete], sender=SilverInvoiceItem)
+def invoice_item_changed(sender, instance, **kwargs):
+    """Invalidate cached sales reports for the item's invoice branch, and its receipts"""
+    bump_version(instance.invoice.branch_id)
+    forget_receipts(METAL_OF[sender], instance.invoice_id)
+
+
+@receiver(post_save, sender=Branch)
+@receiver(post_save, sender=Warehouse)
+@receiver(post_save, sender=Seller)
+@receiver(post_save, sender=Customer)
+def receipt_party_changed(sender, instance, created, **kwargs):
+    """Invalidate all cached receipts when a name or code printed on them may have changed
+
+    Again on commit, in case another request cached a receipt with the old
+    value between the write and the commit.
+    """
+    if created:
+        return
+    forget_all_receipts()
+    transaction.on_commit(forget_all_receipts)
@@ -0,0 +1,53 @@
+from datetime import date, timedelta
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from jobs.registry import task
+from .archive import METALS, archive_chunk, retention_cutoff
+from .reconciliation import reconcile
+from .reports import DIMENSIONS, sales_report, shared_cache
+
+
+@task(name='invoicing.archive_invoices')
+def archive_invoices(job, days=None, chunk_size=500):
+    """Move invoices older than the hot retention window to the archive"""
+    cutoff = retention_cutoff(days)
+    archived = {}
+    for index, metal in enumerate(METALS):
+        archived[metal] = 0
+        while True:
+            moved = archive_chunk(metal, cutoff, chunk_size=chunk_size)
+            if not moved:
+                break
+            archived[metal] += moved
+            job.set_progress(index * 100 // len(METALS), f'Archived {archived[metal]} {metal} invoices')
+    return archived
+
+
+@task(name='invoicing.warm_sales_reports', max_attempts=1)
+def warm_sales_reports(job, days=30, branch_id=None):
+    """Compute and cache the sales reports for the last N days
+
+    Only useful when the default cache is shared with the web processes,
+    so it refuses to run with a process-local one.
+    """
+    if not shared_cache():
+        raise ImproperlyConfigured('Warming sales reports needs a default cache shared by all processes')
+    date_to = timezone.localdate()
+    date_from = date_to - timedelta(days=days)
+    for index, dimension in enumerate(DIMENSIONS):
+        job.set_progress(index * 100 // len(DIMENSIONS), f'Building {dimension} report')
+        sales_report(dimension, date_from, date_to, branch_id=branch_id)
+    return {'dimensions': list(DIMENSIONS), 'date_from': date_from, 'date_to': date_to}
+
+
+@task(name='invoicing.reconcile')
+def reconcile_day(job, day=None, branch_ids=None, processes=None, cash=True):
+    """Reconcile one day's invoices (default today) and the warehouse cash"""
+    day = date.fromisoformat(day) if day else timezone.localdate()
+    rows = reconcile(
+        day, branch_ids=branch_ids, processes=processes, cash=cash,
+        progress=lambda done, total: job.set_progress(done * 100 // total, f'Reconciled {done}/{total} branches'),
+    )
+    return {'date': day, 'discrepancy_count': len(rows), 'discrepancies': rows}
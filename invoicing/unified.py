@@ -0,0 +1,31 @@
+from django.db.models import F
+
+from .models import GoldInvoice, SilverInvoice
+
+INVOICE_FIELDS = ['id', 'warehouse_id', 'branch_id', 'customer_id', 'customer_name', 'seller_name',
+                  'total_price', 'transaction_type', 'invoice_type', 'created_date']
+INVOICE_ORDERING = ['created_date']
+
+
+def invoice_querysets(branch_id=None, warehouse_id=None, customer_id=None, invoice_type=None,
+                      scope_to_branch=False):
+    """Gold and silver invoice querysets with matching columns
+
+    With scope_to_branch only invoices of branch_id are included, none when
+    it is None.
+    """
+    querysets = {'gold': GoldInvoice.objects.all(), 'silver': SilverInvoice.objects.all()}
+    for metal, invoices in querysets.items():
+        if scope_to_branch or branch_id:
+            invoices = invoices.filter(branch_id=branch_id)
+        if warehouse_id:
+            invoices = invoices.filter(warehouse_id=warehouse_id)
+        if customer_id:
+            invoices = invoices.filter(customer_id=customer_id)
+        if invoice_type:
+            invoices = invoices.filter(invoice_type=invoice_type)
+        querysets[metal] = invoices.annotate(
+            customer_name=F('customer__name'),
+            seller_name=F('seller__name'),
+        )
+    return querysets
@@ -0,0 +1,16 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    # Report endpoints
+    path('reports/sales/<str:dimension>/', views.sales_report_view, name='sales_report'),
+    
+    # Receipts
+    path('receipts/<str:metal>/<int:pk>/', views.invoice_receipt, name='invoice_receipt'),
+    
+    # Customer purchase history
+    path('customers/<int:pk>/history/', views.customer_purchase_history, name='customer_purchase_history'),
+    
+    # Unified gold + silver endpoints
+    path('unified/invoices/', views.unified_invoice_list, name='unified_invoice_list'),
+]
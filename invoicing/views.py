@@ -1,3 +1,173 @@
-from django.shortcuts import render
+from datetime import date, timedelta
 
-# Create your views here.
+from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from authentication.permissions import IsManagerOrAdmin, IsManagerWarehouseKeeperOrAdmin
+from core.models import Customer
+from core.pagination import decode_cursor, encode_cursor, id_param, page_limit
+from core.unified import metal_union, stream_union
+from .archive import METALS
+from .history import HISTORY_ORDERING, customer_history
+from .receipts import CONTENT_TYPES, invoice_branch_id, render_receipt
+from .reports import DIMENSIONS, sales_report
+from .serializers import GoldInvoiceSerializer, SilverInvoiceSerializer
+from .unified import INVOICE_FIELDS, INVOICE_ORDERING, invoice_querysets
+
+INVOICE_SERIALIZERS = {'gold': GoldInvoiceSerializer, 'silver': SilverInvoiceSerializer}
+
+
+# ============= REPORT ENDPOINTS =============
+
+@api_view(['GET'])
+@permission_classes([IsManagerOrAdmin])
+def sales_report_view(request, dimension):
+    """Daily gold and silver sales grouped by branch, seller, warehouse, vendor or carat"""
+    
+    if dimension not in DIMENSIONS:
+        return Response({'error': f"Unknown dimension, expected one of: {', '.join(DIMENSIONS)}"},
+                       status=status.HTTP_404_NOT_FOUND)
+    
+    try:
+        branch_id = int(request.GET['branch']) if request.GET.get('branch') else None
+        date_to = date.fromisoformat(request.GET['date_to']) if request.GET.get('date_to') else date.today()
+        date_from = (date.fromisoformat(request.GET['date_from']) if request.GET.get('date_from')
+                     else date_to - timedelta(days=30))
+    except ValueError:
+        return Response({'error': 'Dates must be formatted as YYYY-MM-DD and branch must be an id'},
+                       status=status.HTTP_400_BAD_REQUEST)
+    
+    if date_from > date_to:
+        return Response({'error': 'date_from must not be after date_to'},
+                       status=status.HTTP_400_BAD_REQUEST)
+    
+    # Non-admin users only see their own branch, nothing without one
+    scope_to_branch = request.user.role != 'Admin'
+    if scope_to_branch:
+        branch_id = request.user.branch_id
+    
+    # invoice_type=all includes returns
+    invoice_type = request.GET.get('invoice_type', 'Sale')
+    if invoice_type == 'all':
+        invoice_type = None
+    
+    report = sales_report(dimension, date_from, date_to, branch_id=branch_id, invoice_type=invoice_type,
+                          scope_to_branch=scope_to_branch)
+    
+    return Response({
+        'dimension': dimension,
+        'date_from': date_from,
+        'date_to': date_to,
+        'branch': branch_id,
+        'invoice_type': invoice_type or 'all',
+        'gold': report['gold'],
+        'silver': report['silver'],
+    })
+
+
+# ============= RECEIPT ENDPOINTS =============
+
+@api_view(['GET'])
+def invoice_receipt(request, metal, pk):
+    """Printable receipt of a gold or silver invoice, HTML or PDF (?output=pdf)"""
+    
+    output = request.GET.get('output', 'html')
+    if metal not in METALS:
+        raise Http404
+    if output not in CONTENT_TYPES:
+        return Response({'error': 'output must be html or pdf'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    branch_id = invoice_branch_id(metal, pk)
+    if branch_id is None:
+        raise Http404
+    
+    # Check permissions
+    if request.user.role != 'Admin' and branch_id != request.user.branch_id:
+        return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        document = render_receipt(metal, pk, output)
+    except ImproperlyConfigured as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+    
+    response = HttpResponse(document, content_type=CONTENT_TYPES[output])
+    if output == 'pdf':
+        response['Content-Disposition'] = f'inline; filename="receipt-{metal}-{pk}.pdf"'
+    return response
+
+
+# ============= CUSTOMER HISTORY ENDPOINTS =============
+
+@api_view(['GET'])
+@permission_classes([IsManagerWarehouseKeeperOrAdmin])
+def customer_purchase_history(request, pk):
+    """A customer's gold and silver invoices with their items, newest first, keyset-paged"""
+    
+    customer = get_object_or_404(Customer.objects.select_related('created_by'), pk=pk)
+    
+    # Check permissions
+    if request.user.role != 'Admin' and customer.created_by.branch_id != request.user.branch_id:
+        return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        cursor = (decode_cursor(request.GET['cursor'], size=len(HISTORY_ORDERING) + 2)
+                  if request.GET.get('cursor') else None)
+        limit = page_limit(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Non-admin users only see invoices of their own branch, none without one
+    scope_to_branch = request.user.role != 'Admin'
+    
+    invoices = customer_history(customer.pk, branch_id=request.user.branch_id if scope_to_branch else None,
+                                cursor=cursor, limit=limit, scope_to_branch=scope_to_branch)
+    results = [
+        {'metal': invoice.metal, **INVOICE_SERIALIZERS[invoice.metal](invoice).data} for invoice in invoices
+    ]
+    
+    next_cursor = None
+    if len(results) == limit:
+        last = results[-1]
+        next_cursor = encode_cursor([last['created_date'], last['metal'], last['id']])
+    return Response({
+        'customer': {'id': customer.pk, 'name': customer.name, 'phone': customer.phone},
+        'results': results,
+        'next_cursor': next_cursor,
+    })
+
+
+# ============= UNIFIED (GOLD + SILVER) ENDPOINTS =============
+
+@api_view(['GET'])
+def unified_invoice_list(request):
+    """Gold and silver invoices in one newest-first, keyset-paged stream"""
+    
+    try:
+        cursor = (decode_cursor(request.GET['cursor'], size=len(INVOICE_ORDERING) + 2)
+                  if request.GET.get('cursor') else None)
+        limit = page_limit(request)
+        branch_id = id_param(request, 'branch')
+        warehouse_id = id_param(request, 'warehouse')
+        customer_id = id_param(request, 'customer')
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Non-admin users only see their own branch, nothing without one
+    scope_to_branch = request.user.role != 'Admin'
+    if scope_to_branch:
+        branch_id = request.user.branch_id
+    
+    querysets = invoice_querysets(
+        branch_id=branch_id,
+        warehouse_id=warehouse_id,
+        customer_id=customer_id,
+        invoice_type=request.GET.get('invoice_type'),
+        scope_to_branch=scope_to_branch,
+    )
+    rows = metal_union(querysets, INVOICE_FIELDS, INVOICE_ORDERING, cursor=cursor,
+                       descending=True, limit=limit)
+    return stream_union(rows, INVOICE_ORDERING, limit)
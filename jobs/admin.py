@@ -0,0 +1,27 @@
+from django.contrib import admin
+from .models import Job, JobSchedule
+from core.pagination import EstimatedCountPaginator
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Background job admin"""
+    
+    list_display = ['id', 'name', 'status', 'progress', 'attempts', 'run_at', 'finished_at', 'created_by']
+    list_filter = ['status', 'name']
+    search_fields = ['name', 'id']
+    ordering = ['-id']
+    readonly_fields = ['attempts', 'progress', 'progress_message', 'result', 'error',
+                       'locked_by', 'locked_at', 'finished_at', 'created_date', 'updated_date']
+    list_select_related = ['created_by']
+    autocomplete_fields = ['created_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+@admin.register(JobSchedule)
+class JobScheduleAdmin(admin.ModelAdmin):
+    """Periodic job schedule admin"""
+    
+    list_display = ['name', 'task', 'interval_seconds', 'next_run_at', 'enabled', 'last_job']
+    list_filter = ['enabled']
+    search_fields = ['name', 'task']
+    readonly_fields = ['last_job', 'created_date', 'updated_date']
@@ -0,0 +1,79 @@
+import logging
+import signal
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.parallel import event, start_process
+from jobs.worker import enqueue_scheduled, job_options, requeue_stale, work
+
+logger = logging.getLogger(__name__)
+
+def _worker_main(stop):
+    # Children leave shutdown to the parent, which sets stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    work(stop)
+
+class Command(BaseCommand):
+    help = 'Run background job workers and the periodic job scheduler'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=2,
+            help='Number of worker processes (0 runs jobs in this process)'
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Run due jobs in this process and exit once the queue is empty'
+        )
+
+    def handle(self, *args, **options):
+        poll_interval = job_options()['POLL_INTERVAL']
+        
+        if options['burst'] or options['processes'] == 0:
+            stop = threading.Event()
+            while True:
+                requeue_stale()
+                enqueue_scheduled()
+                work(stop, burst=True)
+                if options['burst'] or stop.wait(poll_interval):
+                    return
+        
+        # The handler only flips a flag, setting the shared Event from a
+        # signal handler could deadlock on its internal lock
+        stopping = []
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stopping.append(True))
+        
+        stop = event()
+        workers = {}
+        self.stdout.write(self.style.SUCCESS(f'Starting {options["processes"]} job workers'))
+        
+        while not stopping:
+            # Start the missing workers, replacing any that died
+            for slot in range(options['processes']):
+                process = workers.get(slot)
+                if process is None or not process.is_alive():
+                    if process is not None:
+                        logger.warning('Job worker %s exited with %s, restarting', process.pid, process.exitcode)
+                    workers[slot] = start_process(_worker_main, stop, name=f'job-worker-{slot}')
+            
+            try:
+                requeue_stale()
+                enqueue_scheduled()
+            except Exception:
+                logger.exception('Job scheduler tick failed')
+            finally:
+                connection.close()
+            time.sleep(poll_interval)
+        
+        stop.set()
+        for process in workers.values():
+            process.join()
+        self.stdout.write(self.style.SUCCESS('Job workers stopped'))
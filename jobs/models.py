@@ -0,0 +1,65 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from core.managers import TimeStampedModel
+
+class Job(TimeStampedModel):
+    """Background job queued in the database and run by run_workers"""
+    
+    STATUS_CHOICES = [
+        ('Pending', 'Pending'),
+        ('Running', 'Running'),
+        ('Succeeded', 'Succeeded'),
+        ('Failed', 'Failed'),
+    ]
+    
+    name = models.CharField(max_length=255, db_index=True)
+    kwargs = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Pending')
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=3)
+    progress = models.IntegerField(default=0)
+    progress_message = models.CharField(max_length=255, blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey('authentication.User', on_delete=models.SET_NULL, null=True, blank=True)
+    
+    class Meta:
+        db_table = 'jobs'
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='jobs_status_run_at_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.name} #{self.id} ({self.status})"
+    
+    def set_progress(self, progress, message=''):
+        """Report progress (0-100) from inside a running task"""
+        self.progress = max(0, min(int(progress), 100))
+        self.progress_message = message[:255]
+        Job.objects.filter(pk=self.pk).update(
+            progress=self.progress, progress_message=self.progress_message, updated_date=timezone.now()
+        )
+
+class JobSchedule(TimeStampedModel):
+    """Periodic job, enqueued every interval_seconds by the worker pool"""
+    
+    name = models.CharField(max_length=255, unique=True)
+    task = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    interval_seconds = models.PositiveIntegerField()
+    next_run_at = models.DateTimeField(default=timezone.now)
+    enabled = models.BooleanField(default=True)
+    last_job = models.ForeignKey(Job, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    
+    class Meta:
+        db_table = 'job_schedules'
+    
+    def __str__(self):
+        return f"{self.name} (every {self.interval_seconds}s)"
+
@@ -0,0 +1,40 @@
+from collections import namedtuple
+
+from django.utils import timezone
+
+Task = namedtuple('Task', ['name', 'func', 'max_attempts', 'retry_delay'])
+
+# Registered tasks by name, filled by the @task decorator when the apps'
+# tasks modules are autodiscovered
+TASKS = {}
+
+
+def task(name=None, max_attempts=3, retry_delay=60):
+    """Register func as a background task
+
+    The function is called as func(job, **kwargs) inside a worker process
+    and may report progress with job.set_progress(). Its return value must be
+    JSON serializable. A failed attempt is retried after retry_delay seconds,
+    doubling each time, until max_attempts is reached.
+    """
+    def decorator(func):
+        task_name = name or f'{func.__module__}.{func.__name__}'
+        TASKS[task_name] = Task(task_name, func, max_attempts, retry_delay)
+        func.task_name = task_name
+        return func
+    return decorator
+
+
+def enqueue(name, created_by=None, run_at=None, **kwargs):
+    """Queue a registered task to run in the worker pool, returns the Job"""
+    from .models import Job
+
+    if name not in TASKS:
+        raise ValueError(f'Unknown task: {name}')
+    return Job.objects.create(
+        name=name,
+        kwargs=kwargs,
+        run_at=run_at or timezone.now(),
+        max_attempts=TASKS[name].max_attempts,
+        created_by=created_by,
+    )
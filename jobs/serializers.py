@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from .models import Job
+from .registry import TASKS
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """Job status serializer"""
+    
+    created_by_username = serializers.CharField(source='created_by.username', read_only=True)
+    
+    class Meta:
+        model = Job
+        fields = ['id', 'name', 'kwargs', 'status', 'run_at', 'attempts', 'max_attempts',
+                 'progress', 'progress_message', 'result', 'error', 'finished_at',
+                 'created_by', 'created_by_username', 'created_date', 'updated_date']
+        read_only_fields = [f for f in fields if f not in ('name', 'kwargs', 'run_at')]
+    
+    def validate_name(self, value):
+        if value not in TASKS:
+            raise serializers.ValidationError(f'Unknown task: {value}')
+        return value
+    
+    def create(self, validated_data):
+        validated_data['max_attempts'] = TASKS[validated_data['name']].max_attempts
+        return super().create(validated_data)
@@ -0,0 +1,18 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from .registry import task
+from .worker import job_options
+
+
+@task(name='jobs.call_command', max_attempts=1)
+def run_management_command(job, command, args=(), options=None):
+    """Run one of the management commands listed in JOBS['COMMANDS']"""
+    if command not in job_options().get('COMMANDS', ()):
+        raise PermissionError(f'Command not allowed as a job: {command}')
+    
+    job.set_progress(0, f'Running {command}')
+    output = StringIO()
+    call_command(command, *args, stdout=output, **(options or {}))
+    return {'output': output.getvalue()}
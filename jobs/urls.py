@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    # Job endpoints
+    path('', views.job_list_create, name='job_list_create'),
+    path('tasks/', views.task_list, name='task_list'),
+    path('<int:pk>/', views.job_detail, name='job_detail'),
+]
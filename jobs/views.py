@@ -0,0 +1,85 @@
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from django.shortcuts import get_object_or_404
+from django.core.paginator import Paginator
+
+from .models import Job
+from .registry import TASKS
+from .serializers import JobSerializer
+from authentication.permissions import IsAdminUser, IsManagerOrAdmin
+from core.writequeue import write
+
+
+# ============= JOB ENDPOINTS =============
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsManagerOrAdmin])
+def job_list_create(request):
+    """List background jobs or queue a new one (admins only)"""
+    
+    if request.method == 'GET':
+        # Non-admin users only see their own jobs
+        if request.user.role == 'Admin':
+            jobs = Job.objects.select_related('created_by')
+        else:
+            jobs = Job.objects.select_related('created_by').filter(created_by=request.user)
+        
+        job_status = request.GET.get('status', '')
+        if job_status:
+            jobs = jobs.filter(status=job_status)
+        name = request.GET.get('name', '')
+        if name:
+            jobs = jobs.filter(name=name)
+        
+        # Pagination
+        page = request.GET.get('page', 1)
+        page_size = request.GET.get('page_size', 10)
+        paginator = Paginator(jobs, page_size)
+        jobs_page = paginator.get_page(page)
+        
+        serializer = JobSerializer(jobs_page, many=True)
+        
+        return Response({
+            'results': serializer.data,
+            'count': paginator.count,
+            'page': int(page),
+            'page_size': int(page_size),
+            'total_pages': paginator.num_pages
+        })
+    
+    elif request.method == 'POST':
+        if request.user.role != 'Admin':
+            return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+        
+        serializer = JobSerializer(data=request.data)
+        if serializer.is_valid():
+            write(serializer.save, created_by=request.user)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+@api_view(['GET'])
+@permission_classes([IsManagerOrAdmin])
+def job_detail(request, pk):
+    """Retrieve a job's status, progress and result"""
+    
+    job = get_object_or_404(Job.objects.select_related('created_by'), pk=pk)
+    
+    # Check permissions
+    if request.user.role != 'Admin' and job.created_by_id != request.user.id:
+        return Response({'error': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = JobSerializer(job)
+    return Response(serializer.data)
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def task_list(request):
+    """List the registered task names"""
+    
+    return Response({
+        'results': [
+            {'name': name, 'max_attempts': task.max_attempts, 'retry_delay': task.retry_delay}
+            for name, task in sorted(TASKS.items())
+        ]
+    })
@@ -0,0 +1,152 @@
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job, JobSchedule
+from .registry import TASKS, enqueue
+
+logger = logging.getLogger(__name__)
+
+
+def job_options():
+    options = {'POLL_INTERVAL': 2, 'STALE_AFTER': 3600}
+    options.update(getattr(settings, 'JOBS', {}))
+    return options
+
+
+def worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _due_jobs(now):
+    return Job.objects.filter(status='Pending', run_at__lte=now).order_by('run_at', 'id')
+
+
+def claim(worker):
+    """Take the next due job for worker, None when the queue is empty
+
+    Uses SELECT ... FOR UPDATE SKIP LOCKED where the database supports it,
+    so concurrent workers never wait on each other. Elsewhere (SQLite) the
+    job is claimed with a compare-and-swap on its status.
+    """
+    now = timezone.now()
+    claimed = {'status': 'Running', 'locked_by': worker, 'locked_at': now, 'attempts': F('attempts') + 1}
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job_id = _due_jobs(now).select_for_update(skip_locked=True).values_list('id', flat=True).first()
+            if job_id is None:
+                return None
+            Job.objects.filter(pk=job_id).update(**claimed)
+    else:
+        while True:
+            job_id = _due_jobs(now).values_list('id', flat=True).first()
+            if job_id is None:
+                return None
+            if Job.objects.filter(pk=job_id, status='Pending').update(**claimed):
+                break
+            # Another worker won the race, try the next job
+
+    return Job.objects.get(pk=job_id)
+
+
+def run(job):
+    """Run a claimed job and record its outcome"""
+    registered = TASKS.get(job.name)
+    now = timezone.now
+    job.set_progress(0)
+    try:
+        if registered is None:
+            raise LookupError(f'Unknown task: {job.name}')
+        result = registered.func(job, **job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        logger.exception('Job %s (%s) failed on attempt %s', job.pk, job.name, job.attempts)
+        if registered is not None and job.attempts < job.max_attempts:
+            delay = registered.retry_delay * 2 ** (job.attempts - 1)
+            Job.objects.filter(pk=job.pk).update(
+                status='Pending', run_at=now() + timedelta(seconds=delay),
+                error=error, locked_by='', locked_at=None, updated_date=now()
+            )
+        else:
+            Job.objects.filter(pk=job.pk).update(
+                status='Failed', error=error, finished_at=now(), updated_date=now()
+            )
+        return False
+
+    Job.objects.filter(pk=job.pk).update(
+        status='Succeeded', result=result, progress=100, error='',
+        finished_at=now(), updated_date=now()
+    )
+    return True
+
+
+def requeue_stale():
+    """Put back running jobs that stopped reporting progress (dead worker)
+
+    A job that has used up its attempts is failed instead, so one that
+    kills its worker every time is not retried forever. Returns the number
+    of jobs requeued.
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=job_options()['STALE_AFTER'])
+    stale = Job.objects.filter(status='Running', updated_date__lt=stale_before)
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status='Failed', error='Worker stopped reporting progress, no attempts left',
+        locked_by='', locked_at=None, finished_at=now, updated_date=now
+    )
+    return stale.update(status='Pending', locked_by='', locked_at=None, updated_date=now)
+
+
+def enqueue_scheduled():
+    """Enqueue every due JobSchedule, returns the number of jobs queued
+
+    next_run_at is advanced with a compare-and-swap, so when several pools
+    run at once each due schedule is queued only once.
+    """
+    now = timezone.now()
+    queued = 0
+    for schedule in JobSchedule.objects.filter(enabled=True, next_run_at__lte=now):
+        if schedule.task not in TASKS:
+            logger.error('Job schedule %s refers to unknown task %s', schedule.name, schedule.task)
+            continue
+        next_run_at = now + timedelta(seconds=schedule.interval_seconds)
+        with transaction.atomic():
+            if not JobSchedule.objects.filter(pk=schedule.pk, next_run_at=schedule.next_run_at).update(
+                next_run_at=next_run_at, updated_date=now
+            ):
+                continue
+            job = enqueue(schedule.task, **schedule.kwargs)
+            JobSchedule.objects.filter(pk=schedule.pk).update(last_job=job)
+        queued += 1
+    return queued
+
+
+def work(stop, burst=False):
+    """Claim and run jobs until stop (a threading/multiprocessing Event) is set
+
+    With burst=True the loop returns as soon as the queue is empty.
+    """
+    worker = worker_id()
+    poll_interval = job_options()['POLL_INTERVAL']
+    while not stop.is_set():
+        try:
+            job = claim(worker)
+            if job is not None:
+                run(job)
+                continue
+        except Exception:
+            logger.exception('Job worker %s failed to claim a job', worker)
+        finally:
+            # Long-lived process, don't keep a connection open between jobs
+            connection.close_if_unusable_or_obsolete()
+        if burst:
+            return
+        stop.wait(poll_interval)
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from .models import WarehouseTransaction
+from core.pagination import EstimatedCountPaginator
 
 @admin.register(WarehouseTransaction)
 class WarehouseTransactionAdmin(admin.ModelAdmin):
@@ -11,6 +12,10 @@ class WarehouseTransactionAdmin(admin.ModelAdmin):
     search_fields = ['item_name', 'from_warehouse__code', 'to_warehouse__code']
     ordering = ['-created_date']
     readonly_fields = ['created_date', 'action_date']
+    list_select_related = ['from_warehouse__branch', 'to_warehouse__branch', 'created_by', 'action_by']
+    autocomplete_fields = ['from_warehouse', 'to_warehouse', 'created_by', 'action_by']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     def status_display(self, obj):
         color_map = {